@@ -1,13 +1,27 @@
-#Version 9/3/24 JDL
+#Version 10/18/26 JDL
+import os, re, datetime, zipfile, threading
+import xml.etree.ElementTree as ET
 import pandas as pd
 import numpy as np
+from openpyxl import load_workbook
+from openpyxl.workbook.workbook import Workbook
+from openpyxl.utils.cell import range_boundaries
 
-def dfExcelImport(sPF, sht=0, skiprows=None, IsDeleteBlankCols=False):
+#Default Excel reader backend ('openpyxl' or 'calamine'); Table.engine overrides
+EXCEL_ENGINE = 'openpyxl'
+
+def dfExcelImport(sPF, sht=0, skiprows=None, IsDeleteBlankCols=False, engine=None):
     """
     Import an Excel file optionally from specified sheet; delete extraneous columns
+    (sPF can be path+filename or an already-open pd.ExcelFile)
     Modified 12/5/23 to convert column names to strings in case they are integers
+    Modified 10/18/26 for engine argument (default EXCEL_ENGINE)
     """
-    df = pd.read_excel(sPF, sheet_name=sht, skiprows=skiprows)
+    if isinstance(sPF, pd.ExcelFile):
+        engine = None #ExcelFile already has its engine
+    elif engine is None:
+        engine = EXCEL_ENGINE
+    df = pd.read_excel(sPF, sheet_name=sht, skiprows=skiprows, engine=engine)
 
     #Delete Unnamed columns that result from Excel UsedRange bigger than detected data
     if IsDeleteBlankCols:
@@ -21,4 +35,496 @@ def Df_Roundup(df, n_decimals):
     JDL 2/20/23
     """
     df_scale = df * 10**n_decimals
-    return np.ceil(df_scale) * 10**(-n_decimals)
\ No newline at end of file
+    return np.ceil(df_scale) * 10**(-n_decimals)
+
+def OpenRawWorkbook(pf, engine=None, IsCachedValues=False):
+    """
+    Open a workbook for raw row reading with IterRawRows --read-only openpyxl
+    Workbook or python_calamine CalamineWorkbook (default EXCEL_ENGINE).
+    Formula cells: openpyxl returns the formula text (e.g. '=A2+1') unless
+    IsCachedValues (the value last calculated by Excel; None if the file was
+    saved by a writer that doesn't calculate, e.g. openpyxl or pandas).
+    Calamine can't read formula text and always returns cached values
+    JDL 10/18/26; Modified 10/18/26 for IsCachedValues argument
+    """
+    engine = EXCEL_ENGINE if engine is None else engine
+    if engine == 'openpyxl':
+        return load_workbook(filename=pf, read_only=True, data_only=IsCachedValues)
+    if engine == 'calamine':
+        from python_calamine import CalamineWorkbook
+        return CalamineWorkbook.from_path(pf)
+    raise ValueError(f"Excel engine {engine} not supported for raw import")
+
+def IterRawRows(wb, sht):
+    """
+    Yield sheet rows as tuples of values from a workbook opened with 
+    OpenRawWorkbook. Calamine rows are converted to match openpyxl's
+    read-only ws.values (None for blanks, int for whole numbers)
+    JDL 10/18/26
+    """
+    if isinstance(wb, Workbook):
+        yield from wb[sht].values
+        return
+
+    #Calamine omits formatted blank cells in openpyxl's sheet dimension
+    rows = wb.get_sheet_by_name(sht).to_python(skip_empty_area=False)
+    n_rows, n_cols = SheetDimension(wb.path, sht)
+    width = max([n_cols] + [len(row) for row in rows[:1]])
+    for row in rows:
+        yield tuple(CalamineToOpenpyxlValue(x) for x in row) + \
+            (None,) * (width - len(row))
+    for i in range(len(rows), n_rows): yield (None,) * width
+
+def SheetXmlPart(zf, sht):
+    """
+    Return name of sheet's XML part in an open xlsx zipfile.ZipFile
+    JDL 10/18/26
+    """
+    ns_main = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+    ns_rel = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+    ns_pkg = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+    root = ET.fromstring(zf.read('xl/workbook.xml'))
+    rid = [el.get(ns_rel + 'id') for el in root.iter(ns_main + 'sheet') \
+           if el.get('name') == sht][0]
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    target = [el.get('Target') for el in rels.iter(ns_pkg + 'Relationship') \
+              if el.get('Id') == rid][0]
+    return target.lstrip('/') if target.startswith('/') else 'xl/' + target
+
+def SheetDimension(pf, sht):
+    """
+    Return (max_row, max_col) from xlsx sheet's <dimension> tag (as used by
+    openpyxl read-only ws.values); (0, 0) if not found
+    JDL 10/18/26
+    """
+    if not zipfile.is_zipfile(pf): return 0, 0
+    with zipfile.ZipFile(pf) as zf:
+        with zf.open(SheetXmlPart(zf, sht)) as f: head = f.read(4096).decode(errors='ignore')
+    match = re.search(r'<(?:\w+:)?dimension ref="([A-Z]+\d+(?::[A-Z]+\d+)?)"', head)
+    if match is None: return 0, 0
+    min_col, min_row, max_col, max_row = range_boundaries(match.group(1))
+    return max_row, max_col
+
+def FileStat(pf):
+    """
+    Return (size, mtime_ns) of file pf
+    JDL 10/18/26
+    """
+    stat = os.stat(pf)
+    return stat.st_size, stat.st_mtime_ns
+
+def SheetCRC(pf, sht):
+    """
+    Return tuple of zip CRC-32s of xlsx sheet's XML part and the shared
+    strings and styles parts its values depend on (read from the zip directory
+    without decompressing). None if pf is not xlsx or sht is not found
+    JDL 10/18/26
+    """
+    if not zipfile.is_zipfile(pf): return None
+    with zipfile.ZipFile(pf) as zf:
+        try:
+            part = SheetXmlPart(zf, sht)
+        except (IndexError, KeyError):
+            return None
+        names = set(zf.namelist())
+        lst_parts = [part, 'xl/sharedStrings.xml', 'xl/styles.xml']
+        return tuple(zf.getinfo(p).CRC if p in names else None for p in lst_parts)
+
+def CalamineToOpenpyxlValue(x):
+    """
+    Convert a calamine cell value to the value openpyxl returns (openpyxl
+    reads whole numbers that Excel writes without exponent as int)
+    JDL 10/18/26
+    """
+    if isinstance(x, str): return None if x == '' else x
+    if type(x) is float and x.is_integer() and abs(x) < 1e15: return int(x)
+    if type(x) is datetime.date: return datetime.datetime.combine(x, datetime.time())
+    return x
+
+def CoerceStrValue(x):
+    """
+    Convert a value to str negating Pandas float inference for integers
+    (None for blank/NaN; '12' not '12.0' for integer-valued floats)
+    JDL 10/18/26
+    """
+    if pd.isna(x): return None
+    if isinstance(x, float) and x.is_integer(): return str(int(x))
+    return str(x)
+
+def dfCoerceStr(df, dtype=None):
+    """
+    Column-wise, vectorized equivalent of df.applymap(CoerceStrValue). 
+    Optionally convert the result to dtype (e.g. 'string[pyarrow]')
+    JDL 10/18/26
+    """
+    dCols = {i: ArrCoerceStr(df.iloc[:, i]) for i in range(df.shape[1])}
+    df_str = pd.DataFrame(dCols, index=df.index)
+    df_str.columns = df.columns
+    if dtype is not None: df_str = df_str.astype(dtype)
+    return df_str
+
+def ArrCoerceStr(ser):
+    """
+    Return object array of ser values converted with CoerceStrValue rules.
+    Uses masks by column dtype; falls back to elementwise for mixed types
+    JDL 10/18/26
+    """
+    vals = ser.to_numpy()
+    if vals.dtype.kind == 'f': return ArrFloatToStr(vals)
+    if vals.dtype.kind in 'iub': return vals.astype(str).astype(object)
+    if vals.dtype.kind != 'O':
+        vals = ser.astype(object).to_numpy() #e.g. datetime64 to Timestamps
+        return np.array([CoerceStrValue(x) for x in vals], dtype=object)
+
+    #Object column --vectorize common cases based on inferred type
+    mask_na = pd.isna(vals)
+    inferred = pd.api.types.infer_dtype(vals, skipna=True)
+    if inferred in ('string', 'empty'):
+        arr = vals.copy()
+        arr[mask_na] = None
+        return arr
+    if inferred == 'boolean' or (inferred == 'integer' and IsInt64Safe(vals[~mask_na])):
+        arr = np.full(len(vals), None, dtype=object)
+        arr[~mask_na] = vals[~mask_na].astype(str)
+        return arr
+    if inferred in ('floating', 'mixed-integer-float'):
+
+        #Ints stay exact in float64 only below 2**53
+        if IsInt64Safe(vals[~mask_na], limit=2**53):
+            return ArrFloatToStr(np.where(mask_na, np.nan, vals).astype(float))
+    return np.array([CoerceStrValue(x) for x in vals], dtype=object)
+
+def ArrFloatToStr(vals):
+    """
+    Return object array of str values for float array (None for NaN)
+    JDL 10/18/26
+    """
+    arr = np.full(len(vals), None, dtype=object)
+    mask_fin = np.isfinite(vals)
+    mask_int = mask_fin & (np.floor(vals) == vals)
+    mask_small = mask_int & (np.abs(vals) < 2**63)
+
+    arr[mask_small] = vals[mask_small].astype(np.int64).astype(str)
+    arr[mask_int & ~mask_small] = [str(int(x)) for x in vals[mask_int & ~mask_small]]
+
+    #Non-integer values and +/-inf (NumPy float repr matches Python str)
+    mask_other = ~mask_int & ~np.isnan(vals)
+    arr[mask_other] = vals[mask_other].astype(str)
+    return arr
+
+def dfToArrow(df):
+    """
+    Return df with pyarrow-backed (pd.ArrowDtype) columns. Columns of mixed
+    Python types (e.g. raw cells) and all-blank columns become Arrow strings
+    (values per CoerceStrValue). NaN/None become Arrow nulls; categorical
+    columns are kept
+    JDL 10/18/26
+    """
+    df = df.copy(deep=False)
+    for i in range(df.shape[1]):
+        ser = df.iloc[:, i]
+        if isinstance(ser.dtype, (pd.ArrowDtype, pd.CategoricalDtype)): continue
+        df.isetitem(i, SerToArrow(ser))
+    return df
+
+def SerToArrow(ser):
+    """
+    Return ser as pd.ArrowDtype Series (Arrow string if type is mixed or null)
+    JDL 10/18/26
+    """
+    import pyarrow as pa
+    try:
+        arr = pa.Array.from_pandas(ser)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        arr = pa.array(ArrCoerceStr(ser), type=pa.string())
+    if pa.types.is_null(arr.type): arr = arr.cast(pa.string())
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=ser.index, name=ser.name)
+
+def dfArrowStrToNumeric(df):
+    """
+    Return df with Arrow string columns converted to numbers where every
+    value converts and round trips exactly to its str (e.g. '10' but not
+    '007'). Recovers numbers from Arrow .df_raw columns that fell back to
+    Arrow strings (values written by ArrCoerceStr)
+    JDL 10/18/26
+    """
+    df = df.copy(deep=False)
+    for i in range(df.shape[1]):
+        ser = SerArrowStrToNumeric(df.iloc[:, i])
+        if ser is not None: df.isetitem(i, ser)
+    return df
+
+def SerArrowStrToNumeric(ser):
+    """
+    Return Arrow string ser as float64 or (if all whole numbers) nullable
+    Int64 Series; None if not Arrow string or any value doesn't convert exactly
+    JDL 10/18/26
+    """
+    import pyarrow as pa
+    if not isinstance(ser.dtype, pd.ArrowDtype): return None
+    if not pa.types.is_string(ser.dtype.pyarrow_dtype): return None
+
+    vals = ser.to_numpy(dtype=object, na_value=None)
+    mask = pd.notna(vals)
+    if not mask.any(): return None
+    ser_num = pd.to_numeric(pd.Series(vals, index=ser.index, name=ser.name), \
+                            errors='coerce').astype(float)
+    if ser_num[mask].isna().any(): return None
+    nums = ser_num[mask].to_numpy()
+    if not np.array_equal(ArrFloatToStr(nums), vals[mask]): return None
+    if np.all(np.isfinite(nums) & (nums == np.round(nums))) and IsInt64Safe(nums, 2**53):
+        return ser_num.astype('Int64')
+    return ser_num
+
+def dfInferObjects(df):
+    """
+    Return (df, dObjects) with object columns and index levels that hold only
+    ints, bools or non-blank floats (e.g. parsed row major table values)
+    converted to NumPy dtypes so Arrow/Parquet can store them typed. dObjects
+    lists converted column positions and index levels for dfRestoreObjects
+    JDL 10/18/26
+    """
+    dObjects = {'columns': [], 'index': []}
+    df = df.copy(deep=False)
+    for i in range(df.shape[1]):
+        ser = InferObjectValues(df.iloc[:, i])
+        if ser is None: continue
+        df.isetitem(i, ser)
+        dObjects['columns'].append(i)
+
+    lst_levels = [df.index.get_level_values(i) for i in range(df.index.nlevels)]
+    for i, idx in enumerate(lst_levels):
+        idx = InferObjectValues(idx)
+        if idx is None: continue
+        lst_levels[i] = idx
+        dObjects['index'].append(i)
+    if len(dObjects['index']) > 0: df.index = IndexFromLevels(lst_levels, df.index)
+    return df, dObjects
+
+def InferObjectValues(arr):
+    """
+    Return object Series or Index arr converted to int, bool or float dtype
+    (None if arr isn't object or conversion wouldn't round trip exactly)
+    JDL 10/18/26
+    """
+    if arr.dtype != object or len(arr) == 0: return None
+    arr_typed = arr.infer_objects()
+    kind = arr_typed.dtype.kind
+    if kind in 'iub' or (kind == 'f' and not arr.isna().any()): return arr_typed
+    return None
+
+def dfRestoreObjects(df, dObjects):
+    """
+    Return df with columns and index levels listed in dObjects (from
+    dfInferObjects) converted back to object dtype
+    JDL 10/18/26
+    """
+    if dObjects is None: return df
+    df = df.copy(deep=False)
+    for i in dObjects['columns']: df.isetitem(i, df.iloc[:, i].astype(object))
+    if len(dObjects['index']) > 0:
+        lst_levels = [df.index.get_level_values(i) for i in range(df.index.nlevels)]
+        for i in dObjects['index']: lst_levels[i] = lst_levels[i].astype(object)
+        df.index = IndexFromLevels(lst_levels, df.index)
+    return df
+
+def IndexFromLevels(lst_levels, idx_names):
+    """
+    Return Index (MultiIndex if multiple levels) from list of level values
+    named like idx_names index
+    JDL 10/18/26
+    """
+    if len(lst_levels) == 1: return pd.Index(lst_levels[0], name=idx_names.name)
+    return pd.MultiIndex.from_arrays(lst_levels, names=idx_names.names)
+
+#Type codes of cell values in mixed object columns stored as strings by
+#dfEncodeMixed (blank cells are code 0 with null string)
+dMixedTypeCodes = {str: 0, int: 1, float: 2, bool: 3, datetime.datetime: 4}
+dMixedDecoders = {1: int, 2: float, 3: lambda s: s == 'True', \
+                  4: datetime.datetime.fromisoformat}
+
+def dfEncodeMixed(df):
+    """
+    Return (df, lst_cols) with object columns of mixed str, int, float, bool
+    and datetime values (e.g. raw cells) as Arrow strings (ArrCoerceStr values)
+    plus an int8 type code column per converted column appended at right.
+    lst_cols lists converted column positions for dfDecodeMixed. Raises
+    TypeError for values of other types
+    JDL 10/18/26
+    """
+    import pyarrow as pa
+    df = df.copy(deep=False)
+    lst_cols, lst_codes = [], []
+    for i in range(df.shape[1]):
+        ser = df.iloc[:, i]
+        if ser.dtype != object: continue
+        if pd.api.types.infer_dtype(ser, skipna=True) in ('string', 'empty'): continue
+        lst_codes.append(ArrMixedTypeCodes(ser.to_numpy()))
+        arr = pa.array(ArrCoerceStr(ser), type=pa.string())
+        df.isetitem(i, pd.Series(pd.arrays.ArrowExtensionArray(arr), index=df.index))
+        lst_cols.append(i)
+    for i, codes in zip(lst_cols, lst_codes): df['__type_' + str(i)] = codes
+    return df, lst_cols
+
+def ArrMixedTypeCodes(vals):
+    """
+    Return int8 array of dMixedTypeCodes for object array values
+    JDL 10/18/26
+    """
+    codes = np.zeros(len(vals), dtype=np.int8)
+    for j, x in enumerate(vals):
+        if x is None or (type(x) is float and np.isnan(x)): continue
+        if type(x) not in dMixedTypeCodes:
+            raise TypeError('No mixed type code for ' + type(x).__name__)
+        codes[j] = dMixedTypeCodes[type(x)]
+    return codes
+
+def dfDecodeMixed(df, lst_cols):
+    """
+    Return df with dfEncodeMixed string columns lst_cols converted back to
+    object columns of the original values and type code columns removed
+    JDL 10/18/26
+    """
+    if not lst_cols: return df
+    n_cols = df.shape[1] - len(lst_cols)
+    df_codes, df = df.iloc[:, n_cols:], df.iloc[:, :n_cols].copy(deep=False)
+    for i, j in zip(lst_cols, range(len(lst_cols))):
+        vals = df.iloc[:, i].to_numpy(dtype=object, na_value=None)
+        codes = df_codes.iloc[:, j].to_numpy()
+        for code, fn_decode in dMixedDecoders.items():
+            mask = codes == code
+            if mask.any(): vals[mask] = [fn_decode(s) for s in vals[mask]]
+        df.isetitem(i, pd.Series(vals, index=df.index, dtype=object))
+    return df
+
+def IsInt64Safe(vals, limit=2**63):
+    """
+    Return True if numeric object array values are all within +/- limit
+    JDL 10/18/26
+    """
+    if len(vals) == 0: return True
+    try:
+        return bool(np.all(np.abs(vals.astype(float)) < limit))
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+def WriteAtomic(pf, write_fn):
+    """
+    Call write_fn(pf_temp) to write a temporary file in pf's folder and then
+    rename it to pf so readers never see a partially written file (temporary
+    name keeps pf's extension for writers that check it)
+    JDL 10/18/26
+    """
+    root, ext = os.path.splitext(pf)
+    pf_temp = f'{root}.tmp{os.getpid()}_{threading.get_ident()}{ext}'
+    try:
+        write_fn(pf_temp)
+        os.replace(pf_temp, pf)
+    finally:
+        if os.path.exists(pf_temp): os.remove(pf_temp)
+
+def SerOptimizeDtype(ser, IsNumeric=False, IsNullable=True, category_threshold=0.5):
+    """
+    Return ser with compact dtype. IsNumeric converts object values to numbers
+    (unchanged if any value is non-numeric). Integer-valued numbers become the
+    smallest int (nullable Int if IsNullable or blanks); floats become float32
+    only if exact. Object columns with unique/non-blank count at or below
+    category_threshold become categorical
+    JDL 10/18/26
+    """
+    n_nonnull = ser.count()
+    if n_nonnull == 0: return ser
+
+    if IsNumeric and ser.dtype == object:
+        try:
+            ser = pd.to_numeric(ser)
+        except (ValueError, TypeError):
+            pass
+
+    if ser.dtype == object:
+        if ser.nunique() / n_nonnull <= category_threshold:
+            return ser.astype('category')
+        return ser
+
+    if not pd.api.types.is_numeric_dtype(ser) or pd.api.types.is_bool_dtype(ser):
+        return ser
+
+    #Integer-valued numbers (including int64 and nullable Int) to smallest int
+    vals = ser.dropna().to_numpy(dtype=float)
+    if np.all(np.isfinite(vals)) and np.all(np.floor(vals) == vals) and \
+       IsInt64Safe(vals, limit=2**53):
+        IsNullable = IsNullable or n_nonnull < len(ser)
+        return ser.astype(IntDtypeForRange(vals.min(), vals.max(), IsNullable))
+
+    #Non-integer floats to float32 only if values round trip exactly
+    if ser.dtype == np.float64:
+        arr = ser.to_numpy()
+        arr32 = arr.astype(np.float32)
+        if np.array_equal(arr32.astype(np.float64), arr, equal_nan=True):
+            return pd.Series(arr32, index=ser.index, name=ser.name)
+    return ser
+
+def IntDtypeForRange(vmin, vmax, IsNullable=False):
+    """
+    Return smallest signed int dtype name ('int8'...'int64' or nullable
+    'Int8'...'Int64') whose range includes vmin and vmax
+    JDL 10/18/26
+    """
+    for dtype in ['int8', 'int16', 'int32', 'int64']:
+        info = np.iinfo(dtype)
+        if info.min <= vmin and vmax <= info.max: break
+    return dtype.capitalize() if IsNullable else dtype
+
+#Output file extensions by ProjectTables.ExportOutputs format
+dOutputExts = {'parquet': '.parquet', 'feather': '.feather', 'csv.gz': '.csv.gz', \
+               'xlsx': '.xlsx'}
+
+def WriteDf(df, pf, fmt='parquet'):
+    """
+    Atomically write df to pf as 'parquet', 'feather', 'csv.gz' or 'xlsx'.
+    Column labels are written as str; Feather (no index support) and CSV
+    write a named or non-default index as columns
+    JDL 10/18/26
+    """
+    if fmt not in dOutputExts: raise ValueError(f"Output format {fmt} not supported")
+    if not all(isinstance(c, str) for c in df.columns):
+        df = df.copy(deep=False)
+        df.columns = [str(c) for c in df.columns]
+    IsIndex = df.index.name is not None or not df.index.equals(pd.RangeIndex(len(df)))
+
+    if fmt == 'parquet':
+        write_fn = lambda pf_temp: df.to_parquet(pf_temp)
+    elif fmt == 'feather':
+        df_write = df.reset_index() if IsIndex else df.reset_index(drop=True)
+        write_fn = lambda pf_temp: df_write.to_feather(pf_temp)
+    elif fmt == 'csv.gz':
+        write_fn = lambda pf_temp: df.to_csv(pf_temp, index=IsIndex, compression='gzip')
+    else:
+        write_fn = lambda pf_temp: df.to_excel(pf_temp, index=IsIndex, \
+                                               engine=ExcelWriterEngine())
+    WriteAtomic(pf, write_fn)
+
+def WriteExcelSheets(dDfs, pf):
+    """
+    Atomically write dict of DataFrames to one workbook (sheet per key)
+    JDL 10/18/26
+    """
+    def write_fn(pf_temp):
+        with pd.ExcelWriter(pf_temp, engine=ExcelWriterEngine()) as writer:
+            for sht, df in dDfs.items():
+                IsIndex = df.index.name is not None or \
+                    not df.index.equals(pd.RangeIndex(len(df)))
+                df.to_excel(writer, sheet_name=str(sht)[:31], index=IsIndex)
+    WriteAtomic(pf, write_fn)
+
+def ExcelWriterEngine():
+    """
+    Return 'xlsxwriter' (faster writer) if installed, else 'openpyxl'
+    JDL 10/18/26
+    """
+    try:
+        import xlsxwriter
+        return 'xlsxwriter'
+    except ImportError:
+        return 'openpyxl'
@@ -0,0 +1,262 @@
+#Version 10/18/26 JDL
+import os, sys, json, hashlib
+import pandas as pd
+
+path_libs = os.getcwd() + os.sep + 'libs' + os.sep
+if not path_libs in sys.path: sys.path.append(path_libs)
+import pd_util
+
+"""
+================================================================================
+TableCache Class -- persistent on-disk cache of imported and parsed Table
+DataFrames. Assign an instance to tbl.cache (or tbls.SetCache()) so that
+Table.ImportExcelDf, .ImportExcelRaw and RowMajorTbl.ReadBlocksProcedure skip
+Excel when the source file and import instructions are unchanged
+
+JDL 10/18/26
+================================================================================
+"""
+class TableCache():
+    """
+    Cache entries are Parquet files plus a small JSON manifest. Object columns
+    of e.g. ints are stored typed and mixed-type columns (e.g. raw cells) as
+    strings with type codes, both restored on load. Pickle is the fallback
+    only for DataFrames Parquet can't hold (e.g. cells of other types or
+    non-JSON column labels); those entries record their 'pickle_reason' in
+    the manifest and in .lst_pickled.
+    Key covers the file's path, size and mtime (optionally a content hash),
+    sheet, dParseParams, import_col_map, import_dtype, engine, IsCachedValues,
+    storage and kind of entry ('df', 'raw' or 'parsed'). max_bytes sets size
+    for LRU eviction
+    JDL 10/18/26
+    """
+    def __init__(self, path_cache, max_bytes=None, IsHashContent=False):
+        self.path_cache = os.path.join(path_cache, '')
+        self.max_bytes = max_bytes
+        self.IsHashContent = IsHashContent #Key on file contents not mtime
+        self.lst_pickled = [] #(table name, kind, reason) of pickle fallbacks
+        os.makedirs(self.path_cache, exist_ok=True)
+
+    def Key(self, tbl, kind):
+        """
+        Return cache key (hex digest) for tbl's current source and import
+        instructions
+        JDL 10/18/26
+        """
+        dKey = {'pf': os.path.abspath(tbl.pf), 'sht': tbl.sht, 'kind': kind, \
+                'dParseParams': NormalizeParseParams(tbl.dParseParams), \
+                'import_col_map': tbl.import_col_map, \
+                'import_dtype': repr(tbl.import_dtype), \
+                'engine': tbl.engine or pd_util.EXCEL_ENGINE, \
+                'IsCachedValues': tbl.IsCachedValues, 'storage': tbl.storage}
+        if self.IsHashContent:
+            dKey['sha256'] = HashFileContents(tbl.pf)
+        else:
+            stat = os.stat(tbl.pf)
+            dKey['size'], dKey['mtime_ns'] = stat.st_size, stat.st_mtime_ns
+        s_key = json.dumps(dKey, sort_keys=True, default=repr)
+        return hashlib.sha256(s_key.encode()).hexdigest()
+
+    def Entry(self, tbl, kind):
+        """
+        Return (manifest dict, data path+file) of tbl's current entry or
+        (None, None) if there is none
+        JDL 10/18/26
+        """
+        key = self.Key(tbl, kind)
+        pf_manifest = self.path_cache + key + '.json'
+        if not os.path.exists(pf_manifest): return None, None
+        with open(pf_manifest) as f: dManifest = json.load(f)
+
+        pf_data = self.path_cache + key + '.' + dManifest['fmt']
+        if not os.path.exists(pf_data): return None, None
+        return dManifest, pf_data
+
+    def IsCurrent(self, tbl, kind):
+        """
+        True if tbl has a current entry of kind
+        JDL 10/18/26
+        """
+        return self.Entry(tbl, kind)[0] is not None
+
+    def Load(self, tbl, kind):
+        """
+        Return cached DataFrame for tbl or None if there is no current entry
+        JDL 10/18/26
+        """
+        dManifest, pf_data = self.Entry(tbl, kind)
+        if dManifest is None: return None
+        if dManifest['fmt'] == 'parquet':
+            dKwargs = {'dtype_backend': 'pyarrow'} if tbl.storage == 'arrow' else {}
+            df = pd.read_parquet(pf_data, **dKwargs)
+            df = self.RestoreParquetDf(df, dManifest)
+        else:
+            df = pd.read_pickle(pf_data)
+
+        #Mark entry as recently used for LRU eviction
+        os.utime(pf_data)
+        return df
+
+    def IterChunks(self, tbl, kind, chunk_rows=100000):
+        """
+        Yield tbl's current entry as DataFrame chunks of up to chunk_rows rows.
+        Parquet entries are read by row batches (never whole); pickle entries
+        (see .Save()) are loaded and sliced
+        JDL 10/18/26
+        """
+        dManifest, pf_data = self.Entry(tbl, kind)
+        if dManifest is None: return
+        if dManifest['fmt'] == 'pkl':
+            df = pd.read_pickle(pf_data)
+            for i in range(0, len(df), chunk_rows): yield df.iloc[i:i + chunk_rows]
+            return
+
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(pf_data).iter_batches(batch_size=chunk_rows):
+            yield self.RestoreParquetDf(batch.to_pandas(), dManifest)
+
+    def RestoreParquetDf(self, df, dManifest):
+        """
+        Return DataFrame read from an entry's Parquet file with its mixed-type
+        and object columns and column labels restored
+        JDL 10/18/26
+        """
+        df = pd_util.dfDecodeMixed(df, dManifest.get('mixed'))
+        df.columns = dManifest['columns']
+        return pd_util.dfRestoreObjects(df, dManifest.get('objects'))
+
+    def Save(self, tbl, kind, df):
+        """
+        Write df as tbl's cache entry (Parquet if possible, else pickle) then
+        evict least recently used entries if over max_bytes
+        JDL 10/18/26; Modified 10/18/26 to store mixed-type columns in Parquet
+        and record pickle fallbacks
+        """
+        key = self.Key(tbl, kind)
+        dManifest = {'name': tbl.name, 'pf': os.path.abspath(tbl.pf), \
+                     'sht': tbl.sht, 'kind': kind, 'fmt': 'parquet'}
+        try:
+            dManifest['columns'] = json.loads(json.dumps(list(df.columns)))
+            if dManifest['columns'] != list(df.columns):
+                raise ValueError('Column labels not JSON round trip')
+
+            #Store e.g. object columns of ints typed (restored on Load)
+            df_write, dManifest['objects'] = pd_util.dfInferObjects(df)
+
+            #Mixed-type (e.g. raw cell) columns as strings plus type codes
+            df_write, dManifest['mixed'] = pd_util.dfEncodeMixed(df_write)
+            if not IsParquetExact(df_write):
+                raise TypeError('Index holds values Parquet would convert')
+            df_write.columns = [str(c) for c in df_write.columns]
+            pd_util.WriteAtomic(self.path_cache + key + '.parquet', \
+                                lambda pf: df_write.to_parquet(pf))
+
+        #No Parquet engine or values Parquet can't hold (pyarrow's errors
+        #subclass ValueError/TypeError)
+        except (ImportError, ValueError, TypeError) as e:
+            dManifest['fmt'], dManifest['columns'] = 'pkl', None
+            dManifest['objects'], dManifest['mixed'] = None, None
+            dManifest['pickle_reason'] = repr(e)
+            self.lst_pickled.append((tbl.name, kind, repr(e)))
+            pd_util.WriteAtomic(self.path_cache + key + '.pkl', \
+                                lambda pf: df.to_pickle(pf))
+
+        pd_util.WriteAtomic(self.path_cache + key + '.json', \
+                            lambda pf: WriteJSON(pf, dManifest))
+        self.Evict(keep=key)
+
+    def Evict(self, keep=None):
+        """
+        Delete least recently used entries until cache is within max_bytes
+        (entry keep is never evicted)
+        JDL 10/18/26
+        """
+        if self.max_bytes is None: return
+        lst_entries = self.ListEntries()
+        n_bytes = sum(entry[2] for entry in lst_entries)
+        for key, mtime, size in sorted(lst_entries, key=lambda x: x[1]):
+            if n_bytes <= self.max_bytes: break
+            if key == keep: continue
+            self.DeleteEntry(key)
+            n_bytes -= size
+
+    def Invalidate(self, tbl=None):
+        """
+        Delete all cache entries for tbl's file and sheet (all entries if tbl
+        is None)
+        JDL 10/18/26
+        """
+        for key, mtime, size in self.ListEntries():
+            if tbl is not None:
+                with open(self.path_cache + key + '.json') as f:
+                    dManifest = json.load(f)
+                if (dManifest['pf'], dManifest['sht']) != \
+                   (os.path.abspath(tbl.pf), tbl.sht): continue
+            self.DeleteEntry(key)
+
+    def ListEntries(self):
+        """
+        Return list of (key, last used time, bytes) tuples for cache entries
+        JDL 10/18/26
+        """
+        lst_entries = []
+        for f in os.listdir(self.path_cache):
+            key, ext = os.path.splitext(f)
+            if ext not in ('.parquet', '.pkl'): continue
+            if not os.path.exists(self.path_cache + key + '.json'): continue
+            stat = os.stat(self.path_cache + f)
+            lst_entries.append((key, stat.st_mtime, stat.st_size))
+        return lst_entries
+
+    def DeleteEntry(self, key):
+        """
+        Delete an entry's data and manifest files
+        JDL 10/18/26
+        """
+        for ext in ('.parquet', '.pkl', '.json'):
+            if os.path.exists(self.path_cache + key + ext):
+                os.remove(self.path_cache + key + ext)
+
+def NormalizeParseParams(dParseParams):
+    """
+    Return copy of dParseParams with one-tuple block_id_vars as a list
+    (RowMajorBlockID converts it in place) so keys match before/after parse
+    JDL 10/18/26
+    """
+    if dParseParams is None: return None
+    dParams = dict(dParseParams)
+    if isinstance(dParams.get('block_id_vars'), tuple):
+        dParams['block_id_vars'] = [dParams['block_id_vars']]
+    return dParams
+
+def IsParquetExact(df):
+    """
+    Return True if Parquet round trip preserves df's dtypes --object columns
+    and index levels must hold only str values (Parquet would convert e.g.
+    an object column of ints to int64)
+    JDL 10/18/26
+    """
+    lst_arrays = [df.iloc[:, i] for i in range(df.shape[1])]
+    lst_arrays += [df.index.get_level_values(i) for i in range(df.index.nlevels)]
+    for arr in lst_arrays:
+        if arr.dtype != object: continue
+        if pd.api.types.infer_dtype(arr, skipna=True) not in ('string', 'empty'):
+            return False
+    return True
+
+def HashFileContents(pf, chunk_size=2**20):
+    """
+    Return sha256 hex digest of a file's contents
+    JDL 10/18/26
+    """
+    h = hashlib.sha256()
+    with open(pf, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''): h.update(chunk)
+    return h.hexdigest()
+
+def WriteJSON(pf, d):
+    """
+    Write dict to JSON file
+    JDL 10/18/26
+    """
+    with open(pf, 'w') as f: json.dump(d, f)
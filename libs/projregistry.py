@@ -0,0 +1,150 @@
+#Version 10/18/26 JDL
+import os, sys, json
+
+path_libs = os.getcwd() + os.sep + 'libs' + os.sep
+if not path_libs in sys.path: sys.path.append(path_libs)
+from projtables import Table
+
+"""
+================================================================================
+TableRegistry Class -- declarative spec of a project's tables so that
+ProjectTables can build its Table instances, parsing instructions, column
+lists and import lists from a JSON, TOML or YAML file instead of code
+
+JDL 10/18/26
+================================================================================
+"""
+#Table spec keys that set Table attributes of the same name
+lst_attr_keys = ['dParseParams', 'import_col_map', 'required_cols', 'numeric_cols', \
+                 'populated_cols', 'nonblank_cols', 'category_threshold']
+
+#All valid table spec keys
+lst_table_keys = ['file', 'sht', 'idx_col_name', 'import', 'import_dtype', 'engine', \
+                  'upstream', 'eager'] + lst_attr_keys
+
+class TableRegistry():
+    """
+    Spec is a dict (or path+file of .json, .toml or .yaml/.yml file read on
+    first use) with a 'tables' dict keyed by table name. Each table's spec has
+    'file' (relative to files.path_data), 'sht', 'idx_col_name' and optional:
+    * 'import' -- 'df' (lstImports), 'raw' (lstRawImports) or 'output'
+    * 'import_dtype' ('str' for str), 'engine', 'eager' (lstEagerImports)
+    * 'upstream' -- list of names of tables the table is derived from
+    * dParseParams, import_col_map and column lists as Table attributes
+    JDL 10/18/26
+    """
+    def __init__(self, spec):
+        self.pf_spec = spec if isinstance(spec, str) else None
+        self._dSpec = None if isinstance(spec, str) else spec
+        if self._dSpec is not None: self.ValidateSpec()
+
+    @property
+    def dSpec(self):
+        """
+        Spec dict (read and validated from .pf_spec on first access)
+        JDL 10/18/26
+        """
+        if self._dSpec is None:
+            self._dSpec = ReadSpecFile(self.pf_spec)
+            self.ValidateSpec()
+        return self._dSpec
+
+    @property
+    def dTables(self):
+        """
+        Dict of table specs keyed by table name
+        JDL 10/18/26
+        """
+        return self.dSpec.get('tables', {})
+    """
+    ================================================================================
+    """
+    def ValidateSpec(self):
+        """
+        Raise ValueError for unknown table keys or upstream names
+        JDL 10/18/26
+        """
+        for name, dTbl in self.dTables.items():
+            lst_unknown = [key for key in dTbl if key not in lst_table_keys]
+            if len(lst_unknown) > 0:
+                raise ValueError(f"Unknown keys {lst_unknown} in table spec", name)
+            lst_missing = [up for up in dTbl.get('upstream', []) if up not in self.dTables]
+            if len(lst_missing) > 0:
+                raise ValueError(f"Upstream tables {lst_missing} not in spec", name)
+
+    def ListTableNames(self, lst_names=None):
+        """
+        Return list of lst_names (default all tables) plus their upstream
+        tables with each table after its upstream tables
+        JDL 10/18/26
+        """
+        if lst_names is None: lst_names = list(self.dTables.keys())
+        lst_ordered = []
+        for name in lst_names: self.AddWithUpstream(name, lst_ordered, [])
+        return lst_ordered
+
+    def AddWithUpstream(self, name, lst_ordered, lst_path):
+        """
+        Append name's upstream tables then name to lst_ordered (depth first);
+        lst_path is the current chain used to detect cycles
+        JDL 10/18/26
+        """
+        if name in lst_ordered: return
+        if name not in self.dTables: raise KeyError(f"Table {name} not in spec")
+        if name in lst_path:
+            raise ValueError(f"Circular upstream tables {lst_path + [name]}")
+        for name_up in self.dTables[name].get('upstream', []):
+            self.AddWithUpstream(name_up, lst_ordered, lst_path + [name])
+        lst_ordered.append(name)
+
+    def BuildTable(self, name, path_data=''):
+        """
+        Return Table instance from a table's spec (file relative to path_data)
+        JDL 10/18/26
+        """
+        dTbl = self.dTables[name]
+        pf = os.path.join(path_data, dTbl['file']) if 'file' in dTbl else ''
+        import_dtype = dTbl.get('import_dtype')
+        if import_dtype == 'str': import_dtype = str
+
+        tbl = Table(pf, name, dTbl.get('sht'), dTbl.get('idx_col_name'), \
+                    engine=dTbl.get('engine'), import_dtype=import_dtype)
+        for key in lst_attr_keys:
+            if key in dTbl: setattr(tbl, key, CopySpecValue(dTbl[key]))
+        if tbl.dParseParams is not None and 'block_id_vars' in tbl.dParseParams:
+            tbl.dParseParams['block_id_vars'] = \
+                BlockIDVarsFromSpec(tbl.dParseParams['block_id_vars'])
+        return tbl
+
+def ReadSpecFile(pf_spec):
+    """
+    Read spec dict from .json, .toml or .yaml/.yml file (YAML requires PyYAML)
+    JDL 10/18/26
+    """
+    ext = os.path.splitext(pf_spec)[1].lower()
+    if ext == '.json':
+        with open(pf_spec) as f: return json.load(f)
+    if ext == '.toml':
+        import tomllib
+        with open(pf_spec, 'rb') as f: return tomllib.load(f)
+    if ext in ('.yaml', '.yml'):
+        import yaml
+        with open(pf_spec) as f: return yaml.safe_load(f)
+    raise ValueError(f"Spec file type {ext} not supported", pf_spec)
+
+def CopySpecValue(val):
+    """
+    Return copy of a spec dict/list value so tables don't share spec objects
+    JDL 10/18/26
+    """
+    return json.loads(json.dumps(val))
+
+def BlockIDVarsFromSpec(block_id_vars):
+    """
+    Return list of block_id tuples from spec list (one [name, row_offset,
+    col_index] list or list of them)
+    JDL 10/18/26
+    """
+    if len(block_id_vars) > 0 and isinstance(block_id_vars[0], str):
+        block_id_vars = [block_id_vars]
+    return [tuple(var) for var in block_id_vars]
@@ -0,0 +1,236 @@
+#Version 10/18/26 JDL
+import os, sys, time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, \
+    FIRST_COMPLETED
+import pandas as pd
+
+path_libs = os.getcwd() + os.sep + 'libs' + os.sep
+if not path_libs in sys.path: sys.path.append(path_libs)
+from projtables import WorkbookSession, ImportTablesFromFile, ImportParseTablesFromFile, \
+    ImportSpec, TableFromImportSpec
+
+"""
+================================================================================
+TableScheduler Class -- runs a ProjectTables instance's tables as a dependency
+graph (import -> RowMajorTbl parse -> derived tables -> outputs) with each
+table's node starting as soon as its tbl.upstream tables' nodes finish
+
+JDL 10/18/26
+================================================================================
+"""
+class TableScheduler():
+    """
+    Each table in tbls (and its upstream tables) is a node that:
+    * imports .df (tbls.lstImports) or imports .df_raw and parses it if
+      tbl.dParseParams has flag_start_bound (tbls.lstRawImports)
+    * then calls tbl.build_fn(tbl) if set
+    * then writes tbls.lstOutputs tables' .df to path_out (if set) in fmt
+    Nodes run in a thread pool of workers (default 1); ready import nodes
+    that share a source file run together with one open workbook. If
+    IsProcess and workers > 1, imports run in a process pool (sent each
+    table's ImportSpec) while build_fn and output steps stay on threads.
+    Import nodes whose source is unchanged since import and build nodes whose
+    upstream nodes did not run (unless tbl.IsStale or never built) are skipped
+    JDL 10/18/26; Modified 10/18/26 for process pool imports and outputs
+    """
+    def __init__(self, tbls, workers=None, IsProcess=True, path_out=None, \
+                 fmt='parquet'):
+        self.tbls = tbls
+        self.workers = workers
+        self.IsProcess = IsProcess
+        self.path_out, self.fmt = path_out, fmt
+        self.set_built = set() #Names of tables built by any Run()
+        self.set_exported = set() #Names of output tables written by any Run()
+
+        #Log of last Run() (one row per node in completion order) and output
+        #path+files written by last Run() by table name
+        self.lst_log = []
+        self.dOutputs = {}
+        self.executor_import = None #ProcessPoolExecutor during Run()
+
+    @property
+    def df_log(self):
+        """
+        DataFrame of last Run()'s node results (table, status, seconds)
+        JDL 10/18/26
+        """
+        return pd.DataFrame(self.lst_log, columns=['table', 'status', 'seconds'])
+    """
+    ================================================================================
+    """
+    def Run(self):
+        """
+        Run all nodes in dependency order. Ready import nodes that share a
+        source file run as one group (see .ListReadyGroups()). Returns dict
+        of node status ('ran' or 'skipped') by table name (written outputs
+        are in .dOutputs). An exception in a node cancels nodes that have not
+        started and is raised
+        JDL 10/18/26; Modified 10/18/26 to run import nodes grouped by file
+        """
+        lst_pending = self.ListNodes()
+        dIsRan, dFutures = {}, {}
+        self.lst_log, self.dOutputs = [], {}
+
+        #Build and output steps run on threads; imports optionally in processes
+        executor = ThreadPoolExecutor(max_workers=self.workers or 1)
+        if self.IsProcess and self.workers is not None and self.workers > 1:
+            self.executor_import = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            while len(lst_pending) > 0 or len(dFutures) > 0:
+                for lst_group, IsImport in self.ListReadyGroups(lst_pending, dIsRan):
+                    for tbl in lst_group: lst_pending.remove(tbl)
+                    lst_IsUpstreamRan = [any(dIsRan[id(tbl_up)] for tbl_up \
+                                             in tbl.upstream) for tbl in lst_group]
+                    dFutures[executor.submit(self.RunNodes, lst_group, \
+                                             lst_IsUpstreamRan, IsImport)] = lst_group
+                if len(dFutures) == 0:
+                    raise ValueError("Circular upstream tables", \
+                                     [tbl.name for tbl in lst_pending])
+
+                done, not_done = wait(dFutures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    lst_group = dFutures.pop(future)
+                    for tbl, IsRan in zip(lst_group, future.result()):
+                        dIsRan[id(tbl)] = IsRan
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if self.executor_import is not None:
+                self.executor_import.shutdown(wait=True, cancel_futures=True)
+                self.executor_import = None
+        return {dLog['table']: dLog['status'] for dLog in self.lst_log}
+
+    def ListNodes(self):
+        """
+        Return list of tbls' tables plus any upstream tables not in tbls
+        JDL 10/18/26
+        """
+        lst_nodes = self.tbls.ListTables()
+        for tbl in lst_nodes:
+            for tbl_up in tbl.upstream:
+                if tbl_up not in lst_nodes: lst_nodes.append(tbl_up)
+        return lst_nodes
+
+    def ListReady(self, lst_pending, dIsRan):
+        """
+        Return pending tables whose upstream nodes are all finished
+        JDL 10/18/26
+        """
+        return [tbl for tbl in lst_pending \
+                if all(id(tbl_up) in dIsRan for tbl_up in tbl.upstream)]
+
+    def ListReadyGroups(self, lst_pending, dIsRan):
+        """
+        Return list of (list of tables, IsImport) units of work for ready
+        nodes: ready tables needing import grouped by tbl.pf (so each file is
+        opened once) and other ready tables individually
+        JDL 10/18/26
+        """
+        lst_ready = self.ListReady(lst_pending, dIsRan)
+        lst_imports = [tbl for tbl in lst_ready if self.IsImportNeeded(tbl)]
+        lst_groups = [(lst_group, True) for lst_group in \
+                      self.tbls.GroupTablesByFile(lst_imports).values()]
+        lst_builds = [tbl for tbl in lst_ready if tbl not in lst_imports]
+        return lst_groups + [([tbl], False) for tbl in lst_builds]
+
+    def RunNodes(self, lst_tbls, lst_IsUpstreamRan, IsImport=False):
+        """
+        Import a group of tables that share a source file (if IsImport) and
+        then build each table. Returns list of whether each table's node ran
+        JDL 10/18/26
+        """
+        t_start = time.perf_counter()
+        if IsImport: self.ImportNodes(lst_tbls)
+        return [self.RunNode(tbl, IsUpstreamRan, IsImport, t_start) \
+                for tbl, IsUpstreamRan in zip(lst_tbls, lst_IsUpstreamRan)]
+
+    def RunNode(self, tbl, IsUpstreamRan=False, IsImported=False, t_start=None):
+        """
+        Build a table (after IsImported import by .ImportNodes()) if needed and
+        then write it if it is an output (.ExportNode()). Returns True if it ran
+        JDL 10/18/26; Modified 10/18/26 for import by group and outputs
+        """
+        if t_start is None: t_start = time.perf_counter()
+        IsRan = IsImported
+        if tbl.build_fn is not None and (IsRan or IsUpstreamRan or tbl.IsStale or \
+                                         tbl.name not in self.set_built):
+            tbl.build_fn(tbl)
+            tbl.IsStale = False
+            self.set_built.add(tbl.name)
+            IsRan = True
+        if self.IsExportNeeded(tbl, IsRan): self.ExportNode(tbl)
+
+        status = 'ran' if IsRan else 'skipped'
+        self.lst_log.append({'table': tbl.name, 'status': status, \
+                             'seconds': time.perf_counter() - t_start})
+        return IsRan
+
+    def IsImportNeeded(self, tbl):
+        """
+        True if tbl is an import table not yet imported or whose source changed
+        JDL 10/18/26
+        """
+        if tbl not in self.tbls.lstImports + self.tbls.lstRawImports: return False
+        return tbl.source_stamp is None or tbl.IsSourceChanged()
+
+    def ImportNodes(self, lst_tbls):
+        """
+        Import tables that share a source file with one WorkbookSession
+        (structured to .df or raw to .df_raw and parse to .df). With a process
+        pool, the worker is sent the tables' ImportSpecs and results are set
+        on the tables here
+        JDL 10/18/26; Modified 10/18/26 to import a file's tables together;
+        send import specs to process pool
+        """
+        lst_df = [tbl for tbl in lst_tbls if tbl in self.tbls.lstImports]
+        lst_raw = [tbl for tbl in lst_tbls if tbl not in lst_df]
+        if self.executor_import is None:
+            ImportGroup(lst_df, lst_raw)
+            return
+
+        #Stamp sources here since workers import new tables built from specs
+        for tbl in lst_tbls: tbl.SetSourceStamp()
+        future = self.executor_import.submit(ImportGroupSpecs, \
+                    [ImportSpec(tbl) for tbl in lst_df], \
+                    [ImportSpec(tbl) for tbl in lst_raw])
+        lst_dfs, lst_results = future.result()
+        for tbl, df in zip(lst_df, lst_dfs): tbl.df = df
+        for tbl, result in zip(lst_raw, lst_results): tbl.df_raw, tbl.df = result
+
+    def IsExportNeeded(self, tbl, IsRan):
+        """
+        True if tbl is an output table, path_out is set and tbl ran or has not
+        been written
+        JDL 10/18/26
+        """
+        if self.path_out is None or tbl not in self.tbls.lstOutputs: return False
+        return IsRan or tbl.name not in self.set_exported
+
+    def ExportNode(self, tbl):
+        """
+        Output step: write tbl.df to path_out with ProjectTables.ExportOutputs
+        JDL 10/18/26
+        """
+        self.dOutputs.update(self.tbls.ExportOutputs(self.path_out, self.fmt, \
+                                                     lst_tbls=[tbl]))
+        self.set_exported.add(tbl.name)
+
+def ImportGroup(lst_df, lst_raw):
+    """
+    Import structured (lst_df) and raw-and-parse (lst_raw) tables that share
+    a source file with one WorkbookSession. Returns (list of .df, list of
+    (.df_raw, .df))
+    JDL 10/18/26
+    """
+    lst_dfs, lst_results = [], []
+    with WorkbookSession() as session:
+        if len(lst_df) > 0: lst_dfs = ImportTablesFromFile(lst_df, session=session)
+        if len(lst_raw) > 0: lst_results = ImportParseTablesFromFile(lst_raw, session)
+    return lst_dfs, lst_results
+
+def ImportGroupSpecs(lst_df_specs, lst_raw_specs):
+    """
+    Process pool worker: ImportGroup() for tables built from ImportSpec dicts
+    JDL 10/18/26
+    """
+    return ImportGroup([TableFromImportSpec(dSpec) for dSpec in lst_df_specs], \
+                       [TableFromImportSpec(dSpec) for dSpec in lst_raw_specs])
@@ -0,0 +1,286 @@
+#Version 10/18/26 JDL
+import os, sys, json, shutil, tempfile
+import pandas as pd
+
+path_libs = os.getcwd() + os.sep + 'libs' + os.sep
+if not path_libs in sys.path: sys.path.append(path_libs)
+import pd_util
+from projtables import Table
+from projcache import IsParquetExact, WriteJSON
+from projregistry import CopySpecValue, BlockIDVarsFromSpec
+
+"""
+================================================================================
+SharedTableStore Class -- publish a loaded ProjectTables instance's tables as
+uncompressed Arrow IPC files (in RAM-backed /dev/shm by default) that worker
+processes memory map read-only instead of re-importing Excel. All workers'
+DataFrames reference the same physical pages through the OS page cache.
+WriteSnapshot/ReadSnapshot (ProjectTables.Snapshot/.Restore) save and reload
+a whole instance --tables, .df_raw and table metadata-- the same way
+
+JDL 10/18/26
+================================================================================
+"""
+class SharedTableStore():
+    """
+    Store is a folder of <table name>.arrow files plus manifest.json (written
+    last so workers never see a partial store). The instance only holds paths
+    so it can be passed to worker processes. Requires pyarrow
+    JDL 10/18/26
+    """
+    def __init__(self, path_store=None):
+        if path_store is None: path_store = DefaultStorePath()
+        self.path_store = os.path.join(path_store, '')
+        self.pf_manifest = self.path_store + 'manifest.json'
+
+    def Publish(self, tbls, lst_tbls=None):
+        """
+        Write each table's .df (default all tbls tables that are lazy or have
+        a .df with columns) and the manifest. Returns manifest dict
+        JDL 10/18/26
+        """
+        os.makedirs(self.path_store, exist_ok=True)
+        if lst_tbls is None: lst_tbls = tbls.ListTables()
+
+        dTables = {}
+        for tbl in lst_tbls:
+            df = tbl.df if tbl.lazy_import is not None else tbl._df
+            if df is None or len(df.columns) == 0: continue
+            fname = tbl.name + '.arrow'
+            table = ArrowTableFromDf(df)
+            pd_util.WriteAtomic(self.path_store + fname, \
+                                lambda pf_temp: WriteArrowFile(table, pf_temp))
+            dTables[tbl.name] = {'file': fname, 'rows': len(df), \
+                                 'nbytes': table.nbytes, \
+                                 'source_stamp': tbl.source_stamp}
+
+        dManifest = {'tables': dTables}
+        pd_util.WriteAtomic(self.pf_manifest, \
+                            lambda pf_temp: WriteJSON(pf_temp, dManifest))
+        return dManifest
+
+    def ReadManifest(self):
+        """
+        Return manifest dict (ValueError if nothing has been published)
+        JDL 10/18/26
+        """
+        if not os.path.exists(self.pf_manifest):
+            raise ValueError("No tables published to store", self.path_store)
+        with open(self.pf_manifest) as f: return json.load(f)
+
+    def ListTableNames(self):
+        """
+        Return list of published table names
+        JDL 10/18/26
+        """
+        return list(self.ReadManifest()['tables'].keys())
+
+    def Load(self, name):
+        """
+        Return published table's DataFrame memory mapped from its Arrow file.
+        Columns are pd.ArrowDtype referencing the mapped (read-only) pages;
+        categorical columns copy only their codes
+        JDL 10/18/26
+        """
+        import pyarrow as pa
+        dTbl = self.ReadManifest()['tables'][name]
+        source = pa.memory_map(self.path_store + dTbl['file'], 'r')
+        table = pa.ipc.open_file(source).read_all()
+        return table.to_pandas(types_mapper=ArrowTypeMapper)
+
+    def Attach(self, tbls, lst_names=None):
+        """
+        Set .df of tbls' tables (default all published tables that tbls has)
+        from the store. Attached tables are no longer lazy and keep the
+        publisher's source_stamp for Refresh(). Returns list of attached names
+        JDL 10/18/26
+        """
+        dTables = self.ReadManifest()['tables']
+        if lst_names is None: lst_names = list(dTables.keys())
+
+        lst_attached = []
+        for name in lst_names:
+            tbl = getattr(tbls, name, None)
+            if not isinstance(tbl, Table): continue
+            tbl.df = self.Load(name)
+            tbl.lazy_import = None
+            tbl.source_stamp = SourceStampFromJson(dTables[name]['source_stamp'])
+            lst_attached.append(name)
+        return lst_attached
+
+    def Remove(self):
+        """
+        Delete the store's folder (workers' existing mappings stay valid)
+        JDL 10/18/26
+        """
+        shutil.rmtree(self.path_store, ignore_errors=True)
+
+def DefaultStorePath():
+    """
+    Return new temporary folder in /dev/shm (RAM-backed) if available
+    JDL 10/18/26
+    """
+    path_shm = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    return tempfile.mkdtemp(prefix='projtables_', dir=path_shm)
+
+def ArrowTableFromDf(df):
+    """
+    Return pyarrow Table of df (mixed-type columns as Arrow strings)
+    JDL 10/18/26
+    """
+    import pyarrow as pa
+    return pa.Table.from_pandas(pd_util.dfToArrow(df))
+
+def WriteArrowFile(table, pf):
+    """
+    Write pyarrow Table to uncompressed Arrow IPC file (so it can be memory
+    mapped without decoding)
+    JDL 10/18/26
+    """
+    import pyarrow as pa
+    with pa.OSFile(pf, 'wb') as f:
+        with pa.ipc.new_file(f, table.schema) as writer: writer.write_table(table)
+
+def ArrowTypeMapper(typ):
+    """
+    types_mapper for pyarrow to_pandas: pd.ArrowDtype except dictionary
+    types (converted to pandas categoricals)
+    JDL 10/18/26
+    """
+    import pyarrow as pa
+    if pa.types.is_dictionary(typ): return None
+    return pd.ArrowDtype(typ)
+
+def SourceStampFromJson(dStamp):
+    """
+    Return Table.source_stamp from its JSON form (lists back to tuples)
+    JDL 10/18/26
+    """
+    if dStamp is None: return None
+    return {key: None if val is None else tuple(val) for key, val in dStamp.items()}
+
+"""
+================================================================================
+Snapshot of a ProjectTables instance -- folder of Arrow IPC files (pickle for
+DataFrames Arrow can't hold exactly such as mixed-type raw columns) for each
+table's .df and .df_raw plus snapshot.json manifest of tbls attributes,
+import lists and each table's metadata
+================================================================================
+"""
+#Table attributes saved in snapshot manifest (JSON values)
+lst_snapshot_attrs = ['pf', 'sht', 'name', 'idx_col_name', 'dParseParams', \
+    'import_col_map', 'engine', 'IsCachedValues', 'storage', 'lazy_import', \
+    'IsStale', 'required_cols', 'numeric_cols', 'populated_cols', \
+    'nonblank_cols', 'category_threshold']
+
+#ProjectTables lists of tables saved as lists of table attribute names
+lst_snapshot_lists = ['lstImports', 'lstRawImports', 'lstOutputs', 'lstEagerImports']
+
+def WriteSnapshot(tbls, path):
+    """
+    Write snapshot of tbls to path folder. Returns manifest dict
+    JDL 10/18/26
+    """
+    path = os.path.join(path, '')
+    os.makedirs(path, exist_ok=True)
+    dTblAttrs = {attr: val for attr, val in vars(tbls).items() if isinstance(val, Table)}
+    dNames = {id(tbl): attr for attr, tbl in dTblAttrs.items()}
+
+    dTables = {}
+    for attr, tbl in dTblAttrs.items():
+        dTbl = {key: CopySpecValue(getattr(tbl, key)) for key in lst_snapshot_attrs}
+        dTbl['import_dtype'] = 'str' if tbl.import_dtype is str else tbl.import_dtype
+        dTbl['source_stamp'] = tbl.source_stamp
+        dTbl['upstream'] = [dNames[id(tbl_up)] for tbl_up in tbl.upstream]
+        dTbl['df'] = WriteSnapshotDf(tbl._df, path + attr + '.df')
+        dTbl['df_raw'] = WriteSnapshotDf(tbl._df_raw, path + attr + '.df_raw')
+        dTables[attr] = dTbl
+
+    dManifest = {'attrs': {attr: val for attr, val in vars(tbls).items() \
+                           if isinstance(val, (str, int, float, bool))}, \
+                 'lists': {lst: [dNames[id(tbl)] for tbl in getattr(tbls, lst)] \
+                           for lst in lst_snapshot_lists}, \
+                 'tables': dTables}
+    pd_util.WriteAtomic(path + 'snapshot.json', \
+                        lambda pf_temp: WriteJSON(pf_temp, dManifest))
+    return dManifest
+
+def WriteSnapshotDf(df, pf_root):
+    """
+    Write df to pf_root + '.arrow' (or '.pkl' if Arrow can't hold df's dtypes
+    or column labels exactly). Object columns of e.g. ints are stored typed.
+    Returns dict of file name, format and converted objects (None if df is None)
+    JDL 10/18/26; Modified 10/18/26 to store inferred object columns typed
+    """
+    if df is None: return None
+    try:
+        if CopySpecValue(list(df.columns)) != list(df.columns): raise ValueError
+        df_write, dObjects = pd_util.dfInferObjects(df)
+        if not IsParquetExact(df_write): raise TypeError
+        import pyarrow as pa
+        table = pa.Table.from_pandas(df_write)
+        pd_util.WriteAtomic(pf_root + '.arrow', \
+                            lambda pf_temp: WriteArrowFile(table, pf_temp))
+        fmt = 'arrow'
+
+    #pyarrow's errors subclass ValueError/TypeError
+    except (ValueError, TypeError):
+        pd_util.WriteAtomic(pf_root + '.pkl', lambda pf_temp: df.to_pickle(pf_temp))
+        fmt, dObjects = 'pkl', None
+    return {'file': os.path.basename(pf_root) + '.' + fmt, 'fmt': fmt, \
+            'objects': dObjects}
+
+def ReadSnapshot(cls, path, IsMemoryMap=True):
+    """
+    Return ProjectTables (cls) instance from snapshot in path folder.
+    IsMemoryMap returns Arrow files' DataFrames as pd.ArrowDtype columns
+    referencing the mapped pages (else copies with their original dtypes)
+    JDL 10/18/26
+    """
+    path = os.path.join(path, '')
+    with open(path + 'snapshot.json') as f: dManifest = json.load(f)
+
+    #Restore attributes without __init__ (which builds tables from files)
+    tbls = cls.__new__(cls)
+    for attr, val in dManifest['attrs'].items(): setattr(tbls, attr, val)
+    tbls.registry, tbls.profiler = None, None
+
+    for attr, dTbl in dManifest['tables'].items():
+        setattr(tbls, attr, TableFromSnapshot(dTbl, path, IsMemoryMap))
+    for attr, dTbl in dManifest['tables'].items():
+        getattr(tbls, attr).upstream = [getattr(tbls, name) for name in dTbl['upstream']]
+    for lst, lst_names in dManifest['lists'].items():
+        setattr(tbls, lst, [getattr(tbls, name) for name in lst_names])
+    return tbls
+
+def TableFromSnapshot(dTbl, path, IsMemoryMap=True):
+    """
+    Return Table instance from its snapshot manifest entry
+    JDL 10/18/26
+    """
+    import_dtype = str if dTbl['import_dtype'] == 'str' else dTbl['import_dtype']
+    tbl = Table(dTbl['pf'], dTbl['name'], dTbl['sht'], dTbl['idx_col_name'], \
+                import_dtype=import_dtype)
+    for key in lst_snapshot_attrs: setattr(tbl, key, dTbl[key])
+    if tbl.dParseParams is not None and 'block_id_vars' in tbl.dParseParams:
+        tbl.dParseParams['block_id_vars'] = \
+            BlockIDVarsFromSpec(tbl.dParseParams['block_id_vars'])
+    tbl.source_stamp = SourceStampFromJson(dTbl['source_stamp'])
+    tbl._df = ReadSnapshotDf(dTbl['df'], path, IsMemoryMap)
+    tbl._df_raw = ReadSnapshotDf(dTbl['df_raw'], path, IsMemoryMap)
+    return tbl
+
+def ReadSnapshotDf(dFile, path, IsMemoryMap=True):
+    """
+    Return DataFrame from snapshot file (None if not saved). Object columns
+    stored typed are restored unless IsMemoryMap
+    JDL 10/18/26; Modified 10/18/26 to restore inferred object columns
+    """
+    if dFile is None: return None
+    if dFile['fmt'] == 'pkl': return pd.read_pickle(path + dFile['file'])
+
+    import pyarrow as pa
+    source = pa.memory_map(path + dFile['file'], 'r')
+    table = pa.ipc.open_file(source).read_all()
+    if IsMemoryMap: return table.to_pandas(types_mapper=ArrowTypeMapper)
+    return pd_util.dfRestoreObjects(table.to_pandas(), dFile.get('objects'))
@@ -1,8 +1,9 @@
-#Version 9/26/24 JDL
-import os, sys
+#Version 10/18/26 JDL
+import os, sys, time, tracemalloc, functools, operator, asyncio
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
-from openpyxl import load_workbook
 
 path_libs = os.getcwd() + os.sep + 'libs' + os.sep
 if not path_libs in sys.path: sys.path.append(path_libs)
@@ -29,13 +30,45 @@ class ProjectTables():
     * Table3 is for validation only. It is same as Table2 but with formatted blank
       cells that cause .UsedRange to include blank columns.
 
-    JDL 9/26/24
+    Alternatively, registry (projregistry.TableRegistry) builds the tables
+    and lists from a spec file (lst_names optionally selects tables to build
+    --plus their upstream tables)
+
+    JDL 9/26/24; Modified 10/18/26 for registry
     """
-    def __init__(self, files, lst_files, IsPrint=False):
+    def __init__(self, files, lst_files, IsPrint=False, IsLazy=False, registry=None, \
+                 lst_names=None):
 
         self.IsPrint = IsPrint
+        self.IsLazy = IsLazy #Import tables on first access to tbl.df/.df_raw
+        self.registry = registry
+
+        #Set lists of inputs and outputs
+        self.lstImports = [] #structured Excel data imported to tbl.df
+        self.lstRawImports = [] #unstructured Excel data to tbl.df_raw
+        self.lstOutputs = []
+        self.lstEagerImports = [] #imported by ImportInputs even if IsLazy
+
+        #Optional StageProfiler (see .Profile() and .df_profile)
+        self.profiler = None
+
+        #Initialize Output DataFrames
+        #for tbl in self.lstOutputs:
+        #    tbl.df = pd.DataFrame()
 
-        #Create example tables (see demo.ipynb or tests_projtables.py for usage
+        #Create example tables and set hard-coded lists of df characteristics
+        if registry is None:
+            self.SetDemoTables(files, lst_files)
+            self.SetColLists()
+        else:
+            self.SetRegistryTables(files, lst_names)
+        if self.IsLazy: self.SetLazyImports()
+
+    def SetDemoTables(self, files, lst_files):
+        """
+        Create example tables (see demo.ipynb or tests_projtables.py for usage
+        JDL 10/18/26 (moved from __init__)
+        """
         self.pf_input1 = files.path_data + lst_files[0]
         self.pf_input2 = ''
         self.pf_input3 = ''
@@ -44,17 +77,31 @@ class ProjectTables():
         self.Table2 = Table(self.pf_input1, 'Table2', 'first_sheet', 'idx')
         self.Table3 = Table(self.pf_input1, 'Table3', 'second_sheet', 'idx')
 
-        #Set lists of inputs and outputs
-        self.lstImports = [self.Table2] #structured Excel data imported to tbl.df
-        self.lstRawImports = [self.Table1] #unstructured Excel data to tbl.df_raw
-        self.lstOutputs = []
-
-        #Initialize Output DataFrames
-        #for tbl in self.lstOutputs:
-        #    tbl.df = pd.DataFrame()
+        self.lstImports = [self.Table2]
+        self.lstRawImports = [self.Table1]
 
-        #Set hard-coded lists of df characteristics
-        self.SetColLists()
+    def SetRegistryTables(self, files, lst_names=None):
+        """
+        Build tables from self.registry spec as tbls attributes (named by
+        table name) and set import lists and upstream tables
+        JDL 10/18/26
+        """
+        dLists = {'df': self.lstImports, 'raw': self.lstRawImports, \
+                  'output': self.lstOutputs}
+        lst_names = self.registry.ListTableNames(lst_names)
+        for name in lst_names:
+            if hasattr(self, name):
+                raise ValueError(f"Table name {name} is a ProjectTables attribute")
+            tbl = self.registry.BuildTable(name, files.path_data)
+            setattr(self, name, tbl)
+
+            dTbl = self.registry.dTables[name]
+            if dTbl.get('import') in dLists: dLists[dTbl['import']].append(tbl)
+            if dTbl.get('eager', False): self.lstEagerImports.append(tbl)
+
+        for name in lst_names:
+            getattr(self, name).upstream = [getattr(self, name_up) for name_up \
+                                            in self.registry.dTables[name].get('upstream', [])]
 
     def SetColLists(self):
         """
@@ -70,40 +117,546 @@ class ProjectTables():
         self.Table1.populated_cols = ['idx', 'col_2']
         self.Table1.nonblank_cols = ['idx', 'col_1']
     
-    def ImportInputs(self):
+    def SetLazyImports(self):
+        """
+        Set import tables (except those in lstEagerImports) to import (and 
+        parse raw data) on first access to tbl.df or tbl.df_raw
+        JDL 10/18/26
+        """
+        for tbl in self.lstImports:
+            tbl.SetLazy(None if tbl in self.lstEagerImports else 'df')
+        for tbl in self.lstRawImports:
+            tbl.SetLazy(None if tbl in self.lstEagerImports else 'raw')
+
+    def ImportInputs(self, workers=None):
         """
         Read rows/cols input data - use pd_util.ImportExcel() to avoid importing 
         blank columns in sheet's Excel .UsedRange. Specify 
         tbl.dParseParams['col_last_df'] to specify where to truncate columns
-        JDL refactored 9/3/24
+        (workers > 1 imports files/sheets in parallel with a process pool)
+        JDL refactored 9/3/24; Modified 10/18/26 to open each file once
         """
-        for tbl in self.lstImports:
-            tbl.ImportExcelDf()
-
-            if self.IsPrint:
-                print('\nImported Excel', tbl.name, tbl.pf, tbl.sht)
-                print(tbl.df)
+        self.ImportTablesProcedure(self.lstImports, IsRaw=False, workers=workers)
     
-    def ImportRawInputs(self):
+    def ImportRawInputs(self, workers=None):
         """
         Read each table's raw data using openpyxl to work on sheets whose data 
         may not start at A1 (e.g. .df_raw requires parsing to .df)
-        JDL 3/4/24; Modified 9/25/24
+        (workers > 1 imports files/sheets in parallel with a process pool)
+        JDL 3/4/24; Modified 10/18/26 to open each file once
         """
-        for tbl in self.lstRawImports:
-            tbl.ImportExcelRaw()
+        self.ImportTablesProcedure(self.lstRawImports, IsRaw=True, workers=workers)
+
+    def ImportTablesProcedure(self, lst_tbls, IsRaw=False, workers=None):
+        """
+        Import a list of tables file-by-file (each file opened once). If
+        workers > 1, spread the files over a process pool (sending each
+        table's ImportSpec) and set each tbl's .df or .df_raw from the
+        pickled worker results. Skips lazy tables
+        JDL 10/18/26; Modified 10/18/26 to send import specs to workers
+        """
+        #Lazy tables import on first access instead
+        lst_tbls = [tbl for tbl in lst_tbls if tbl.lazy_import is None]
+
+        lst_tasks = self.ListImportTasks(lst_tbls, workers)
+        if workers is None or workers <= 1 or len(lst_tasks) <= 1:
+            for lst_task in lst_tasks:
+                ImportTablesFromFile(lst_task, IsRaw)
+                self.PrintImported(lst_task, IsRaw)
+            return
+
+        #Stamp sources here since workers import new tables built from specs
+        for tbl in lst_tbls: tbl.SetSourceStamp()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            dFutures = {executor.submit(ImportSpecsFromFile, \
+                            [ImportSpec(tbl) for tbl in lst_task], IsRaw): \
+                        lst_task for lst_task in lst_tasks}
+            for future in as_completed(dFutures):
+                lst_task = dFutures[future]
+                for tbl, df in zip(lst_task, future.result()):
+                    if IsRaw: tbl.df_raw = df
+                    else: tbl.df = df
+                self.PrintImported(lst_task, IsRaw)
+
+    async def ImportInputsAsync(self, workers=None, executor=None, callback=None):
+        """
+        Awaitable ImportInputs() that runs file imports in an executor so the
+        event loop keeps running (see .IterImportTablesAsync()). Returns list
+        of imported tables in completion order
+        JDL 10/18/26
+        """
+        lst_imported = []
+        async for lst_task in self.IterImportTablesAsync(self.lstImports, False, \
+                                                         workers, executor):
+            lst_imported.extend(lst_task)
+            if callback is not None: callback(lst_task)
+        return lst_imported
+
+    async def ImportRawInputsAsync(self, workers=None, executor=None, callback=None, \
+                                   IsParse=False):
+        """
+        Awaitable ImportRawInputs(); IsParse also parses raw tables whose
+        dParseParams have flag_start_bound (in the executor)
+        JDL 10/18/26
+        """
+        lst_imported = []
+        async for lst_task in self.IterImportTablesAsync(self.lstRawImports, True, \
+                                                         workers, executor, IsParse):
+            lst_imported.extend(lst_task)
+            if callback is not None: callback(lst_task)
+        return lst_imported
+
+    async def IterImportTablesAsync(self, lst_tbls, IsRaw=False, workers=None, \
+                                    executor=None, IsParse=False):
+        """
+        Async generator that imports tables file-by-file (ListImportTasks) in
+        executor (default thread pool; or a ProcessPoolExecutor, which is sent
+        ImportSpecs) with at most workers (default 1) files at once and yields
+        each file's list of tables as it finishes. Cancelling the consumer
+        cancels files not yet started (files already being read finish in
+        the executor)
+        JDL 10/18/26; Modified 10/18/26 to send import specs to processes
+        """
+        lst_tbls = [tbl for tbl in lst_tbls if tbl.lazy_import is None]
+        workers = workers or 1
+        lst_tasks = self.ListImportTasks(lst_tbls, workers)
+
+        #Stamp sources here in case workers import copies of tables
+        for tbl in lst_tbls: tbl.SetSourceStamp()
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(workers)
+        IsOwnExecutor = executor is None
+        if IsOwnExecutor: executor = ThreadPoolExecutor(max_workers=workers)
+
+        #Process workers get import specs; threads import the tables themselves
+        IsProcess = isinstance(executor, ProcessPoolExecutor)
+        if IsProcess:
+            fn_import = functools.partial(ImportSpecsFromFile, IsRaw=IsRaw, \
+                                          IsParse=IsParse)
+        elif IsParse:
+            fn_import = ImportParseTablesFromFile
+        else:
+            fn_import = functools.partial(ImportTablesFromFile, IsRaw=IsRaw)
+
+        async def import_task(lst_task):
+            arg = [ImportSpec(tbl) for tbl in lst_task] if IsProcess else lst_task
+            async with semaphore:
+                lst_results = await loop.run_in_executor(executor, fn_import, arg)
+            for tbl, result in zip(lst_task, lst_results):
+                if IsParse: tbl.df_raw, tbl.df = result
+                elif IsRaw: tbl.df_raw = result
+                else: tbl.df = result
+            self.PrintImported(lst_task, IsRaw)
+            return lst_task
+
+        lst_futures = [asyncio.ensure_future(import_task(lst_task)) \
+                       for lst_task in lst_tasks]
+        try:
+            for future in asyncio.as_completed(lst_futures):
+                yield await future
+        finally:
+            for future in lst_futures: future.cancel()
+            if IsOwnExecutor: executor.shutdown(wait=False, cancel_futures=True)
+
+    def Refresh(self, workers=None):
+        """
+        Re-import (and re-parse raw tables with dParseParams flag_start_bound)
+        only import tables whose file/sheet changed since import. Lazy tables
+        are reset to import on next access. Tables with changed upstream
+        tables are marked tbl.IsStale. Tables whose file is missing keep their
+        data. Returns dict of lists of table names: 'imported' (re-imported),
+        'reset' (lazy tables reset) and 'missing' (source file not found)
+        JDL 10/18/26
+        """
+        lst_changed = [tbl for tbl in self.lstImports + self.lstRawImports \
+                       if self.IsRefreshNeeded(tbl)]
+        lst_missing = [tbl for tbl in lst_changed if not os.path.exists(tbl.pf)]
+        lst_changed = [tbl for tbl in lst_changed if tbl not in lst_missing]
+        lst_reset = [tbl for tbl in lst_changed if tbl.lazy_import is not None]
+        for tbl in lst_reset: tbl.SetLazy(tbl.lazy_import)
+
+        lst_imports = [tbl for tbl in self.lstImports if tbl in lst_changed]
+        self.ImportTablesProcedure(lst_imports, IsRaw=False, workers=workers)
+
+        lst_raw = [tbl for tbl in self.lstRawImports if tbl in lst_changed and \
+                   tbl.lazy_import is None]
+        self.ImportTablesProcedure(lst_raw, IsRaw=True, workers=workers)
+        for tbl in lst_raw: tbl.ParseRaw()
+
+        self.MarkStale(lst_changed)
+        if self.IsPrint and len(lst_missing) > 0:
+            print('\nRefresh skipped tables with missing source files', \
+                  [tbl.name for tbl in lst_missing])
+        return {'imported': [tbl.name for tbl in lst_changed if tbl not in lst_reset], \
+                'reset': [tbl.name for tbl in lst_reset], \
+                'missing': [tbl.name for tbl in lst_missing]}
+
+    def IsRefreshNeeded(self, tbl):
+        """
+        True if tbl's source changed (lazy tables not yet imported are skipped)
+        JDL 10/18/26
+        """
+        if tbl.lazy_import is not None and tbl.source_stamp is None: return False
+        return tbl.IsSourceChanged()
+
+    def MarkStale(self, lst_changed):
+        """
+        Set IsStale for tables whose upstream tables (directly or through
+        other tables) are in lst_changed
+        JDL 10/18/26
+        """
+        lst_dirty = list(lst_changed)
+        IsMarked = True
+        while IsMarked:
+            IsMarked = False
+            for tbl in self.ListTables():
+                if tbl in lst_dirty: continue
+                if any(tbl_up in lst_dirty for tbl_up in tbl.upstream):
+                    tbl.IsStale = True
+                    lst_dirty.append(tbl)
+                    IsMarked = True
+
+    def ListTables(self):
+        """
+        Return list of all Table attributes of tbls
+        JDL 10/18/26
+        """
+        return [val for val in vars(self).values() if isinstance(val, Table)]
+
+    def ExportOutputs(self, path_out, fmt='parquet', workers=None, pf_excel=None, \
+                      lst_tbls=None):
+        """
+        Write each output table's .df (default lstOutputs) to path_out as
+        <tbl.name> + ext in fmt 'parquet', 'feather', 'csv.gz' or 'xlsx'
+        (atomic writes; workers > 1 writes tables in a thread pool). Optional
+        final step writes all tables to pf_excel workbook (sheet per table).
+        Returns dict of written path+files by table name
+        JDL 10/18/26
+        """
+        if lst_tbls is None: lst_tbls = self.lstOutputs
+        os.makedirs(path_out, exist_ok=True)
+        dPfs = {tbl.name: os.path.join(path_out, tbl.name + pd_util.dOutputExts.get(fmt, '')) \
+                for tbl in lst_tbls}
+
+        if workers is None or workers <= 1 or len(lst_tbls) <= 1:
+            for tbl in lst_tbls: pd_util.WriteDf(tbl.df, dPfs[tbl.name], fmt)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                lst_futures = [executor.submit(pd_util.WriteDf, tbl.df, \
+                               dPfs[tbl.name], fmt) for tbl in lst_tbls]
+                for future in as_completed(lst_futures): future.result()
+
+        if pf_excel is not None:
+            pd_util.WriteExcelSheets({tbl.name: tbl.df for tbl in lst_tbls}, pf_excel)
+        return dPfs
+
+    def Snapshot(self, path):
+        """
+        Save tables' .df and .df_raw (Arrow files) and metadata (manifest) to
+        path folder for ProjectTables.Restore(path). Build functions and
+        caches are not saved. Returns manifest dict
+        JDL 10/18/26
+        """
+        import projshared
+        return projshared.WriteSnapshot(self, path)
+
+    @classmethod
+    def Restore(cls, path, IsMemoryMap=True):
+        """
+        Return ProjectTables instance from Snapshot(path) folder without
+        importing Excel. IsMemoryMap maps tables' Arrow files (pd.ArrowDtype
+        columns) instead of copying them to their original dtypes
+        JDL 10/18/26
+        """
+        import projshared
+        return projshared.ReadSnapshot(cls, path, IsMemoryMap)
+
+    def ListImportTasks(self, lst_tbls, workers=None):
+        """
+        Return list of table sublists to import as units of work --one per
+        file. If fewer files than workers, split each file's sheets into up
+        to workers // n_files sublists
+        JDL 10/18/26
+        """
+        lst_groups = list(self.GroupTablesByFile(lst_tbls).values())
+        if workers is None or len(lst_groups) == 0: return lst_groups
+
+        n_split = max(1, workers // len(lst_groups))
+        lst_tasks = []
+        for lst_group in lst_groups:
+            n = min(n_split, len(lst_group))
+            lst_tasks += [lst_group[i::n] for i in range(n)]
+        return lst_tasks
+
+    def PrintImported(self, lst_tbls, IsRaw=False):
+        """
+        If self.IsPrint, print imported tables
+        JDL 10/18/26
+        """
+        if not self.IsPrint: return
+        for tbl in lst_tbls:
+            if IsRaw: print('\nImported Excel Raw', tbl.name, tbl.pf, tbl.sht)
+            else: print('\nImported Excel', tbl.name, tbl.pf, tbl.sht)
+            print(tbl.df)
+
+    def OptimizeDtypes(self):
+        """
+        Run tbl.OptimizeDtypes() for imported tables (skips lazy tables not yet
+        imported). Returns Series of bytes saved by table name
+        JDL 10/18/26
+        """
+        dSaved = {}
+        for tbl in self.lstImports + self.lstRawImports:
+            if tbl._df is None: continue
+            dSaved[tbl.name] = tbl.OptimizeDtypes()
+        return pd.Series(dSaved, dtype='int64', name='bytes_saved')
+
+    def SetEngine(self, engine):
+        """
+        Set Excel reader engine (e.g. 'calamine'; None for default
+        pd_util.EXCEL_ENGINE) for all imported tables
+        JDL 10/18/26
+        """
+        for tbl in self.lstImports + self.lstRawImports: tbl.engine = engine
+
+    def SetStorage(self, storage):
+        """
+        Set storage mode ('arrow' for pyarrow-backed columns; None for NumPy)
+        for all imported tables
+        JDL 10/18/26
+        """
+        for tbl in self.lstImports + self.lstRawImports: tbl.storage = storage
+
+    def SetCache(self, cache):
+        """
+        Set a projcache.TableCache (or None) for all imported tables
+        JDL 10/18/26
+        """
+        for tbl in self.lstImports + self.lstRawImports: tbl.cache = cache
+
+    def GroupTablesByFile(self, lst_tbls):
+        """
+        Return dict of lists of tables keyed by tbl.pf (in order of first
+        appearance) so that each workbook is opened once for all its sheets
+        JDL 10/18/26
+        """
+        dTblsByFile = {}
+        for tbl in lst_tbls:
+            dTblsByFile.setdefault(tbl.pf, []).append(tbl)
+        return dTblsByFile
+
+    def Profile(self, callback=None, IsTraceMemory=True):
+        """
+        Return a new StageProfiler (also set as self.profiler) to use as
+        context manager --e.g. with tbls.Profile(): tbls.ImportRawInputs()
+        JDL 10/18/26
+        """
+        self.profiler = StageProfiler(callback, IsTraceMemory)
+        return self.profiler
+
+    @property
+    def df_profile(self):
+        """
+        DataFrame of self.profiler's stage records (empty if not profiled)
+        JDL 10/18/26
+        """
+        if self.profiler is None: return pd.DataFrame(columns=StageProfiler.cols)
+        return self.profiler.df
+
+"""
+================================================================================
+StageProfiler Class -- records wall time, rows/cols in and out and memory
+delta for each call of Table import and RowMajorTbl parsing stages
+================================================================================
+"""
+class StageProfiler():
+    """
+    Record each ProfileStage-decorated method call while active. Use as
+    context manager or with .Start()/.Stop(). Optional callback(dRecord) is
+    called with each record. Memory delta is net traced allocation (tracemalloc)
+    during the stage. Only in-process calls are recorded (not process pool
+    workers from ImportInputs(workers=n))
+    JDL 10/18/26
+    """
+    active = None #Currently recording profiler (class-level)
+    cols = ['table', 'stage', 'seconds', 'rows_in', 'cols_in', 'rows_out', \
+            'cols_out', 'mem_delta_bytes']
 
-            if self.IsPrint:
-                print('\nImported Excel Raw', tbl.name, tbl.pf, tbl.sht)
-                print(tbl.df)
+    def __init__(self, callback=None, IsTraceMemory=True):
+        self.callback = callback
+        self.IsTraceMemory = IsTraceMemory
+        self.IsStartedTrace = False #True if .Start() started tracemalloc
+        self.lst_records = []
+
+    def __enter__(self):
+        self.Start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Stop()
+
+    @property
+    def df(self):
+        """
+        DataFrame of stage records (one row per call in call-completion order)
+        JDL 10/18/26
+        """
+        return pd.DataFrame(self.lst_records, columns=self.cols)
+
+    def Start(self):
+        """
+        Set as the active profiler and optionally start tracemalloc
+        JDL 10/18/26
+        """
+        StageProfiler.active = self
+        if self.IsTraceMemory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.IsStartedTrace = True
+
+    def Stop(self):
+        """
+        Stop recording (and stop tracemalloc if .Start() started it)
+        JDL 10/18/26
+        """
+        if StageProfiler.active is self: StageProfiler.active = None
+        if self.IsStartedTrace:
+            tracemalloc.stop()
+            self.IsStartedTrace = False
+
+    def RunStage(self, method, obj, args, kwargs, attr_in, attr_out):
+        """
+        Call method(obj, *args, **kwargs) and record its time, in/out shapes
+        of obj's attr_in/attr_out and memory delta. Returns method's result
+        JDL 10/18/26
+        """
+        rows_in, cols_in = AttrShape(obj, attr_in)
+        mem_start = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        t_start = time.perf_counter()
+
+        result = method(obj, *args, **kwargs)
+
+        seconds = time.perf_counter() - t_start
+        mem_delta = None
+        if mem_start is not None and tracemalloc.is_tracing():
+            mem_delta = tracemalloc.get_traced_memory()[0] - mem_start
+        rows_out, cols_out = AttrShape(obj, attr_out)
+
+        tbl = obj if isinstance(obj, Table) else obj.tbl
+        dRecord = dict(zip(self.cols, [tbl.name, method.__name__, seconds, rows_in, \
+                                       cols_in, rows_out, cols_out, mem_delta]))
+        self.lst_records.append(dRecord)
+        if self.callback is not None: self.callback(dRecord)
+        return result
+
+def ProfileStage(attr_in=None, attr_out=None):
+    """
+    Decorator to record a Table/RowMajorTbl method with the active
+    StageProfiler. attr_in/attr_out are (dotted) attribute names of the
+    DataFrame or list whose shape is recorded before/after the call
+    JDL 10/18/26
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if StageProfiler.active is None: return method(self, *args, **kwargs)
+            return StageProfiler.active.RunStage(method, self, args, kwargs, \
+                                                 attr_in, attr_out)
+        return wrapper
+    return decorator
+
+def AttrShape(obj, attr):
+    """
+    Return (rows, cols) of obj's attr (dotted name) DataFrame; (len, None) for
+    a list; (None, None) if attr is None or not set. Uses _df/_df_raw names to
+    avoid triggering lazy imports
+    JDL 10/18/26
+    """
+    if attr is None: return None, None
+    val = operator.attrgetter(attr)(obj)
+    if isinstance(val, pd.DataFrame): return val.shape
+    if isinstance(val, list): return len(val), None
+    return None, None
+
+def IterDfChunks(df, chunk_rows=100000):
+    """
+    Yield slices of df of up to chunk_rows rows
+    JDL 10/18/26
+    """
+    for i in range(0, len(df), chunk_rows): yield df.iloc[i:i + chunk_rows]
+
+def ImportTablesFromFile(lst_tbls, IsRaw=False, session=None):
+    """
+    Import a list of tables that share a workbook file using one
+    WorkbookSession (new unless session is specified). Returns list of the
+    imported .df (or .df_raw) DataFrames (module-level so ProjectTables can
+    run it in a process pool)
+    JDL 10/18/26; Modified 10/18/26 for session argument
+    """
+    IsOwnSession = session is None
+    if IsOwnSession: session = WorkbookSession()
+    try:
+        for tbl in lst_tbls:
+            if IsRaw: tbl.ImportExcelRaw(session)
+            else: tbl.ImportExcelDf(session)
+    finally:
+        if IsOwnSession: session.Close()
+    return [tbl.df_raw if IsRaw else tbl.df for tbl in lst_tbls]
+
+def ImportParseTablesFromFile(lst_tbls, session=None):
+    """
+    Raw import a list of tables that share a workbook file and parse those
+    whose dParseParams have flag_start_bound. Returns list of (.df_raw, .df)
+    JDL 10/18/26; Modified 10/18/26 for session argument
+    """
+    ImportTablesFromFile(lst_tbls, IsRaw=True, session=session)
+    for tbl in lst_tbls: tbl.ParseRaw()
+    return [(tbl.df_raw, tbl.df) for tbl in lst_tbls]
+
+#Table attributes sent to process pool workers to import a table (instead of
+#pickling the Table with its loaded DataFrames, upstream tables and build_fn)
+lst_import_spec_attrs = ['pf', 'sht', 'name', 'idx_col_name', 'dParseParams', \
+    'import_col_map', 'import_dtype', 'engine', 'IsCachedValues', 'storage', 'cache']
+
+def ImportSpec(tbl):
+    """
+    Return dict of tbl's import instructions for a process pool worker
+    JDL 10/18/26
+    """
+    return {attr: getattr(tbl, attr) for attr in lst_import_spec_attrs}
+
+def TableFromImportSpec(dSpec):
+    """
+    Return new Table instance from an ImportSpec() dict
+    JDL 10/18/26
+    """
+    tbl = Table(dSpec['pf'], dSpec['name'], dSpec['sht'], dSpec['idx_col_name'], \
+                dSpec['dParseParams'], dSpec['import_dtype'], dSpec['engine'])
+    tbl.import_col_map = dSpec['import_col_map']
+    tbl.IsCachedValues = dSpec['IsCachedValues']
+    tbl.storage, tbl.cache = dSpec['storage'], dSpec['cache']
+    return tbl
+
+def ImportSpecsFromFile(lst_specs, IsRaw=False, IsParse=False):
+    """
+    Process pool worker: build tables from ImportSpec() dicts that share a
+    workbook file and import them with ImportTablesFromFile (or if IsParse,
+    ImportParseTablesFromFile). Returns the list of imported DataFrames
+    JDL 10/18/26
+    """
+    lst_tbls = [TableFromImportSpec(dSpec) for dSpec in lst_specs]
+    if IsParse: return ImportParseTablesFromFile(lst_tbls)
+    return ImportTablesFromFile(lst_tbls, IsRaw)
 
 class Table():
     """
     Attributes for a data table including import instructions and other
     metadaeta. Table instances are attributes of ProjectTables Class
     JDL Modified 9/26/24 add import_dtype argument
+    Modified 10/18/26 to allow import_dtype='string[pyarrow]'; engine argument
     """
-    def __init__(self, pf, name, sht, idx_col_name, dParseParams=None, import_dtype=None):
+    def __init__(self, pf, name, sht, idx_col_name, dParseParams=None, \
+                 import_dtype=None, engine=None):
                 
         #Import info: Path+File (sPF), Excel sheet name for import
         self.pf = pf
@@ -115,23 +668,129 @@ class Table():
         self.dParseParams = dParseParams
         self.import_col_map = {} #Map raw import names to df col names
         self.import_dtype = import_dtype #To force str type for imported values
-
-        #Raw (non-parsed) and parsed DataFrames
-        self.df_raw = pd.DataFrame()
-        self.df = pd.DataFrame()
+        self.engine = engine #Excel reader backend (None for pd_util.EXCEL_ENGINE)
+        self.IsCachedValues = False #Raw import formulas' cached values (see
+                                    #pd_util.OpenRawWorkbook; calamine always)
+        self.storage = None #'arrow' for pyarrow-backed (pd.ArrowDtype) columns
+
+        #Raw (non-parsed) and parsed DataFrames (properties; None if lazy
+        #import is pending --see .SetLazy())
+        self._df_raw = pd.DataFrame()
+        self._df = pd.DataFrame()
+        self.lazy_import = None #'df' or 'raw' if importing on first access
+
+        #Optional projcache.TableCache to skip Excel if source is unchanged
+        self.cache = None
+
+        #Source file/sheet stamp at last import (see .IsSourceChanged()),
+        #tables this table is derived from and flag if they have changed
+        self.source_stamp = None
+        self.upstream = []
+        self.IsStale = False
+
+        #Optional callable(tbl) that sets .df from tbl.upstream tables' data
+        #(run by projscheduler.TableScheduler)
+        self.build_fn = None
 
         self.required_cols = []
         self.numeric_cols = []
         self.populated_cols = []
         self.nonblank_cols = []
 
-    def ImportExcelDf(self):
+        #Max unique/non-blank fraction for OptimizeDtypes() categoricals
+        self.category_threshold = 0.5
+
+    @property
+    def df(self):
+        """
+        Parsed/imported DataFrame. For lazy 'df' tables, imports on first
+        access; for lazy 'raw' tables, imports .df_raw and parses it with
+        RowMajorTbl if tbl.dParseParams specifies a flag_start_bound
+        JDL 10/18/26
+        """
+        if self._df is None:
+            self._df = pd.DataFrame()
+            try:
+                if self.lazy_import == 'df':
+                    self.ImportExcelDf()
+                else:
+                    self.ParseRaw()
+            except Exception:
+                self._df = None
+                raise
+        return self._df
+
+    @df.setter
+    def df(self, df):
+        self._df = df
+
+    @property
+    def df_raw(self):
+        """
+        Raw DataFrame for parsing. For lazy 'raw' tables, imports on first
+        access
+        JDL 10/18/26
+        """
+        if self._df_raw is None:
+            self._df_raw = pd.DataFrame()
+            try:
+                self.ImportExcelRaw()
+            except Exception:
+                self._df_raw = None
+                raise
+        return self._df_raw
+
+    @df_raw.setter
+    def df_raw(self, df_raw):
+        self._df_raw = df_raw
+
+    @property
+    def IsRowMajor(self):
+        """
+        True if dParseParams specify a flag_start_bound (.df is parsed from
+        row major .df_raw blocks by RowMajorTbl)
+        JDL 10/18/26
+        """
+        return self.dParseParams is not None and 'flag_start_bound' in self.dParseParams
+
+    def ParseRaw(self):
+        """
+        If IsRowMajor, parse .df_raw to a new .df with RowMajorTbl. Returns
+        True if parsed
+        JDL 10/18/26
+        """
+        if not self.IsRowMajor: return False
+        self.df = pd.DataFrame()
+        RowMajorTbl(self).ReadBlocksProcedure()
+        return True
+
+    def SetLazy(self, lazy_import):
+        """
+        Set table to import on first access of .df/.df_raw (lazy_import is
+        'df' for structured or 'raw' for raw import); None sets it to eager
+        JDL 10/18/26
+        """
+        self.lazy_import = lazy_import
+        if lazy_import is None:
+            if self._df is None: self._df = pd.DataFrame()
+            if self._df_raw is None: self._df_raw = pd.DataFrame()
+        else:
+            self._df = None
+            if lazy_import == 'raw': self._df_raw = None
+
+    @ProfileStage(None, '_df')
+    def ImportExcelDf(self, session=None):
         """
         Import rows/cols homed table data from Excel to .df
-        JDL 9/3/24
+        (optional WorkbookSession shares one open file across tables)
+        JDL 9/3/24; Modified 10/18/26 for session argument
         """
-        self.df = pd_util.dfExcelImport(self.pf, sht=self.sht, \
-                                        IsDeleteBlankCols=True)
+        self.SetSourceStamp()
+        if self.LoadCached('df'): return
+
+        src = self.pf if session is None else session.ExcelFile(self.pf, self.engine)
+        self.df = pd_util.dfExcelImport(src, sht=self.sht, \
+                                        IsDeleteBlankCols=True, engine=self.engine)
         
         #Optionally, drop columns after specified last column
         if self.dParseParams is not None and 'col_last_df' in self.dParseParams:
@@ -141,25 +800,212 @@ class Table():
                 self.df = self.df.iloc[:, :idx_last+1]
             except KeyError:
                 raise ValueError(f"Column {col_last} not found in", self.name)
+        if self.storage == 'arrow': self.df = pd_util.dfToArrow(self.df)
+        self.SaveCached('df')
 
-    def ImportExcelRaw(self):
+    @ProfileStage(None, '_df_raw')
+    def ImportExcelRaw(self, session=None):
         """
         Import unstructured data to .df_raw for parsing
+        (optional WorkbookSession shares one open file across tables)
         JDL Modified 9/26/24 to allow forcing str type for imported values
+        Modified 10/18/26 for session argument and reader engine
         """
-        #Create workbook object and select sheet
-        wb = load_workbook(filename=self.pf, read_only=True)
-        ws = wb[self.sht]
+        self.SetSourceStamp()
+        if self.LoadCached('raw'): return
 
-        # Convert the data to a list and convert to a DataFrame
-        data = ws.values
+        #Create (or get session's open) workbook object
+        if session is None:
+            wb = pd_util.OpenRawWorkbook(self.pf, self.engine, self.IsCachedValues)
+        else:
+            wb = session.Workbook(self.pf, self.engine, self.IsCachedValues)
+
+        # Convert the sheet's rows to a list and convert to a DataFrame
+        data = list(pd_util.IterRawRows(wb, self.sht))
         self.df_raw = pd.DataFrame(data)
+        if session is None: wb.close()
 
         #Negate Pandas inferring float data type for integers and NaNs for blanks
+        #(column-wise vectorized; optionally as 'string[pyarrow]' dtype)
         if self.import_dtype == str:
-            self.df_raw = self.df_raw.applymap(lambda x: None if pd.isna(x) \
-                    else str(int(x)) if isinstance(x, float) and x.is_integer() \
-                    else str(x))
+            self.df_raw = pd_util.dfCoerceStr(self.df_raw)
+        elif self.import_dtype == 'string[pyarrow]':
+            self.df_raw = pd_util.dfCoerceStr(self.df_raw, dtype=self.import_dtype)
+
+        #Arrow storage: single-type columns keep their Arrow type; mixed-type
+        #cell columns (e.g. header and data rows) become Arrow strings
+        if self.storage == 'arrow': self.df_raw = pd_util.dfToArrow(self.df_raw)
+        self.SaveCached('raw')
+
+    def SetSourceStamp(self):
+        """
+        Record source file's (size, mtime_ns) and sheet's xlsx part CRCs
+        JDL 10/18/26
+        """
+        self.source_stamp = {'stat': pd_util.FileStat(self.pf), \
+                             'crc': pd_util.SheetCRC(self.pf, self.sht)}
+
+    def IsSourceChanged(self):
+        """
+        True if never imported or source changed since import (including a
+        missing source file). A changed file stat with the same sheet CRCs
+        (e.g. another sheet edited) is unchanged
+        JDL 10/18/26
+        """
+        if self.source_stamp is None or not os.path.exists(self.pf): return True
+        stat = pd_util.FileStat(self.pf)
+        if stat == self.source_stamp['stat']: return False
+
+        crc = pd_util.SheetCRC(self.pf, self.sht)
+        if crc is None or crc != self.source_stamp['crc']: return True
+        self.source_stamp['stat'] = stat
+        return False
+
+    def LoadCached(self, kind):
+        """
+        If self.cache has a current entry of kind ('df', 'raw' or 'parsed'),
+        set .df (.df_raw for 'raw') from it and return True
+        JDL 10/18/26
+        """
+        if self.cache is None: return False
+        df = self.cache.Load(self, kind)
+        if df is None: return False
+        if kind == 'raw':
+            self.df_raw = df
+        else:
+            self.df = df
+        return True
+
+    def SaveCached(self, kind):
+        """
+        Write .df (.df_raw for kind 'raw') to self.cache
+        JDL 10/18/26
+        """
+        if self.cache is None: return
+        self.cache.Save(self, kind, self.df_raw if kind == 'raw' else self.df)
+
+    def IterExcelRaw(self, session=None):
+        """
+        Yield raw sheet rows (tuples) from the reader engine's row iterator
+        (e.g. openpyxl read-only) without building .df_raw (for
+        RowMajorStreamTbl). Values are coerced to str per import_dtype
+        JDL 10/18/26
+        """
+        if session is None:
+            wb = pd_util.OpenRawWorkbook(self.pf, self.engine, self.IsCachedValues)
+        else:
+            wb = session.Workbook(self.pf, self.engine, self.IsCachedValues)
+        IsStr = self.import_dtype in (str, 'string[pyarrow]')
+        try:
+            for row in pd_util.IterRawRows(wb, self.sht):
+                if IsStr: row = tuple(pd_util.CoerceStrValue(x) for x in row)
+                yield row
+        finally:
+            if session is None: wb.close()
+
+    def IterChunks(self, chunk_rows=100000, session=None):
+        """
+        Yield table data as DataFrame chunks of up to chunk_rows rows without
+        building .df --from tbl.cache's 'df' entry if current (Parquet row
+        batches) or else from the sheet's raw row iterator. Row major tables
+        yield parsed rows (see .IterParsedChunks()); tables with no source
+        sheet (e.g. outputs) yield slices of .df
+        JDL 10/18/26; Modified 10/18/26 for row major and output tables
+        """
+        if self.IsRowMajor:
+            yield from self.IterParsedChunks(chunk_rows, session)
+        elif not self.pf or self.sht is None or self.sht == '':
+            yield from IterDfChunks(self.df, chunk_rows)
+        elif self.cache is not None and self.cache.IsCurrent(self, 'df'):
+            yield from self.cache.IterChunks(self, 'df', chunk_rows)
+        else:
+            yield from self.IterExcelChunks(chunk_rows, session)
+
+    def IterParsedChunks(self, chunk_rows=100000, session=None):
+        """
+        Yield row major table's parsed rows as DataFrame chunks: from
+        tbl.cache's 'parsed' entry if current, slices of .df if already
+        parsed (or stacked --parsed in memory) or else parsed blocks streamed
+        by RowMajorStreamTbl.IterBlocks() combined to about chunk_rows rows
+        JDL 10/18/26
+        """
+        if self.cache is not None and self.cache.IsCurrent(self, 'parsed'):
+            yield from self.cache.IterChunks(self, 'parsed', chunk_rows)
+            return
+
+        IsStack = self.dParseParams.get('is_stack_parsed_cols', False)
+        IsParsed = self._df is not None and len(self._df.columns) > 0
+        if IsStack and not IsParsed and self.lazy_import is None:
+            self.ImportExcelRaw(session)
+            self.ParseRaw()
+        if IsStack or IsParsed:
+            yield from IterDfChunks(self.df, chunk_rows)
+            return
+
+        lst_blocks, n_rows = [], 0
+        row_maj = RowMajorStreamTbl(self, rows=self.IterExcelRaw(session))
+        for df_block in row_maj.IterBlocks():
+            lst_blocks.append(df_block)
+            n_rows += len(df_block)
+            if n_rows >= chunk_rows:
+                yield pd.concat(lst_blocks, axis=0)
+                lst_blocks, n_rows = [], 0
+        if len(lst_blocks) > 0: yield pd.concat(lst_blocks, axis=0)
+
+    def IterExcelChunks(self, chunk_rows=100000, session=None):
+        """
+        Yield DataFrame chunks of sheet rows below the header row. Like
+        ImportExcelDf, drops blank-header columns, truncates after
+        dParseParams['col_last_df'] and omits trailing blank rows
+        JDL 10/18/26
+        """
+        rows = self.IterExcelRaw(session)
+        header = next(rows, None)
+        if header is None: return
+
+        #Header positions of columns to keep
+        icols = [i for i, col in enumerate(header) if col is not None]
+        if self.dParseParams is not None and 'col_last_df' in self.dParseParams:
+            col_last = self.dParseParams['col_last_df']
+            if col_last not in header:
+                raise ValueError(f"Column {col_last} not found in", self.name)
+            icols = [i for i in icols if i <= header.index(col_last)]
+        cols = [header[i] for i in icols]
+
+        #Blank rows are held until a later non-blank row (else trailing)
+        lst_chunk, lst_blank, n_rows = [], [], 0
+        for row in rows:
+            row = [row[i] if i < len(row) else None for i in icols]
+            if all(x is None for x in row):
+                lst_blank.append(row)
+                continue
+            lst_chunk += lst_blank + [row]
+            lst_blank = []
+            while len(lst_chunk) >= chunk_rows:
+                yield pd.DataFrame(lst_chunk[:chunk_rows], columns=cols, \
+                                   index=range(n_rows, n_rows + chunk_rows))
+                lst_chunk, n_rows = lst_chunk[chunk_rows:], n_rows + chunk_rows
+        if len(lst_chunk) > 0:
+            yield pd.DataFrame(lst_chunk, columns=cols, \
+                               index=range(n_rows, n_rows + len(lst_chunk)))
+
+    def OptimizeDtypes(self):
+        """
+        Convert .df columns to compact dtypes with pd_util.SerOptimizeDtype:
+        numeric_cols converted to numbers, integer values to smallest int
+        (nullable Int unless in nonblank_cols and no blanks) and object
+        columns to categorical per self.category_threshold. Returns bytes saved
+        JDL 10/18/26
+        """
+        bytes_start = self.df.memory_usage(deep=True).sum()
+
+        df = self.df.copy(deep=False)
+        for i, col in enumerate(df.columns):
+            ser = pd_util.SerOptimizeDtype(df.iloc[:, i], col in self.numeric_cols, \
+                        col not in self.nonblank_cols, self.category_threshold)
+            df.isetitem(i, ser)
+        self.df = df
+        return int(bytes_start - self.df.memory_usage(deep=True).sum())
 
     def ResetDefaultIndex(self, IsDrop=True):
         """
@@ -173,17 +1019,403 @@ class Table():
             self.df = self.df.reset_index(drop=IsDrop)
             self.df = self.df.set_index(self.idx_col_name)
 
+"""
+================================================================================
+WorkbookSession Class -- open each Excel file once for all Tables that import
+from it (ProjectTables.ImportInputs and .ImportRawInputs group tables by pf)
+================================================================================
+"""
+class WorkbookSession():
+    """
+    Cache of open Excel files keyed by path+filename and reader engine
+    (and for raw workbooks, whether formulas read as cached values).
+    .ExcelFile() returns a pd.ExcelFile for structured imports and .Workbook()
+    returns a workbook for raw imports (read-only openpyxl or calamine). Files
+    stay open until .Close() or end of a with block
+    JDL 10/18/26
+    """
+    def __init__(self):
+        self.dExcelFiles = {} #(pf, engine): pd.ExcelFile
+        self.dWorkbooks = {} #(pf, engine, IsCachedValues): raw import workbook
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Close()
+
+    def ExcelFile(self, pf, engine=None):
+        """
+        Return open pd.ExcelFile for pf (opened on first request)
+        JDL 10/18/26
+        """
+        engine = pd_util.EXCEL_ENGINE if engine is None else engine
+        if (pf, engine) not in self.dExcelFiles:
+            self.dExcelFiles[(pf, engine)] = pd.ExcelFile(pf, engine=engine)
+        return self.dExcelFiles[(pf, engine)]
+
+    def Workbook(self, pf, engine=None, IsCachedValues=False):
+        """
+        Return open workbook for raw import of pf (opened on first request)
+        JDL 10/18/26; Modified 10/18/26 for IsCachedValues argument
+        """
+        engine = pd_util.EXCEL_ENGINE if engine is None else engine
+        key = (pf, engine, IsCachedValues)
+        if key not in self.dWorkbooks:
+            self.dWorkbooks[key] = pd_util.OpenRawWorkbook(pf, engine, IsCachedValues)
+        return self.dWorkbooks[key]
+
+    def Close(self):
+        """
+        Close all open files
+        JDL 10/18/26
+        """
+        for xl in self.dExcelFiles.values(): xl.close()
+        for wb in self.dWorkbooks.values(): wb.close()
+        self.dExcelFiles, self.dWorkbooks = {}, {}
+
 class CheckInputs:
     """
-    Check the tbls dataframes for errors
-    (dummy initialization of preflight check)
+    Check the tbls dataframes for errors. Preflight engine tallies each rule
+    for all of a table's listed columns in one vectorized step:
+    * required -- tbl.required_cols are present
+    * numeric -- tbl.numeric_cols values are numbers (or blank)
+    * populated -- tbl.populated_cols have a non-blank value somewhere
+    * nonblank -- tbl.nonblank_cols have no missing or empty/whitespace str
+    Tallies are counts so that they can be summed across chunks of a table
+    (chunk_rows checks tables from tbl.IterChunks() without building .df).
+    Tables can be checked in a thread or process pool; IsFailFast stops after
+    the first table failing a rule in .lst_blocking_rules
+    JDL Modified 10/18/26 for preflight engine
     """
+    dRuleCols = {'required': 'required_cols', 'numeric': 'numeric_cols', \
+                 'populated': 'populated_cols', 'nonblank': 'nonblank_cols'}
+    cols_tally = ['table', 'rule', 'column', 'n_rows', 'n_nonnull', 'n_fail', \
+                  'IsMissing']
+
     def __init__(self, tbls, IsPrint=True):
         self.tbls = tbls
         self.IsPrint = IsPrint
 
         #preflight.CheckDataFrame Class --instanced as needed in methods below
-        self.ckdf = None    
+        self.ckdf = None
+
+        #Consolidated results (one row per table, rule and listed column)
+        self.df_results = None
+
+        #Rules whose failure stops IsFailFast checks; names of tables not
+        #checked after stopping
+        self.lst_blocking_rules = list(self.dRuleCols.keys())
+        self.lst_unchecked = []
+
+    @property
+    def IsPass(self):
+        """
+        True if all checks in .df_results pass
+        JDL 10/18/26
+        """
+        return bool(self.df_results['IsPass'].all())
+    """
+    ================================================================================
+    """
+    def CheckTablesProcedure(self, lst_tbls=None, workers=None, IsProcess=False, \
+                             IsFailFast=False, chunk_rows=None):
+        """
+        Check all tables (default is tables with listed columns) in one
+        batch. Returns consolidated result DataFrame (also .df_results).
+        workers > 1 checks tables in a thread (or if IsProcess, process) pool.
+        chunk_rows checks chunks of rows from tbl.IterChunks()
+        JDL 10/18/26
+        """
+        if lst_tbls is None: lst_tbls = self.ListCheckTables()
+        dTallies = self.TallyTables(lst_tbls, workers, IsProcess, IsFailFast, \
+                                    chunk_rows)
+
+        #Results in table order; list tables skipped by IsFailFast
+        lst_tallies = [dTallies[i] for i in range(len(lst_tbls)) if i in dTallies]
+        self.lst_unchecked = [tbl.name for i, tbl in enumerate(lst_tbls) \
+                              if i not in dTallies]
+        self.df_results = self.ResultsFromTallies(lst_tallies)
+        self.PrintFailures()
+        return self.df_results
+
+    def TallyTables(self, lst_tbls, workers=None, IsProcess=False, IsFailFast=False, \
+                    chunk_rows=None):
+        """
+        Return dict of tally DataFrames keyed by position in lst_tbls (process
+        workers are sent each table's CheckSpec). If IsFailFast, stop at the
+        first blocking failure and cancel checks that have not started
+        JDL 10/18/26; Modified 10/18/26 to send check specs to processes
+        """
+        dTallies = {}
+        if workers is None or workers <= 1 or len(lst_tbls) <= 1:
+            for i, tbl in enumerate(lst_tbls):
+                dTallies[i] = self.TallyTableProcedure(tbl, chunk_rows)
+                if IsFailFast and self.IsBlocking(dTallies[i]): break
+            return dTallies
+
+        Executor = ProcessPoolExecutor if IsProcess else ThreadPoolExecutor
+        executor = Executor(max_workers=workers)
+        try:
+            if IsProcess:
+                dFutures = {executor.submit(TallySpecChecks, \
+                                CheckSpec(tbl, chunk_rows), chunk_rows): i \
+                            for i, tbl in enumerate(lst_tbls)}
+            else:
+                dFutures = {executor.submit(TallyTableChecks, tbl, chunk_rows): i \
+                            for i, tbl in enumerate(lst_tbls)}
+            for future in as_completed(dFutures):
+                dTallies[dFutures[future]] = future.result()
+                if IsFailFast and self.IsBlocking(future.result()): break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return dTallies
+
+    def IsBlocking(self, df_tally):
+        """
+        True if a table's tallies fail any rule in self.lst_blocking_rules
+        JDL 10/18/26
+        """
+        fil = df_tally['rule'].isin(self.lst_blocking_rules)
+        return bool((~self.TallyIsPass(df_tally[fil])).any())
+
+    def TallyIsPass(self, df_tally):
+        """
+        Return boolean Series of whether each tally row passes
+        JDL 10/18/26
+        """
+        IsPopulated = (df_tally['rule'] != 'populated') | (df_tally['n_nonnull'] > 0)
+        return ~df_tally['IsMissing'].astype(bool) & (df_tally['n_fail'] == 0) & \
+            IsPopulated
+
+    def ListCheckTables(self):
+        """
+        Return list of tbls' import and output tables with any rule columns
+        JDL 10/18/26
+        """
+        lst_tbls = self.tbls.lstImports + self.tbls.lstRawImports + self.tbls.lstOutputs
+        return [tbl for tbl in lst_tbls if any(len(getattr(tbl, attr)) > 0 \
+                                               for attr in self.dRuleCols.values())]
+
+    def TallyTableProcedure(self, tbl, chunk_rows=None):
+        """
+        Return tallies for tbl.df or (if chunk_rows) merged tallies of the
+        chunks from tbl.IterChunks()
+        JDL 10/18/26
+        """
+        if chunk_rows is None: return self.TallyTable(tbl)
+
+        lst_tallies = [self.TallyTable(tbl, df) for df in tbl.IterChunks(chunk_rows)]
+        if len(lst_tallies) == 0: return self.TallyTable(tbl, pd.DataFrame())
+        return self.MergeTallies(lst_tallies)
+
+    def TallyTable(self, tbl, df=None):
+        """
+        Return DataFrame of rule tallies for tbl.df (or df --e.g. a chunk of
+        the table). Named index (e.g. tbl.idx_col_name) is checked as a column
+        JDL 10/18/26
+        """
+        if df is None: df = tbl.df
+        if df.index.name is not None and df.index.name not in df.columns:
+            df = df.reset_index()
+
+        #Non-blank counts for all listed columns in one step
+        lst_cols = [c for attr in self.dRuleCols.values() for c in getattr(tbl, attr)]
+        cols_present = [c for c in dict.fromkeys(lst_cols) if c in df.columns]
+        ser_nonnull = df[cols_present].notna().sum()
+
+        lst_tallies = []
+        for rule, attr in self.dRuleCols.items():
+            cols = list(getattr(tbl, attr))
+            if len(cols) == 0: continue
+            df_tally = pd.DataFrame({'column': cols, 'n_rows': len(df)})
+            df_tally['n_nonnull'] = df_tally['column'].map(ser_nonnull).fillna(0)
+            df_tally['n_fail'] = 0
+            df_tally['IsMissing'] = ~df_tally['column'].isin(df.columns)
+
+            #Tally fails for present columns with one operation per rule
+            cols_present = [c for c in cols if c in df.columns]
+            if rule in ('numeric', 'nonblank') and len(cols_present) > 0:
+                ser_fail = self.TallyRule(rule, df[cols_present])
+                df_tally['n_fail'] = df_tally['column'].map(ser_fail).fillna(0)
+            df_tally.insert(0, 'rule', rule)
+            df_tally.insert(0, 'table', tbl.name)
+            lst_tallies.append(df_tally)
+
+        if len(lst_tallies) == 0: return pd.DataFrame(columns=self.cols_tally)
+        return pd.concat(lst_tallies, ignore_index=True).astype( \
+            {'n_nonnull': 'int64', 'n_fail': 'int64'})
+
+    def TallyRule(self, rule, df):
+        """
+        Return Series of failing value counts by column of df for a rule
+        JDL 10/18/26
+        """
+        if rule == 'numeric': return self.TallyNonNumeric(df)
+        if rule == 'nonblank': return df.isna().sum() + self.TallyBlankStr(df)
+        raise ValueError(f"Unknown preflight rule {rule}")
+
+    def TallyNonNumeric(self, df):
+        """
+        Count non-blank values that are not numbers with one pd.to_numeric
+        pass over df's non-numeric dtype columns
+        JDL 10/18/26
+        """
+        ser_fail = pd.Series(0, index=df.columns, dtype='int64')
+        IsCheck = [not pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes]
+        if not any(IsCheck): return ser_fail
+
+        #Column-major values of columns to check
+        vals = df.loc[:, IsCheck].to_numpy(dtype=object).ravel(order='F')
+        IsNum = pd.to_numeric(pd.Series(vals), errors='coerce').notna().to_numpy()
+        IsFail = ~IsNum & pd.notna(vals)
+        ser_fail[IsCheck] = IsFail.reshape(sum(IsCheck), len(df)).sum(axis=1)
+        return ser_fail
+
+    def TallyBlankStr(self, df):
+        """
+        Count empty or whitespace-only str values with one .str pass over
+        df's object/str dtype columns
+        JDL 10/18/26
+        """
+        ser_blank = pd.Series(0, index=df.columns, dtype='int64')
+        IsCheck = [not pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes]
+        if not any(IsCheck): return ser_blank
+
+        vals = df.loc[:, IsCheck].to_numpy(dtype=object).ravel(order='F')
+        try:
+            IsBlank = pd.Series(vals).str.strip().eq('').to_numpy()
+        except AttributeError: #No str values
+            return ser_blank
+        ser_blank[IsCheck] = IsBlank.reshape(sum(IsCheck), len(df)).sum(axis=1)
+        return ser_blank
+
+    def ResultsFromTallies(self, lst_tallies):
+        """
+        Merge tallies (summing chunks of the same table) and add IsPass
+        JDL 10/18/26
+        """
+        df = self.MergeTallies(lst_tallies)
+        df['IsPass'] = self.TallyIsPass(df).astype(bool)
+        return df
+
+    def MergeTallies(self, lst_tallies):
+        """
+        Sum counts of tallies for the same table, rule and column (e.g. chunks);
+        a column is missing if missing from any chunk
+        JDL 10/18/26
+        """
+        lst_tallies = [df for df in lst_tallies if len(df) > 0]
+        if len(lst_tallies) == 0: return pd.DataFrame(columns=self.cols_tally)
+
+        df = pd.concat(lst_tallies, ignore_index=True)
+        return df.groupby(['table', 'rule', 'column'], sort=False).agg( \
+            n_rows=('n_rows', 'sum'), n_nonnull=('n_nonnull', 'sum'), \
+            n_fail=('n_fail', 'sum'), IsMissing=('IsMissing', 'any')).reset_index()
+
+    def PrintFailures(self):
+        """
+        If self.IsPrint, print failed checks
+        JDL 10/18/26
+        """
+        if not self.IsPrint: return
+        df_fail = self.df_results[~self.df_results['IsPass']]
+        if len(df_fail) == 0:
+            print('\nPreflight checks passed')
+        else:
+            print('\nPreflight check failures\n', df_fail)
+        if len(self.lst_unchecked) > 0:
+            print('\nPreflight stopped before checking', self.lst_unchecked)
+
+def TallyTableChecks(tbl, chunk_rows=None):
+    """
+    Return CheckInputs rule tallies for one table (module-level so that
+    CheckInputs can run it in a process pool)
+    JDL 10/18/26
+    """
+    return CheckInputs(None, IsPrint=False).TallyTableProcedure(tbl, chunk_rows)
+
+def CheckSpec(tbl, chunk_rows=None):
+    """
+    Return dict of what a process pool worker needs to check tbl: name, rule
+    column lists and .df --or the table's ImportSpec if the worker reads the
+    data from the source itself (chunk_rows or a lazy table not yet imported)
+    JDL 10/18/26
+    """
+    dSpec = {attr: list(getattr(tbl, attr)) for attr in CheckInputs.dRuleCols.values()}
+    dSpec.update({'name': tbl.name, 'df': None, 'import': None, \
+                  'lazy_import': tbl.lazy_import})
+    IsSource = bool(tbl.pf) and tbl.sht is not None and tbl.sht != ''
+    if IsSource and (chunk_rows is not None or tbl._df is None):
+        dSpec['import'] = ImportSpec(tbl)
+    else:
+        dSpec['df'] = tbl.df
+    return dSpec
+
+def TallySpecChecks(dSpec, chunk_rows=None):
+    """
+    Process pool worker: return CheckInputs rule tallies for a table's
+    CheckSpec() dict
+    JDL 10/18/26
+    """
+    if dSpec['import'] is not None:
+        tbl = TableFromImportSpec(dSpec['import'])
+        tbl.SetLazy(dSpec['lazy_import'])
+    else:
+        tbl = Table('', dSpec['name'], None, None)
+        tbl.df = dSpec['df']
+    for attr in CheckInputs.dRuleCols.values(): setattr(tbl, attr, dSpec[attr])
+    return TallyTableChecks(tbl, chunk_rows)
+
+"""
+================================================================================
+FlagIndex Class - sorted row positions of flag values in a df_raw column
+================================================================================
+"""
+class FlagIndex():
+    """
+    Built with one pd.factorize pass over a column. Row positions of a flag
+    value (or '<blank>' for blank cells) are a slice of the stably sorted
+    codes (cached per flag) so each lookup is a binary search instead of a
+    column scan
+    JDL 10/18/26
+    """
+    def __init__(self, ser):
+        self.codes, uniques = pd.factorize(ser)
+        self.uniques = pd.Index(uniques)
+
+        #Row positions ordered by code (blank cells' code -1 first)
+        self.order = np.argsort(self.codes, kind='stable')
+        self.codes_sorted = self.codes[self.order]
+        self.dPositions = {}
+
+    def Positions(self, flag):
+        """
+        Return sorted array of row positions whose value is flag
+        JDL 10/18/26
+        """
+        if flag not in self.dPositions:
+            code = -1 if flag == '<blank>' else self.uniques.get_indexer([flag])[0]
+            if code == -1 and flag != '<blank>':
+                self.dPositions[flag] = np.array([], dtype=np.intp)
+            else:
+                istart, iend = np.searchsorted(self.codes_sorted, [code, code + 1])
+                self.dPositions[flag] = self.order[istart:iend]
+        return self.dPositions[flag]
+
+    def NextPositions(self, flag, ipos_search):
+        """
+        Return array of the first flag position at or below each search
+        position (or the search position itself if there is none)
+        JDL 10/18/26
+        """
+        positions = self.Positions(flag)
+        ipos_search = np.asarray(ipos_search, dtype=np.intp)
+        ipos = np.searchsorted(positions, ipos_search)
+        IsFound = ipos < len(positions)
+        ipos_next = ipos_search.copy()
+        ipos_next[IsFound] = positions[ipos[IsFound]]
+        return ipos_next
 
 """
 ================================================================================
@@ -198,8 +1430,10 @@ class RowMajorTbl():
     """
     def __init__(self, tbl):
 
-        #List of df indices for rows where flag_start_bound is found
+        #List of df indices for rows where flag_start_bound is found and
+        #corresponding flag_end_bound rows
         self.start_bound_indices = []
+        self.end_bound_indices = []
 
         #Raw DataFrame and column list parsed from raw data
         self.df_raw = tbl.df_raw
@@ -214,57 +1448,177 @@ class RowMajorTbl():
         self.idx_end_bound = None
         self.idx_start_data = None
 
+        #FlagIndex instances for df_raw's bound columns (keyed by icol)
+        self.dFlagIndexes = {}
+
+        #All blocks' first data row indices and number of parsed rows
+        self.lst_idx_start_data = []
+        self.lst_block_lengths = []
+
         #Current block's columns and parsed data
         self.cols_df_block = []
         self.df_block = pd.DataFrame()
     """
     ================================================================================
     """
+    @ProfileStage('df_raw', 'tbl._df')
     def ReadBlocksProcedure(self):
         """
-        Procedure to iteratively parse row major blocks
-        JDL 9/26/24
+        Procedure to parse row major blocks
+        JDL 9/26/24; Modified 10/18/26 to parse blocks as a batch
         """
+        #Use tbl.cache's parsed result if source is unchanged
+        if self.LoadCachedParse(): return
+
         # Append blank row at end of .df_raw (to ensure find last <blank> flag)
         self.AddTrailingBlankRow()
 
-        #Create list of row indices with start bound flag
+        #Create lists of row indices with start and end bound flags
         self.SetStartBoundIndices()
+        self.SetEndBoundIndices()
 
-        #Iteratively read blocks 
-        for i in self.start_bound_indices:
-            self.idx_start_current = i
-            self.ParseBlockProcedure()
+        #Parse all blocks and concatenate to tbl.df in one step
+        self.ParseBlocksBatch()
 
-        #Extract block_id values if specified
+        #Extract each block's block_id values if specified
         self.tbl.df, self.lst_block_ids = RowMajorBlockID(self.tbl, \
-                                        self.idx_start_data).ExtractBlockIDs
+            self.lst_idx_start_data, self.lst_block_lengths).ExtractBlockIDs
 
-        #set default index
+        #set storage mode and default index
+        self.ApplyStorage()
         self.SetDefaultIndex()
 
         #Optionally stack parsed data (if .dParams['is_stack_parsed_cols']
         self.StackParsedCols()
+        self.tbl.SaveCached('parsed')
+
+    def LoadCachedParse(self):
+        """
+        Set tbl.df from tbl.cache's parsed entry if current and return True
+        JDL 10/18/26
+        """
+        if not self.tbl.LoadCached('parsed'): return False
+        self.SetBlockIDNames()
+        return True
+
+    def SetBlockIDNames(self):
+        """
+        Set self.lst_block_ids from tbl.dParseParams['block_id_vars']
+        JDL 10/18/26
+        """
+        RowMajorBlockID(self.tbl, None).ConvertTupleToList()
+        lst_vars = self.tbl.dParseParams.get('block_id_vars', [])
+        self.lst_block_ids = [tup[0] for tup in lst_vars]
 
     def AddTrailingBlankRow(self):
         """
         Add a trailing blank row to self.df_raw (to ensure last <blank> flag to
-        terminate last block)
-        JDL 9/26/24
+        terminate last block). Reindex keeps Arrow dtypes (null row)
+        JDL 9/26/24; Modified 10/18/26 to reindex instead of concat
+        """
+        df_raw = self.df_raw.reset_index(drop=True)
+        self.df_raw = df_raw.reindex(pd.RangeIndex(len(df_raw) + 1))
+
+    def FlagIndexForCol(self, icol):
+        """
+        Return FlagIndex of df_raw column icol (built once per df_raw)
+        JDL 10/18/26
         """
-        blank_row = pd.Series([np.nan] * len(self.df_raw.columns), index=self.df_raw.columns)
-        self.df_raw = pd.concat([self.df_raw, pd.DataFrame([blank_row])], ignore_index=True)
+        df_raw, flag_index = self.dFlagIndexes.get(icol, (None, None))
+        if df_raw is not self.df_raw:
+            flag_index = FlagIndex(self.df_raw.iloc[:, icol])
+            self.dFlagIndexes[icol] = (self.df_raw, flag_index)
+        return flag_index
 
+    @ProfileStage('df_raw', 'start_bound_indices')
     def SetStartBoundIndices(self):
         """
         Populate list of row indices whereflag_start_bound is found
-        JDL 9/25/24
+        JDL 9/25/24; Modified 10/18/26 to use FlagIndex
         """
         flag= self.tbl.dParseParams['flag_start_bound']
         icol = self.tbl.dParseParams['icol_start_bound']
 
-        fil = self.df_raw.iloc[:, icol] == flag
-        self.start_bound_indices = self.df_raw[fil].index.tolist()
+        positions = self.FlagIndexForCol(icol).Positions(flag)
+        self.start_bound_indices = self.df_raw.index[positions].tolist()
+
+    @ProfileStage('start_bound_indices', 'end_bound_indices')
+    def SetEndBoundIndices(self):
+        """
+        Populate list of end bound row indices (one per start bound) with
+        FlagIndex lookups. Matches FindFlagEndBound's result including the
+        search row itself if no flag is found below it
+        JDL 10/18/26
+        """
+        flag = self.tbl.dParseParams['flag_end_bound']
+        icol = self.tbl.dParseParams['icol_end_bound']
+        ioffset = self.tbl.dParseParams['idata_rowoffset_from_flag']
+
+        #First flag at or below each block's first data row
+        idx_search = np.array(self.start_bound_indices, dtype=int) + ioffset
+        ipos_ends = self.FlagIndexForCol(icol).NextPositions(flag, idx_search)
+        self.end_bound_indices = self.df_raw.index[ipos_ends].tolist()
+
+    @ProfileStage('df_raw', 'tbl._df')
+    def ParseBlocksBatch(self):
+        """
+        Parse all blocks based on start/end bound lists and concatenate them to
+        tbl.df with one concat. If tbl.import_col_map selects columns and all
+        blocks share a header, gather all data rows with one NumPy index.
+        Sets each block's first data row and parsed row count for block_ids
+        JDL 10/18/26
+        """
+        if len(self.start_bound_indices) == 0: return
+        iheader_offset = self.tbl.dParseParams['iheader_rowoffset_from_flag']
+        idata_offset = self.tbl.dParseParams['idata_rowoffset_from_flag']
+
+        idx_starts = np.array(self.start_bound_indices, dtype=int)
+        idx_headers, idx_data = idx_starts + iheader_offset, idx_starts + idata_offset
+        df_headers = self.df_raw.iloc[idx_headers]
+
+        #Single gather if blocks' headers (and therefore columns) match
+        if len(self.tbl.import_col_map) > 0 and len(df_headers.drop_duplicates()) == 1:
+            lengths = np.maximum(np.array(self.end_bound_indices) - idx_data, 0)
+            offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            self.idx_header_row = int(idx_headers[0])
+            self.cols_df_block = df_headers.iloc[0].values
+            self.df_block = self.df_raw.iloc[np.repeat(idx_data, lengths) + offsets]
+            self.SubsetCols()
+            self.RenameCols()
+            lst_blocks = [self.df_block]
+            self.lst_block_lengths = lengths.tolist()
+
+        #Otherwise subset and rename each block's columns based on its header
+        else:
+            lst_blocks = []
+            for i, idx_end in zip(self.start_bound_indices, self.end_bound_indices):
+                self.idx_start_current, self.idx_end_bound = i, idx_end
+                self.ReadHeader()
+                self.SubsetDataRows()
+                self.SubsetCols()
+                self.RenameCols()
+                lst_blocks.append(self.df_block)
+            self.lst_block_lengths = [len(df) for df in lst_blocks]
+
+        #First data rows (used by RowMajorBlockID) and last block's
+        self.lst_idx_start_data = idx_data.tolist()
+        self.idx_start_data = int(idx_data[-1])
+        self.tbl.df = pd.concat([self.tbl.df] + lst_blocks, axis=0)
+        self.df_block = pd.DataFrame()
+
+    def ApplyStorage(self):
+        """
+        Convert parsed tbl.df to Arrow dtypes if tbl.storage is 'arrow'. Types
+        are inferred per parsed column first so numbers stay numeric: object
+        columns by infer_objects and (unless import_dtype forces str) Arrow
+        string columns parsed from mixed-type .df_raw columns by
+        pd_util.dfArrowStrToNumeric
+        JDL 10/18/26; Modified 10/18/26 for Arrow .df_raw
+        """
+        if self.tbl.storage != 'arrow': return
+        df = self.tbl.df.infer_objects()
+        if self.tbl.import_dtype is None: df = pd_util.dfArrowStrToNumeric(df)
+        self.tbl.df = pd_util.dfToArrow(df)
 
     def SetDefaultIndex(self):
         """
@@ -273,20 +1627,36 @@ class RowMajorTbl():
         """
         self.tbl.df = self.tbl.df.set_index(self.tbl.idx_col_name)
     
+    @ProfileStage('tbl._df', 'tbl._df')
     def StackParsedCols(self):
         """
-        Optionally stack parsed columns from row major blocks
-        JDL 9/25/24
+        Optionally stack parsed columns from row major blocks to long format
+        (index, 'Metric', 'Value') with blanks dropped (same rows as .stack()).
+        Built with one gather of the non-blank values (no MultiIndex or reset
+        copies). Metric is categorical; Value keeps the columns' dtype if they
+        share one (else their common NumPy dtype or Arrow type per tbl.storage)
+        JDL 9/25/24; Modified 10/18/26 to stack without intermediate frames
         """
         is_stack = self.tbl.dParseParams.get('is_stack_parsed_cols', False)
+        if not is_stack: return
 
-        if is_stack:
-            self.tbl.df = self.tbl.df.stack().reset_index()
+        #Row/column positions of non-blank values in row-major (stack) order
+        df = self.tbl.df
+        values = df.to_numpy()
+        irows, icols = np.nonzero(pd.notna(values))
 
-            #Respecify the index column name and set default index
-            self.tbl.df.columns = [self.tbl.idx_col_name, 'Metric', 'Value']
-            self.SetDefaultIndex()
+        #Categorical Metric from column positions
+        codes_cols, metrics = pd.factorize(df.columns)
+        metric = pd.Categorical.from_codes(codes_cols[icols], categories=metrics)
 
+        value = values[irows, icols]
+        if df.dtypes.nunique() == 1: value = pd.array(value, dtype=df.dtypes.iloc[0])
+
+        idx = df.index.take(irows).rename(self.tbl.idx_col_name)
+        self.tbl.df = pd.DataFrame({'Metric': metric, 'Value': value}, index=idx)
+        self.ApplyStorage()
+
+    @ProfileStage('df_raw', 'tbl._df')
     def ParseBlockProcedure(self):
         """
         Parse the table and set self.df resulting DataFrame
@@ -305,7 +1675,7 @@ class RowMajorTbl():
     def FindFlagEndBound(self):
         """
         Find index of flag_end_bound
-        JDL 3/4/24; modified 9/26/24
+        JDL 3/4/24; modified 9/26/24; Modified 10/18/26 to use FlagIndex
         """
         flag = self.tbl.dParseParams['flag_end_bound']
         icol = self.tbl.dParseParams['icol_end_bound']
@@ -314,11 +1684,9 @@ class RowMajorTbl():
         #Start the search at the first data row based on data offset from flag
         i = self.idx_start_current + ioffset
 
-        # search for specifie flag string/<blank> below row i
-        if flag == '<blank>':
-            self.idx_end_bound = self.df_raw.iloc[i:, icol].isnull().idxmax()
-        else:
-            self.idx_end_bound = self.df_raw.iloc[i:, icol].eq(flag).idxmax()
+        # search for specified flag string/<blank> at or below row i
+        ipos_end = self.FlagIndexForCol(icol).NextPositions(flag, [i])[0]
+        self.idx_end_bound = self.df_raw.index[ipos_end]
 
     def ReadHeader(self):
         """
@@ -368,21 +1736,206 @@ class RowMajorTbl():
         if len(self.tbl.import_col_map) > 0:
             self.df_block.rename(columns=self.tbl.import_col_map, inplace=True)
 
+"""
+================================================================================
+RowMajorStreamTbl Class - parse row major raw data while streaming rows
+================================================================================
+"""
+class RowMajorStreamTbl(RowMajorTbl):
+    """
+    Streaming variant of RowMajorTbl that runs the start flag/header/data/end
+    bound parse (same tbl.dParseParams keys) directly over a row iterator
+    --by default tbl.IterExcelRaw()-- so .df_raw is never built. .IterBlocks()
+    yields each parsed block (with its own block_id values) when its end
+    bound is reached. Values match RowMajorTbl; dtypes are inferred per block
+    JDL 10/18/26
+    """
+    def __init__(self, tbl, rows=None):
+        super().__init__(tbl)
+
+        #Iterable of row tuples (default is sheet's read-only row iterator)
+        self.rows = rows
+
+        #Blocks whose end bound is not yet found (dicts in start order) and
+        #recent rows kept for header/block_id offsets above start flag
+        self.lst_open_blocks = []
+        self.buffer = deque()
+        self.n_lookback = 0
+    """
+    ================================================================================
+    """
+    @ProfileStage(None, 'tbl._df')
+    def ReadBlocksProcedure(self):
+        """
+        Procedure to stream and parse all blocks to tbl.df
+        JDL 10/18/26
+        """
+        if self.LoadCachedParse(): return
+
+        lst_blocks = list(self.IterBlocks())
+        if len(lst_blocks) > 0:
+            self.tbl.df = pd.concat([self.tbl.df] + lst_blocks, axis=0)
+
+        #set storage mode, default index and optionally stack parsed data
+        self.ApplyStorage()
+        self.SetDefaultIndex()
+        self.StackParsedCols()
+        self.tbl.SaveCached('parsed')
+
+    def IterBlocks(self):
+        """
+        Generator of parsed block DataFrames (emitted in start bound order)
+        JDL 10/18/26
+        """
+        self.SetBlockIDNames()
+        self.SetLookback()
+        rows = self.tbl.IterExcelRaw() if self.rows is None else self.rows
+
+        irow, width = 0, 0
+        for irow, row in enumerate(rows):
+            width = max(width, len(row))
+            yield from self.ProcessRow(irow, row)
+            self.buffer.append((irow, row))
+            if len(self.buffer) > self.n_lookback: self.buffer.popleft()
+
+        #Trailing blank row terminates last <blank>-bounded block; blocks
+        #still open end at their first data row (as in FindFlagEndBound)
+        irow_end = irow + 1 if width > 0 else 0
+        yield from self.ProcessRow(irow_end, (None,) * width)
+        for block in self.lst_open_blocks:
+            block['IsClosed'], block['rows'] = True, []
+        yield from self.EmitClosedBlocks()
+
+
+    def SetLookback(self):
+        """
+        Set number of rows above a start flag to keep for header and block_id
+        row offsets that point above it
+        JDL 10/18/26
+        """
+        iheader_offset = self.tbl.dParseParams['iheader_rowoffset_from_flag']
+        idata_offset = self.tbl.dParseParams['idata_rowoffset_from_flag']
+        lst_offsets = [0, iheader_offset]
+        lst_offsets += [idata_offset + tup[1] for tup in \
+                        self.tbl.dParseParams.get('block_id_vars', [])]
+        self.n_lookback = max(0, -min(lst_offsets))
+
+    def ProcessRow(self, irow, row):
+        """
+        Open a block if row has start flag; update open blocks with row and
+        yield any blocks completed by it
+        JDL 10/18/26
+        """
+        flag = self.tbl.dParseParams['flag_start_bound']
+        icol = self.tbl.dParseParams['icol_start_bound']
+        if icol < len(row) and row[icol] == flag: self.OpenBlock(irow)
+
+        for block in self.lst_open_blocks:
+            if not block['IsClosed']: self.UpdateBlock(block, irow, row)
+        yield from self.EmitClosedBlocks()
+
+    def OpenBlock(self, irow):
+        """
+        Add dict for a new block at start flag row irow; fill header and
+        block_id values that are in buffered rows above it
+        JDL 10/18/26
+        """
+        idx_data = irow + self.tbl.dParseParams['idata_rowoffset_from_flag']
+        block = {'idx_start': irow, 'idx_data': idx_data, 'rows': [], \
+                 'IsClosed': False, 'header': None, 'ids': {}, \
+                 'idx_header': irow + self.tbl.dParseParams['iheader_rowoffset_from_flag'], \
+                 'id_locs': [(idx_data + tup[1], tup[0], tup[2]) for tup in \
+                             self.tbl.dParseParams.get('block_id_vars', [])]}
+        for irow_buf, row_buf in self.buffer: self.SetBlockRowValues(block, irow_buf, row_buf)
+        self.lst_open_blocks.append(block)
+
+    def UpdateBlock(self, block, irow, row):
+        """
+        Add row to block's header, block_id values or data; close the block
+        at its end bound
+        JDL 10/18/26
+        """
+        self.SetBlockRowValues(block, irow, row)
+        if irow < block['idx_data']: return
+
+        flag = self.tbl.dParseParams['flag_end_bound']
+        icol = self.tbl.dParseParams['icol_end_bound']
+        value = row[icol] if icol < len(row) else None
+        IsEnd = pd.isna(value) if flag == '<blank>' else value == flag
+        if IsEnd:
+            block['IsClosed'] = True
+        else:
+            block['rows'].append(row)
+
+    def SetBlockRowValues(self, block, irow, row):
+        """
+        Set block's header and block_id values if irow is one of their rows
+        JDL 10/18/26
+        """
+        if irow == block['idx_header']: block['header'] = row
+        for irow_id, name, icol in block['id_locs']:
+            if irow == irow_id: block['ids'][name] = row[icol]
+
+    def EmitClosedBlocks(self):
+        """
+        Yield parsed DataFrames for closed blocks at front of open list
+        JDL 10/18/26
+        """
+        while len(self.lst_open_blocks) > 0 and self.lst_open_blocks[0]['IsClosed']:
+            yield self.ParseStreamBlock(self.lst_open_blocks.pop(0))
+
+    def ParseStreamBlock(self, block):
+        """
+        Build block's DataFrame (rows padded to header width) then subset/rename
+        columns and add block_id columns first (same steps as
+        RowMajorTbl.ParseBlockProcedure)
+        JDL 10/18/26; Modified 10/18/26 to pad rows shorter than header
+        """
+        header = tuple(block['header'] or ())
+        width = max([len(row) for row in block['rows']] + [len(header)])
+        header += (None,) * (width - len(header))
+        idx_data = block['idx_data']
+
+        #Pad short rows (e.g. openpyxl rows from sheets with no <dimension>)
+        rows = [tuple(row) + (None,) * (width - len(row)) for row in block['rows']]
+
+        self.idx_start_current, self.idx_start_data = block['idx_start'], idx_data
+        self.idx_header_row = block['idx_header']
+        self.idx_end_bound = idx_data + len(block['rows'])
+        self.cols_df_block = np.array(header, dtype=object)
+        self.df_block = pd.DataFrame(rows, columns=range(width), \
+                            index=range(idx_data, self.idx_end_bound))
+        if self.tbl.import_dtype == 'string[pyarrow]':
+            self.df_block = self.df_block.astype(self.tbl.import_dtype)
+        self.SubsetCols()
+        self.RenameCols()
+
+        #Block_id columns first with this block's values
+        df_block, self.df_block = self.df_block, pd.DataFrame()
+        if len(self.lst_block_ids) == 0: return df_block
+        dIDs = {name: block['ids'].get(name) for name in self.lst_block_ids}
+        df_ids = pd.DataFrame(dIDs, index=df_block.index)
+        return pd.concat([df_ids, df_block], axis=1)
+
 """
 ================================================================================
 RowMajorBlockID Class - sub to RowMajorTbl for extracting block_id values
 ================================================================================
 """
 class RowMajorBlockID:
-    def __init__(self, tbl, idx_start_data):
+    """
+    Add block_id columns to a parsed tbl.df. idx_start_data is first data row
+    of one block or list for all blocks with block_lengths (list of each
+    block's number of rows in tbl.df). A single block applies to all of tbl.df
+    JDL 9/27/24; Modified 10/18/26 for multiple blocks; removed single-block
+    SetBlockIDValue/ReorderColumns
+    """
+    def __init__(self, tbl, idx_start_data, block_lengths=None):
         self.tbl = tbl
         self.idx_start_data = idx_start_data
-
-        #Within loop value for a block ID
-        self.block_id_value = None
+        self.block_lengths = block_lengths
 
         #List of all block_id names
-        self.df_cols_initial = self.tbl.df.columns.tolist()
         self.block_id_names = []
 
     @property
@@ -396,21 +1949,54 @@ class RowMajorBlockID:
     """
     ============================================================================
     """
+    @ProfileStage('tbl._df', 'tbl._df')
     def ExtractBlockIDsProcedure(self):
         """
         Procedure to extract block ID values from df_raw based on current block's
         data row index and dict list of block_id tuples: (block_id_name, row_offset,
         col_index) where row_offset is offset from idx_start_data and col_index is 
         absolute column index where each block_id value is found.
-        JDL 9/27/24
+        Each block's value is looked up with one NumPy index per block_id and
+        repeated over the block's rows (inserted as leading tbl.df columns)
+        JDL 9/27/24; Modified 10/18/26 for per-block values
         """
         #Convert to list if specified as one-item tuple
         self.ConvertTupleToList()
+        lst_vars = self.tbl.dParseParams.get('block_id_vars', [])
+        if len(lst_vars) == 0: return
+
+        #df_raw row of each block's (rows) block_id values (cols)
+        idx_starts = np.atleast_1d(np.asarray(self.idx_start_data, dtype=int))
+        offsets = np.array([tup[1] for tup in lst_vars], dtype=int)
+        idx_rows = idx_starts[:, None] + offsets[None, :]
+        lengths = self.BlockLengths()
+
+        for j, (name, row_offset, idx_col) in enumerate(lst_vars):
+            values = self.tbl.df_raw.iloc[:, idx_col].to_numpy()[idx_rows[:, j]]
+            values = pd.Series(values).infer_objects().to_numpy()
+            self.tbl.df.insert(j, name, self.RepeatBlockValues(values, lengths))
+            self.block_id_names.append(name)
+
+    def BlockLengths(self):
+        """
+        Return array of each block's number of rows in tbl.df (all rows if
+        block_lengths not specified)
+        JDL 10/18/26
+        """
+        if self.block_lengths is None: return np.array([len(self.tbl.df)])
+        return np.asarray(self.block_lengths, dtype=int)
 
-        #Iterate through block_id tuples and add columns to tbl.df
-        for tup_block_id in self.tbl.dParseParams.get('block_id_vars', []):
-            self.SetBlockIDValue(tup_block_id)
-            self.ReorderColumns()
+    def RepeatBlockValues(self, values, lengths):
+        """
+        Repeat each block's value over its rows. Rows in tbl.df before the
+        parsed blocks (if any) are set to None
+        JDL 10/18/26
+        """
+        values_rows = np.repeat(values, lengths)
+        n_prior = len(self.tbl.df) - len(values_rows)
+        if n_prior <= 0: return values_rows
+        return np.concatenate([np.full(n_prior, None, dtype=object), \
+                               values_rows.astype(object)])
 
     def ConvertTupleToList(self):
         """
@@ -424,24 +2010,3 @@ class RowMajorBlockID:
             if isinstance(self.tbl.dParseParams['block_id_vars'], tuple):
                 self.tbl.dParseParams['block_id_vars'] = \
                     [self.tbl.dParseParams['block_id_vars']]
-            
-    def SetBlockIDValue(self, tup_block_id):
-        """
-        Set internal values based current block_id tuple
-        JDL 9/27/24
-        """
-        name, row_offset = tup_block_id[0], tup_block_id[1]
-        idx_row, idx_col = self.idx_start_data + row_offset, tup_block_id[2]
-
-        #Set the current value and add the name list
-        value_block_id = self.tbl.df_raw.iloc[idx_row, idx_col]
-        self.block_id_names.append(name)
-        self.tbl.df[name] = value_block_id
-
-    def ReorderColumns(self):
-        """
-        Reorder so that block_id columns are first
-        9/27/24
-        """
-        self.tbl.df = self.tbl.df[self.block_id_names + self.df_cols_initial]
-
@@ -0,0 +1,182 @@
+#Version 10/18/26
+#python bench_projtables.py --n_blocks 500 --rows_per_block 20 --out bench.json
+"""
+================================================================================
+Benchmarks for ProjectTables import and parse hot paths. Generates a synthetic
+row major workbook and times Table.ImportExcelDf, Table.ImportExcelRaw (with
+and without import_dtype=str), RowMajorTbl.ReadBlocksProcedure and
+RowMajorTbl.StackParsedCols separately. Peak memory of each stage is measured
+in a second (tracemalloc) pass so it does not inflate the timings. Results are
+written as JSON to compare versions
+
+JDL 10/18/26
+================================================================================
+"""
+import sys, os, json, time, platform, argparse, tracemalloc, tempfile
+import numpy as np
+import pandas as pd
+import openpyxl
+from openpyxl import Workbook
+
+# Import the classes to be benchmarked
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' + os.sep
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from projtables import Table, RowMajorTbl
+
+def WriteRowMajorWorkbook(pf, n_blocks=100, rows_per_block=10, n_cols=5, \
+                          n_block_ids=1, blank_density=0.1, seed=0):
+    """
+    Write synthetic workbook with 'raw_table' sheet of row major blocks and
+    'table' sheet with the same data as a rows/cols table. Each block has
+    n_block_ids block_id rows, a 'flag' row, a header row, data rows and a
+    blank row. Returns dParseParams and import_col_map for parsing raw_table
+    JDL 10/18/26
+    """
+    rng = np.random.default_rng(seed)
+    wb = Workbook(write_only=True)
+    ws_raw, ws_tbl = wb.create_sheet('raw_table'), wb.create_sheet('table')
+
+    cols = ['idx'] + [f'col_{i}' for i in range(1, n_cols)]
+    ws_tbl.append(cols)
+    idx = 0
+    for iblock in range(n_blocks):
+        for k in range(n_block_ids):
+            ws_raw.append([None, f'block_{iblock}_id_{k}'])
+        ws_raw.append(['flag'])
+        ws_raw.append([None] + cols)
+
+        #Data rows (idx never blank since it is the end bound column)
+        values = np.round(rng.normal(size=(rows_per_block, n_cols - 1)) * 100, 2)
+        blanks = rng.random(size=values.shape) < blank_density
+        for i in range(rows_per_block):
+            row = [idx]
+            for j, (v, IsBlank) in enumerate(zip(values[i].tolist(), blanks[i])):
+                row.append(None if IsBlank else f's{v}' if j % 2 else v)
+            ws_raw.append([None] + row)
+            ws_tbl.append(row)
+            idx += 1
+        ws_raw.append([])
+    wb.save(pf)
+
+    dParseParams = {'flag_start_bound': 'flag', 'flag_end_bound': '<blank>', \
+                    'icol_start_bound': 0, 'icol_end_bound': 1, \
+                    'iheader_rowoffset_from_flag': 1, 'idata_rowoffset_from_flag': 2}
+    dParseParams['block_id_vars'] = [(f'id_{k}', k - n_block_ids - 2, 1) \
+                                     for k in range(n_block_ids)]
+    import_col_map = {c: c for c in cols}
+    return dParseParams, import_col_map
+
+def TimeStage(fn_setup, fn_stage, repeat=3):
+    """
+    Return (min seconds, peak MB) for fn_stage(fn_setup()). Timing passes run
+    without tracemalloc; one extra pass measures peak traced memory
+    JDL 10/18/26
+    """
+    lst_seconds = []
+    for i in range(repeat):
+        obj = fn_setup()
+        t0 = time.perf_counter()
+        fn_stage(obj)
+        lst_seconds.append(time.perf_counter() - t0)
+
+    obj = fn_setup()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn_stage(obj)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(lst_seconds), peak / 2**20
+
+def RunBenchmarks(pf, dParseParams, import_col_map, repeat=3):
+    """
+    Time each import/parse stage on workbook pf. Returns list of result dicts
+    JDL 10/18/26
+    """
+    def new_table(sht, import_dtype=None, is_stack=False):
+        dParams = dict(dParseParams, is_stack_parsed_cols=is_stack)
+        tbl = Table(pf, 'TableBench', sht, 'idx', dParams, import_dtype)
+        tbl.import_col_map = dict(import_col_map)
+        return tbl
+
+    def imported_raw(is_stack=False):
+        tbl = new_table('raw_table', str, is_stack)
+        tbl.ImportExcelRaw()
+        return tbl
+
+    def parsed_row_maj():
+        row_maj = RowMajorTbl(imported_raw(is_stack=False))
+        row_maj.ReadBlocksProcedure()
+        row_maj.tbl.dParseParams['is_stack_parsed_cols'] = True
+        return row_maj
+
+    df_raw = imported_raw().df_raw
+    dStages = {}
+    dStages['ImportExcelDf'] = (lambda: new_table('table'), \
+                                lambda tbl: tbl.ImportExcelDf())
+    dStages['ImportExcelRaw'] = (lambda: new_table('raw_table'), \
+                                 lambda tbl: tbl.ImportExcelRaw())
+    dStages['ImportExcelRaw_str'] = (lambda: new_table('raw_table', str), \
+                                     lambda tbl: tbl.ImportExcelRaw())
+    dStages['ReadBlocksProcedure'] = (lambda: RowMajorTbl(SetRaw(new_table( \
+        'raw_table', str), df_raw)), lambda row_maj: row_maj.ReadBlocksProcedure())
+    dStages['StackParsedCols'] = (parsed_row_maj, \
+                                  lambda row_maj: row_maj.StackParsedCols())
+
+    lst_results = []
+    for stage, (fn_setup, fn_stage) in dStages.items():
+        seconds, peak_mb = TimeStage(fn_setup, fn_stage, repeat)
+        lst_results.append({'stage': stage, 'seconds': seconds, 'peak_mb': peak_mb})
+        print(f'{stage:<22} {seconds:10.4f} s {peak_mb:10.1f} MB')
+    return lst_results
+
+def SetRaw(tbl, df_raw):
+    """
+    Helper to set a table's .df_raw (copy) and return the table
+    JDL 10/18/26
+    """
+    tbl.df_raw = df_raw.copy()
+    return tbl
+
+def Versions():
+    """
+    Return dict of library versions for the results file
+    JDL 10/18/26
+    """
+    return {'python': platform.python_version(), 'pandas': pd.__version__, \
+            'numpy': np.__version__, 'openpyxl': openpyxl.__version__}
+
+def ParseArgs(lst_args=None):
+    """
+    Parse command line arguments for benchmark configuration
+    JDL 10/18/26
+    """
+    parser = argparse.ArgumentParser(description='Benchmark ProjTables hot paths')
+    parser.add_argument('--n_blocks', type=int, default=200)
+    parser.add_argument('--rows_per_block', type=int, default=20)
+    parser.add_argument('--n_cols', type=int, default=6)
+    parser.add_argument('--n_block_ids', type=int, default=1)
+    parser.add_argument('--blank_density', type=float, default=0.1)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--out', default='bench_output.json')
+    return parser.parse_args(lst_args)
+
+def main(lst_args=None):
+    """
+    Generate workbook, run benchmarks and write JSON results
+    JDL 10/18/26
+    """
+    args = ParseArgs(lst_args)
+    dConfig = {k: v for k, v in vars(args).items() if k not in ('out', 'repeat')}
+    with tempfile.TemporaryDirectory() as path_temp:
+        pf = os.path.join(path_temp, 'bench.xlsx')
+        dParseParams, import_col_map = WriteRowMajorWorkbook(pf, **dConfig)
+        lst_results = RunBenchmarks(pf, dParseParams, import_col_map, args.repeat)
+
+    dOutput = {'config': dConfig, 'repeat': args.repeat, 'versions': Versions(), \
+               'results': lst_results}
+    with open(args.out, 'w') as f: json.dump(dOutput, f, indent=2)
+    return dOutput
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,8 @@ from projtables import ProjectTables
 from projtables import Table
 from projtables import RowMajorTbl
 from projtables import RowMajorBlockID
+from projtables import RowMajorStreamTbl
+from projtables import FlagIndex
 
 """
 ================================================================================
@@ -119,6 +121,24 @@ def test_survey_ReadBlocksProcedure2(row_maj_tbl1_survey):
 
     if False: print_tables(row_maj_tbl1_survey)
 
+def test_survey_StackParsedCols(row_maj_tbl1_survey):
+    """
+    Stacked output matches DataFrame.stack() values with categorical Metric
+    JDL 10/18/26
+    """
+    row_maj_tbl1_survey.ReadBlocksProcedure()
+    df_wide = row_maj_tbl1_survey.tbl.df
+    df_expected = df_wide.stack().reset_index()
+    df_expected.columns = ['Answer Choices', 'Metric', 'Value']
+
+    row_maj_tbl1_survey.tbl.dParseParams['is_stack_parsed_cols'] = True
+    row_maj_tbl1_survey.StackParsedCols()
+    df = row_maj_tbl1_survey.tbl.df
+    assert isinstance(df['Metric'].dtype, pd.CategoricalDtype)
+    assert df.index.name == 'Answer Choices'
+    df_check = df.reset_index().astype({'Metric': object})
+    pd.testing.assert_frame_equal(df_check, df_expected)
+
 def test_survey_ParseBlockProcedure1(row_maj_tbl1_survey):
     """
     Parse the survey table and check the final state of the table.
@@ -229,6 +249,46 @@ def SetListFirstStartBoundIndex(row_maj_tbl1_survey):
     row_maj_tbl1_survey.idx_start_current = \
         row_maj_tbl1_survey.start_bound_indices[0]
 
+def test_survey_SetEndBoundIndices(row_maj_tbl1_survey):
+    """
+    Populate .end_bound_indices list with FlagIndex lookups (one index per
+    bound column shared by start and end bounds)
+    JDL 10/18/26
+    """
+    row_maj_tbl1_survey.AddTrailingBlankRow()
+    row_maj_tbl1_survey.SetStartBoundIndices()
+    row_maj_tbl1_survey.SetEndBoundIndices()
+    assert row_maj_tbl1_survey.end_bound_indices == [9, 18, 28]
+
+    #Check consistency with block-by-block FindFlagEndBound
+    for i, idx_end in zip(row_maj_tbl1_survey.start_bound_indices, \
+                          row_maj_tbl1_survey.end_bound_indices):
+        row_maj_tbl1_survey.idx_start_current = i
+        row_maj_tbl1_survey.FindFlagEndBound()
+        assert row_maj_tbl1_survey.idx_end_bound == idx_end
+    assert list(row_maj_tbl1_survey.dFlagIndexes.keys()) == [0]
+
+def test_FlagIndex():
+    """
+    Sorted positions per flag value and blank cells; next flag position at
+    or below search rows (search row itself if none)
+    JDL 10/18/26
+    """
+    ser = pd.Series(['flag', None, 'x', 'flag', np.nan, 'x', 'flag', 1])
+    flag_index = FlagIndex(ser)
+    assert flag_index.Positions('flag').tolist() == [0, 3, 6]
+    assert flag_index.Positions('<blank>').tolist() == [1, 4]
+    assert flag_index.Positions(1).tolist() == [7]
+    assert flag_index.Positions('missing').tolist() == []
+    assert flag_index.NextPositions('<blank>', [0, 2, 5]).tolist() == [1, 4, 5]
+    assert flag_index.NextPositions('flag', [1, 7]).tolist() == [3, 7]
+
+    #Matches column scan on pyarrow-backed column
+    pytest.importorskip('pyarrow')
+    ser_arrow = pd.Series(['flag', None, 'x', 'flag'], dtype='string[pyarrow]')
+    assert FlagIndex(ser_arrow).Positions('<blank>').tolist() == [1]
+    assert FlagIndex(ser_arrow).Positions('flag').tolist() == [0, 3]
+
 def test_survey_SetStartBoundIndices(row_maj_tbl1_survey):
     """
     Populate .start_bound_indices list of row indices where
@@ -266,6 +326,63 @@ def test_survey_tbl1_fixture(tbl1_survey):
     """
     assert tbl1_survey.df_raw.shape == (28, 4)
 
+def test_survey_calamine(tbl1_survey, files, dParseParams_tbl1_survey):
+    """
+    Raw import and parse with calamine engine match openpyxl
+    JDL 10/18/26
+    """
+    pytest.importorskip('python_calamine')
+    pf = files.path_data + 'tbl1_survey.xlsx'
+    tbl = Table(pf, 'Table1', 'raw_table', 'Answer Choices', \
+                dict(dParseParams_tbl1_survey), import_dtype=str, engine='calamine')
+    tbl.ImportExcelRaw()
+    pd.testing.assert_frame_equal(tbl.df_raw, tbl1_survey.df_raw)
+
+    RowMajorTbl(tbl).ReadBlocksProcedure()
+    RowMajorTbl(tbl1_survey).ReadBlocksProcedure()
+    pd.testing.assert_frame_equal(tbl.df, tbl1_survey.df)
+
+@pytest.mark.parametrize("IsStack", [False, True])
+def test_survey_arrow(files, dParseParams_tbl1_survey, IsStack):
+    """
+    Arrow storage: .df_raw is Arrow (mixed-type columns as Arrow strings);
+    parsed columns are typed Arrow with same values as NumPy storage.
+    Stacked Value (mixed str and numbers) is Arrow string; Metric stays
+    categorical (header labels as str)
+    JDL 10/18/26; Modified 10/18/26 for Arrow .df_raw
+    """
+    pytest.importorskip('pyarrow')
+    pf = files.path_data + 'tbl1_survey.xlsx'
+    lst_tbls = []
+    for storage in [None, 'arrow']:
+        dParams = dict(dParseParams_tbl1_survey, is_stack_parsed_cols=IsStack)
+        tbl = Table(pf, 'Table1', 'raw_table', 'Answer Choices', dParams)
+        tbl.storage = storage
+        tbl.ImportExcelRaw()
+        RowMajorTbl(tbl).ReadBlocksProcedure()
+        lst_tbls.append(tbl)
+    tbl_np, tbl_arrow = lst_tbls
+
+    assert [str(dtype) for dtype in tbl_arrow.df_raw.dtypes] == \
+        ['string[pyarrow]'] * 3 + ['double[pyarrow]']
+    assert tbl_arrow.df_raw.memory_usage(deep=True).sum() < \
+        tbl_np.df_raw.memory_usage(deep=True).sum()
+    assert str(tbl_arrow.df.index.dtype) == 'string[pyarrow]'
+    assert tbl_arrow.df.shape == tbl_np.df.shape
+    if IsStack:
+        assert isinstance(tbl_arrow.df['Metric'].dtype, pd.CategoricalDtype)
+        assert str(tbl_arrow.df['Value'].dtype) == 'string[pyarrow]'
+        #Header labels read from Arrow string .df_raw columns are str
+        assert tbl_arrow.df['Metric'].astype(str).tolist() == \
+            tbl_np.df['Metric'].astype(str).tolist()
+        return
+
+    assert str(tbl_arrow.df['Response Percent'].dtype) == 'string[pyarrow]'
+    assert str(tbl_arrow.df['Responses'].dtype) == 'int64[pyarrow]'
+    lst_dfs = [tbl.df.astype(object).where(tbl.df.notna(), None) for tbl in lst_tbls]
+    assert lst_dfs[0].values.tolist() == lst_dfs[1].values.tolist()
+    assert tbl_arrow.df.loc['Daily', 'Responses'] == 76
+
 """
 ================================================================================
 RowMajorTbl Class - for parsing row major raw data
@@ -303,6 +420,27 @@ def tbl1(files, dParseParams_tbl1):
     tbl.ImportExcelRaw()
     return tbl
 
+def test_tbl1_arrow(tbl1):
+    """
+    Arrow storage: .df_raw's mixed header/data columns are Arrow strings;
+    numeric parsed columns and index are recovered as Arrow ints (sum and
+    .loc behave as with NumPy storage)
+    JDL 10/18/26; Modified 10/18/26 for Arrow .df_raw
+    """
+    pytest.importorskip('pyarrow')
+    tbl1.storage = 'arrow'
+    tbl1.ImportExcelRaw()
+    assert all(str(dtype) == 'string[pyarrow]' for dtype in tbl1.df_raw.dtypes)
+    assert tbl1.df_raw.iloc[6].tolist()[2:] == ['1', '10', 'a']
+
+    tbl1.ParseRaw()
+    df = tbl1.df
+    assert str(df['col_1'].dtype) == 'int64[pyarrow]'
+    assert str(df['col_2'].dtype) == 'string[pyarrow]'
+    assert str(df.index.dtype) == 'int64[pyarrow]'
+    assert df['col_1'].sum() == 150
+    assert df.loc[1].tolist() == ['Stuff in C', 10, 'a']
+
 @pytest.fixture
 def row_maj_tbl1(tbl1):
     """
@@ -570,11 +708,10 @@ def test_blockids_ExtractBlockIDsProcedure2(row_maj_tbl1):
     assert all(df['stuff'] == 'Stuff in C') 
     assert all(df['stuff2'] == 'flag') 
 
-def test_blockids_ReorderColumns(row_maj_tbl1):
+def test_blockids_ExtractBlockIDsProcedure_order(row_maj_tbl1):
     """
-    If only one block_id, it can be specified as tuple; otherwise it's
-    a list of tuples.
-    JDL 9/27/24
+    Block_id columns are inserted ahead of the parsed columns
+    JDL 9/27/24; Modified 10/18/26 for ExtractBlockIDsProcedure
     """
     #Parse the block's row major data to populate .tbl.df
     create_tbl_df(row_maj_tbl1)
@@ -582,17 +719,15 @@ def test_blockids_ReorderColumns(row_maj_tbl1):
     #Instance of RowMajorBlockID
     row_maj_block_id = RowMajorBlockID(row_maj_tbl1.tbl, row_maj_tbl1.idx_start_data)
 
-    #Call methods
-    row_maj_block_id.ConvertTupleToList()
-    row_maj_block_id.SetBlockIDValue(row_maj_tbl1.tbl.dParseParams['block_id_vars'][0])
-    row_maj_block_id.ReorderColumns()
+    #Call method
+    row_maj_block_id.ExtractBlockIDsProcedure()
     assert list(row_maj_block_id.tbl.df.columns) == ['stuff', 'idx', 'col_1', 'col_2']
 
-def test_blockids_SetBlockIDValue(row_maj_tbl1):
+def test_blockids_ExtractBlockIDsProcedure_values(row_maj_tbl1):
     """
-    If only one block_id, it can be specified as tuple; otherwise it's
-    a list of tuples.
-    JDL 9/27/24
+    Block_id name is listed and its value (looked up from df_raw) is set for
+    every row of the block
+    JDL 9/27/24; Modified 10/18/26 for ExtractBlockIDsProcedure
     """
     #Parse the block's row major data to populate .tbl.df
     create_tbl_df(row_maj_tbl1)
@@ -600,13 +735,11 @@ def test_blockids_SetBlockIDValue(row_maj_tbl1):
     #Instance of RowMajorBlockID
     row_maj_block_id = RowMajorBlockID(row_maj_tbl1.tbl, row_maj_tbl1.idx_start_data)
 
-    #Call methods
-    row_maj_block_id.ConvertTupleToList()
-    row_maj_block_id.SetBlockIDValue(row_maj_tbl1.tbl.dParseParams['block_id_vars'][0])
+    #Call method
+    row_maj_block_id.ExtractBlockIDsProcedure()
 
     assert row_maj_block_id.block_id_names == ['stuff']
-    assert list(row_maj_block_id.tbl.df.columns) == ['idx', 'col_1', 'col_2', 'stuff']
-    assert all(row_maj_block_id.tbl.df['stuff'] == 'Stuff in C') 
+    assert all(row_maj_block_id.tbl.df['stuff'] == 'Stuff in C')
 
 def create_tbl_df(row_maj_tbl):
     """
@@ -633,3 +766,224 @@ def test_blockids_ConvertTupleToList(tbl1):
     row_maj_block_id.ConvertTupleToList()
     assert isinstance(tbl1.dParseParams['block_id_vars'], list)
 
+
+"""
+================================================================================
+RowMajorTbl Class - batch parsing of many blocks (synthetic df_raw)
+JDL 10/18/26
+================================================================================
+"""
+@pytest.fixture
+def tbl_blocks():
+    """
+    Table with synthetic .df_raw containing five row major blocks of varying
+    length; block_id in column 1 two rows above each block's flag
+    JDL 10/18/26
+    """
+    dParseParams = {}
+    dParseParams['flag_start_bound'] = 'flag'
+    dParseParams['flag_end_bound'] = '<blank>'
+    dParseParams['icol_start_bound'] = 0
+    dParseParams['icol_end_bound'] = 1
+    dParseParams['iheader_rowoffset_from_flag'] = 1
+    dParseParams['idata_rowoffset_from_flag'] = 2
+    dParseParams['block_id_vars'] = ('block', -4, 1)
+
+    rows = []
+    for iblock, nrows in enumerate([3, 1, 4, 2, 5]):
+        rows += [[None, f'block_{iblock}', None, None], [None] * 4]
+        rows += [['flag', None, None, None], [None, 'idx_raw', 'col #1', 'col #2']]
+        rows += [[None, iblock * 10 + i, float(i), f'v{i}'] for i in range(nrows)]
+        rows += [[None] * 4]
+
+    tbl = Table('', 'TableBlocks', '', 'idx', dParseParams)
+    tbl.import_col_map = {'idx_raw':'idx', 'col #1':'col_1', 'col #2':'col_2'}
+    tbl.df_raw = pd.DataFrame(rows)
+    return tbl
+
+def test_blocks_ParseBlocksBatch(tbl_blocks):
+    """
+    Batch parse (single gather) matches block-by-block ParseBlockProcedure
+    JDL 10/18/26
+    """
+    row_maj = RowMajorTbl(tbl_blocks)
+    row_maj.AddTrailingBlankRow()
+    row_maj.SetStartBoundIndices()
+    row_maj.SetEndBoundIndices()
+    row_maj.ParseBlocksBatch()
+    df_batch = tbl_blocks.df
+    assert len(df_batch) == 15
+    assert list(df_batch.columns) == ['idx', 'col_1', 'col_2']
+
+    tbl_blocks.df = pd.DataFrame()
+    for i in row_maj.start_bound_indices:
+        row_maj.idx_start_current = i
+        row_maj.ParseBlockProcedure()
+    pd.testing.assert_frame_equal(df_batch, tbl_blocks.df)
+
+def test_blocks_ParseBlocksBatch_headers(tbl_blocks):
+    """
+    Batch parse with per-block headers (no import_col_map)
+    JDL 10/18/26
+    """
+    tbl_blocks.import_col_map = {}
+    row_maj = RowMajorTbl(tbl_blocks)
+    row_maj.AddTrailingBlankRow()
+    row_maj.SetStartBoundIndices()
+    row_maj.SetEndBoundIndices()
+    row_maj.ParseBlocksBatch()
+    assert len(tbl_blocks.df) == 15
+    assert list(tbl_blocks.df.columns) == ['idx_raw', 'col #1', 'col #2']
+    assert row_maj.idx_start_data == row_maj.start_bound_indices[-1] + 2
+
+@pytest.mark.parametrize('IsColMap', [True, False])
+def test_blocks_ExtractBlockIDs(tbl_blocks, IsColMap):
+    """
+    Each block's rows get that block's block_id (batch gather and per-block
+    header paths) and match streaming parse values
+    JDL 10/18/26
+    """
+    if not IsColMap:
+        tbl_blocks.import_col_map, tbl_blocks.idx_col_name = {}, 'idx_raw'
+    df_raw = tbl_blocks.df_raw.copy()
+    row_maj = RowMajorTbl(tbl_blocks)
+    row_maj.ReadBlocksProcedure()
+
+    lst_expected = np.repeat([f'block_{i}' for i in range(5)], [3, 1, 4, 2, 5])
+    assert row_maj.lst_block_ids == ['block']
+    assert list(tbl_blocks.df.columns)[0] == 'block'
+    assert tbl_blocks.df['block'].tolist() == lst_expected.tolist()
+    assert row_maj.lst_block_lengths == [3, 1, 4, 2, 5]
+
+    tbl = Table('', 'TableBlocks', '', tbl_blocks.idx_col_name, \
+                dict(tbl_blocks.dParseParams))
+    tbl.import_col_map = dict(tbl_blocks.import_col_map)
+    RowMajorStreamTbl(tbl, df_raw.itertuples(index=False)).ReadBlocksProcedure()
+    assert tbl.df['block'].tolist() == tbl_blocks.df['block'].tolist()
+
+"""
+================================================================================
+RowMajorStreamTbl Class - parse row major raw data while streaming rows
+JDL 10/18/26
+================================================================================
+"""
+def test_stream_survey_ReadBlocksProcedure(tbl1_survey, files, \
+                                           dParseParams_tbl1_survey):
+    """
+    Streaming parse from sheet's row iterator matches RowMajorTbl parse
+    JDL 10/18/26
+    """
+    RowMajorTbl(tbl1_survey).ReadBlocksProcedure()
+
+    pf = files.path_data + 'tbl1_survey.xlsx'
+    tbl = Table(pf, 'Table1', 'raw_table', 'Answer Choices', \
+                dParseParams_tbl1_survey, import_dtype=str)
+    RowMajorStreamTbl(tbl).ReadBlocksProcedure()
+
+    assert tbl.df_raw.empty
+    pd.testing.assert_frame_equal(tbl.df, tbl1_survey.df)
+
+def test_stream_tbl1_ReadBlocksProcedure(files, dParseParams_tbl1):
+    """
+    Streaming parse of tbl1_raw.xlsx (block_id above the block)
+    JDL 10/18/26
+    """
+    pf = files.path_data + 'tbl1_raw.xlsx'
+    tbl = Table(pf, 'Table1', 'raw_table', 'idx', dParseParams_tbl1)
+    tbl.import_col_map = {'idx_raw':'idx', 'col #1':'col_1', 'col #2':'col_2'}
+    row_maj = RowMajorStreamTbl(tbl)
+    row_maj.ReadBlocksProcedure()
+
+    assert row_maj.lst_block_ids == ['stuff']
+    check_tbl1_values(row_maj)
+
+def test_stream_blocks_IterBlocks(tbl_blocks):
+    """
+    Yield each block with its own block_id value
+    JDL 10/18/26
+    """
+    rows = tbl_blocks.df_raw.itertuples(index=False, name=None)
+    lst_blocks = list(RowMajorStreamTbl(tbl_blocks, rows=rows).IterBlocks())
+
+    assert [len(df) for df in lst_blocks] == [3, 1, 4, 2, 5]
+    for iblock, df in enumerate(lst_blocks):
+        assert list(df.columns) == ['block', 'idx', 'col_1', 'col_2']
+        assert all(df['block'] == f'block_{iblock}')
+        assert df['idx'].tolist() == [iblock * 10 + i for i in range(len(df))]
+
+def test_stream_short_rows():
+    """
+    Data rows shorter than the header row (as openpyxl returns for sheets
+    with no <dimension> tag) are padded with blanks; result matches
+    RowMajorTbl parse of the padded rows
+    JDL 10/18/26
+    """
+    dParseParams = {'flag_start_bound': 'flag', 'flag_end_bound': '<blank>', \
+        'icol_start_bound': 0, 'icol_end_bound': 1, \
+        'iheader_rowoffset_from_flag': 1, 'idata_rowoffset_from_flag': 2}
+    rows = [('flag',), (None, 'idx', 'a', 'b'), (None, 1, 2), (None, 2, 3), ()]
+    tbl = Table('', 'TableShort', '', 'idx', dict(dParseParams))
+    RowMajorStreamTbl(tbl, rows=rows).ReadBlocksProcedure()
+
+    tbl_batch = Table('', 'TableShort', '', 'idx', dict(dParseParams))
+    tbl_batch.df_raw = pd.DataFrame([row + (None,) * (4 - len(row)) for row in rows])
+    RowMajorTbl(tbl_batch).ReadBlocksProcedure()
+    assert tbl.df['a'].tolist() == [2, 3]
+    pd.testing.assert_frame_equal(tbl.df, tbl_batch.df, check_dtype=False, \
+                                  check_index_type=False)
+
+def test_stream_blocks_OpenBlock(tbl_blocks):
+    """
+    Open a block at start flag row; block_id row comes from lookback buffer
+    JDL 10/18/26
+    """
+    row_maj = RowMajorStreamTbl(tbl_blocks, rows=[])
+    row_maj.SetBlockIDNames()
+    row_maj.SetLookback()
+    assert row_maj.n_lookback == 2
+
+    row_maj.buffer.extend([(0, (None, 'block_0', None, None)), (1, (None,) * 4)])
+    row_maj.OpenBlock(2)
+    block = row_maj.lst_open_blocks[0]
+    assert (block['idx_header'], block['idx_data']) == (3, 4)
+    assert block['ids'] == {'block': 'block_0'}
+
+"""
+================================================================================
+Synthetic row major workbook and benchmark harness (bench_projtables.py)
+JDL 10/18/26
+================================================================================
+"""
+def test_bench_WriteRowMajorWorkbook(tmp_path):
+    """
+    Generated workbook parses to n_blocks * rows_per_block rows
+    JDL 10/18/26
+    """
+    from bench_projtables import WriteRowMajorWorkbook
+    pf = str(tmp_path / 'bench.xlsx')
+    dParseParams, import_col_map = WriteRowMajorWorkbook(pf, n_blocks=3, \
+        rows_per_block=4, n_cols=4, n_block_ids=2, blank_density=0.2)
+
+    tbl = Table(pf, 'TableBench', 'raw_table', 'idx', dParseParams, import_dtype=str)
+    tbl.import_col_map = import_col_map
+    tbl.ImportExcelRaw()
+    RowMajorTbl(tbl).ReadBlocksProcedure()
+    assert len(tbl.df) == 12
+    assert list(tbl.df.columns) == ['id_0', 'id_1', 'col_1', 'col_2', 'col_3']
+    assert list(tbl.df.index[:2]) == ['0', '1']
+
+def test_bench_main(tmp_path):
+    """
+    Benchmark harness writes JSON results for each stage
+    JDL 10/18/26
+    """
+    import json
+    from bench_projtables import main
+    pf_out = str(tmp_path / 'bench.json')
+    main(['--n_blocks', '3', '--rows_per_block', '2', '--repeat', '1', '--out', pf_out])
+    with open(pf_out) as f: dOutput = json.load(f)
+
+    lst_stages = [d['stage'] for d in dOutput['results']]
+    assert lst_stages == ['ImportExcelDf', 'ImportExcelRaw', 'ImportExcelRaw_str', \
+                          'ReadBlocksProcedure', 'StackParsedCols']
+    assert dOutput['config']['n_blocks'] == 3
@@ -0,0 +1,251 @@
+#Version 10/18/26
+#python -m pytest test_pd_util.py -v -s
+import sys, os, re, zipfile
+import datetime
+import pandas as pd
+import numpy as np
+import openpyxl
+import pytest
+
+# Import the module to be tested
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' + os.sep
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+import pd_util
+
+"""
+=========================================================================
+Tests of str coercion for raw imports (Table.import_dtype=str)
+=========================================================================
+"""
+@pytest.fixture
+def df_mixed():
+    """
+    DataFrame with column types produced by openpyxl ws.values import
+    JDL 10/18/26
+    """
+    data = [['a', 1, 1.5, None, 12, True, datetime.datetime(2024, 1, 2)],
+            [None, 2, 12.0, 'b', 2.5, False, None],
+            ['c', None, None, 3, 1e20, None, datetime.datetime(2024, 3, 4)],
+            ['d', 4, float('inf'), 4.0, None, True, None]]
+    return pd.DataFrame(data)
+
+def test_dfCoerceStr(df_mixed):
+    """
+    Vectorized coercion matches elementwise CoerceStrValue
+    JDL 10/18/26
+    """
+    df_expected = df_mixed.map(pd_util.CoerceStrValue)
+    df_str = pd_util.dfCoerceStr(df_mixed)
+    assert df_str.values.tolist() == df_expected.values.tolist()
+    assert list(df_str.columns) == list(df_mixed.columns)
+    assert df_str.iloc[1, 2] == '12'
+    assert df_str.iloc[2, 4] == '100000000000000000000'
+    assert df_str.iloc[2, 1] is None
+
+def test_dfCoerceStr_float():
+    """
+    Float column: integer values without '.0', NaN to None
+    JDL 10/18/26
+    """
+    df = pd.DataFrame({0: [1.0, np.nan, 0.1, -3.0, 1e-7]})
+    lst_expected = ['1', None, '0.1', '-3', '1e-07']
+    assert pd_util.dfCoerceStr(df)[0].tolist() == lst_expected
+
+def test_dfCoerceStr_pyarrow(df_mixed):
+    """
+    Optionally return 'string[pyarrow]' dtype
+    JDL 10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    df_str = pd_util.dfCoerceStr(df_mixed, dtype='string[pyarrow]')
+    assert all(dtype == 'string[pyarrow]' for dtype in df_str.dtypes)
+    assert df_str.iloc[1, 2] == '12'
+    assert df_str.iloc[2, 1] is pd.NA
+
+def test_dfToArrow(df_mixed):
+    """
+    Arrow dtypes; mixed object columns fall back to Arrow strings
+    JDL 10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    df = pd_util.dfToArrow(df_mixed)
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert str(df.dtypes[1]) == 'double[pyarrow]'
+    assert str(df.dtypes[3]) == 'string[pyarrow]'
+    assert df.iloc[2, 3] == '3'
+    assert df.iloc[1, 0] is pd.NA
+    assert str(df.dtypes[5]) == 'bool[pyarrow]'
+
+def test_CoerceStrValue():
+    """
+    Convert a value to str negating Pandas float inference for integers
+    JDL 10/18/26
+    """
+    assert pd_util.CoerceStrValue(12.0) == '12'
+    assert pd_util.CoerceStrValue(12.5) == '12.5'
+    assert pd_util.CoerceStrValue(np.nan) is None
+    assert pd_util.CoerceStrValue('x') == 'x'
+
+"""
+=========================================================================
+Tests of Excel reader engine helpers
+=========================================================================
+"""
+def test_SheetDimension():
+    """
+    Read (max_row, max_col) from sheet's <dimension> tag
+    JDL 10/18/26
+    """
+    pf = os.path.join(current_dir, 'test_data', 'demo.xlsx')
+    assert pd_util.SheetDimension(pf, 'third_sheet') == (6, 5)
+    assert pd_util.SheetDimension(pf, 'raw_table') == (13, 5)
+
+def test_CalamineToOpenpyxlValue():
+    """
+    Convert calamine cell values to openpyxl's
+    JDL 10/18/26
+    """
+    assert pd_util.CalamineToOpenpyxlValue('') is None
+    assert pd_util.CalamineToOpenpyxlValue(10.0) == 10
+    assert isinstance(pd_util.CalamineToOpenpyxlValue(10.0), int)
+    assert pd_util.CalamineToOpenpyxlValue(1.5) == 1.5
+    assert pd_util.CalamineToOpenpyxlValue(datetime.date(2024, 1, 2)) == \
+        datetime.datetime(2024, 1, 2)
+
+@pytest.fixture
+def pf_formula(tmp_path):
+    """
+    xlsx with a formula cell (B2 =1+1) that has a cached value of 2 as if
+    saved by Excel (openpyxl writes formulas without cached values, so the
+    value is added to the sheet XML) and one without a cached value (C2)
+    JDL 10/18/26
+    """
+    pf_temp, pf = str(tmp_path / 'temp.xlsx'), str(tmp_path / 'formula.xlsx')
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = 'formulas'
+    ws.append(['a', 'b', 'c'])
+    ws.append([1, '=1+1', '=A2+1'])
+    wb.save(pf_temp)
+
+    with zipfile.ZipFile(pf_temp) as zf_in, zipfile.ZipFile(pf, 'w') as zf_out:
+        for item in zf_in.infolist():
+            data = zf_in.read(item.filename)
+            if item.filename == 'xl/worksheets/sheet1.xml':
+                data = re.sub(rb'<f>1\+1</f>\s*<v\s*/>', b'<f>1+1</f><v>2</v>', data)
+                assert b'<v>2</v>' in data
+            zf_out.writestr(item, data)
+    return pf
+
+@pytest.mark.parametrize('engine, IsCachedValues, row_expected', \
+    [('openpyxl', False, (1, '=1+1', '=A2+1')), ('openpyxl', True, (1, 2, None)), \
+     ('calamine', False, (1, 2, None))])
+def test_OpenRawWorkbook_formula(pf_formula, engine, IsCachedValues, row_expected):
+    """
+    openpyxl reads formula text by default and cached values (None if not
+    calculated, C2) if IsCachedValues; calamine always reads cached values
+    JDL 10/18/26
+    """
+    if engine == 'calamine': pytest.importorskip('python_calamine')
+    wb = pd_util.OpenRawWorkbook(pf_formula, engine, IsCachedValues)
+    lst_rows = list(pd_util.IterRawRows(wb, 'formulas'))
+    wb.close()
+    assert lst_rows[0] == ('a', 'b', 'c')
+    assert lst_rows[1] == row_expected
+
+"""
+=========================================================================
+Tests of compact dtype conversion (Table.OptimizeDtypes)
+=========================================================================
+"""
+def test_SerOptimizeDtype_numeric():
+    """
+    Integer values to smallest (nullable if blanks) int; exact floats to float32
+    JDL 10/18/26
+    """
+    ser = pd.Series([1.0, np.nan, 300.0])
+    assert pd_util.SerOptimizeDtype(ser, IsNullable=False).dtype == 'Int16'
+    ser = pd.Series([1, 2, 3], dtype='int64')
+    assert pd_util.SerOptimizeDtype(ser, IsNullable=False).dtype == 'int8'
+    assert pd_util.SerOptimizeDtype(ser).dtype == 'Int8'
+    assert pd_util.SerOptimizeDtype(pd.Series([0.5, 1.25])).dtype == 'float32'
+    assert pd_util.SerOptimizeDtype(pd.Series([0.1, 1.0])).dtype == 'float64'
+
+def test_SerOptimizeDtype_object():
+    """
+    numeric str values converted if IsNumeric; low-cardinality str to category
+    JDL 10/18/26
+    """
+    ser = pd.Series(['1', '2', None, '40000'])
+    ser_num = pd_util.SerOptimizeDtype(ser, IsNumeric=True)
+    assert ser_num.dtype == 'Int32'
+    assert ser_num.tolist()[:2] == [1, 2]
+
+    ser = pd.Series(['a', 'b', 'a', 'a'])
+    assert pd_util.SerOptimizeDtype(ser, IsNumeric=True).dtype == 'category'
+    assert pd_util.SerOptimizeDtype(ser, category_threshold=0.25).dtype == object
+
+def test_IntDtypeForRange():
+    """
+    Smallest int dtype name for a value range
+    JDL 10/18/26
+    """
+    assert pd_util.IntDtypeForRange(-128, 127) == 'int8'
+    assert pd_util.IntDtypeForRange(0, 128) == 'int16'
+    assert pd_util.IntDtypeForRange(0, 2**31, IsNullable=True) == 'Int64'
+
+def test_dfInferObjects():
+    """
+    Object columns/index of ints and non-blank floats are typed and restored;
+    mixed and blank-holding columns stay object
+    JDL 10/18/26
+    """
+    df = pd.DataFrame({'a': [1, 2], 'b': [1.5, None], 'c': ['x', 3], 'd': [0.5, 1.5]}, \
+                      dtype=object, index=pd.Index([1, 2], dtype=object, name='idx'))
+    df_typed, dObjects = pd_util.dfInferObjects(df)
+    assert dObjects == {'columns': [0, 3], 'index': [0]}
+    assert list(df_typed.dtypes) == ['int64', object, object, 'float64']
+    assert df_typed.index.dtype == 'int64'
+    assert df['a'].dtype == object
+
+    df_restored = pd_util.dfRestoreObjects(df_typed, dObjects)
+    pd.testing.assert_frame_equal(df_restored, df)
+
+def test_dfEncodeMixed():
+    """
+    Mixed-type cell columns become Arrow strings plus type code columns and
+    decode to the original values and types; other types raise TypeError
+    JDL 10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    dt = datetime.datetime(2026, 10, 18, 9, 30)
+    df = pd.DataFrame({'a': ['x', 2**60 + 1, 1.5, 2.0, True, dt, None], \
+                       'b': list('abcdefg'), 'c': range(7)})
+    df['a'] = df['a'].astype(object)
+    df_enc, lst_cols = pd_util.dfEncodeMixed(df)
+    assert lst_cols == [0]
+    assert list(df_enc.columns) == ['a', 'b', 'c', '__type_0']
+    assert df_enc['a'].dtype == 'string[pyarrow]'
+
+    df_dec = pd_util.dfDecodeMixed(df_enc, lst_cols)
+    pd.testing.assert_frame_equal(df_dec, df)
+    assert [type(x) for x in df_dec['a']] == [type(x) for x in df['a']]
+
+    with pytest.raises(TypeError):
+        pd_util.dfEncodeMixed(pd.DataFrame({'a': ['x', datetime.time(1)]}))
+
+def test_dfArrowStrToNumeric():
+    """
+    Arrow string columns convert to numbers only if every value round trips
+    (whole numbers as Int64); other columns unchanged
+    JDL 10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    df = pd_util.dfToArrow(pd.DataFrame({'a': ['1', None, '3'], 'b': ['1.5', '2', None], \
+        'c': ['007', '8', '9'], 'd': ['x', '1', '2'], 'e': [1, 2, 3]}))
+    df_num = pd_util.dfArrowStrToNumeric(df)
+    assert [str(dtype) for dtype in df_num.dtypes] == ['Int64', 'float64', \
+        'string[pyarrow]', 'string[pyarrow]', 'int64[pyarrow]']
+    assert df_num['a'].tolist() == [1, pd.NA, 3]
+    assert df_num['b'].tolist()[:2] == [1.5, 2.0]
@@ -0,0 +1,201 @@
+#Version 10/18/26
+#python -m pytest test_projcache.py -v -s
+import sys, os, shutil
+import pandas as pd
+import pytest
+
+# Import the classes to be tested
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' + os.sep
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+import pd_util
+from projtables import Table, RowMajorTbl
+from projcache import TableCache
+
+"""
+=========================================================================
+Tests of TableCache class and methods
+=========================================================================
+"""
+@pytest.fixture
+def pf_demo(tmp_path):
+    """
+    Copy of demo.xlsx in temporary folder (so tests can change its mtime)
+    JDL 10/18/26
+    """
+    pf = str(tmp_path / 'demo.xlsx')
+    shutil.copy(os.path.join(current_dir, 'test_data', 'demo.xlsx'), pf)
+    return pf
+
+@pytest.fixture
+def cache(tmp_path):
+    return TableCache(str(tmp_path / 'cache'))
+
+@pytest.fixture
+def dParseParams_tbl1():
+    """
+    Parsing parameters for demo.xlsx raw_table sheet
+    JDL 10/18/26
+    """
+    return {'flag_start_bound': 'flag', 'flag_end_bound': '<blank>', \
+            'icol_start_bound': 1, 'icol_end_bound': 2, \
+            'iheader_rowoffset_from_flag': 1, 'idata_rowoffset_from_flag': 2, \
+            'block_id_vars': ('stuff', -4, 2)}
+
+def new_table(pf, cache, sht='second_sheet', dParseParams=None, import_dtype=None):
+    """
+    Helper to create a Table that uses cache
+    JDL 10/18/26
+    """
+    tbl = Table(pf, 'Table2', sht, 'idx', dParseParams, import_dtype)
+    tbl.import_col_map = {'idx_raw':'idx', 'col #1':'col_1', 'col #2':'col_2'}
+    tbl.cache = cache
+    return tbl
+
+def test_TableCache_ImportExcelDf(pf_demo, cache, monkeypatch):
+    """
+    Warm import loads .df from cache without reading Excel
+    JDL 10/18/26
+    """
+    tbl = new_table(pf_demo, cache)
+    tbl.ImportExcelDf()
+    assert len(cache.ListEntries()) == 1
+    assert os.path.exists(cache.path_cache + cache.Key(tbl, 'df') + '.parquet')
+
+    monkeypatch.setattr(pd_util, 'dfExcelImport', None)
+    tbl_warm = new_table(pf_demo, cache)
+    tbl_warm.ImportExcelDf()
+    pd.testing.assert_frame_equal(tbl_warm.df, tbl.df)
+
+def test_TableCache_parsed(pf_demo, cache, dParseParams_tbl1):
+    """
+    Raw import and RowMajorTbl parse are cached as Parquet (mixed-type raw
+    columns as strings with type codes; parsed object columns of ints typed);
+    warm parse restores block_id names
+    JDL 10/18/26; Modified 10/18/26 for raw and parsed entries saved as Parquet
+    """
+    tbl = new_table(pf_demo, cache, 'raw_table', dict(dParseParams_tbl1))
+    tbl.ImportExcelRaw()
+    RowMajorTbl(tbl).ReadBlocksProcedure()
+    assert sorted(entry[0] for entry in cache.ListEntries()) == \
+        sorted([cache.Key(tbl, 'raw'), cache.Key(tbl, 'parsed')])
+    assert os.path.exists(cache.path_cache + cache.Key(tbl, 'raw') + '.parquet')
+    assert os.path.exists(cache.path_cache + cache.Key(tbl, 'parsed') + '.parquet')
+    assert cache.lst_pickled == []
+
+    tbl_warm = new_table(pf_demo, cache, 'raw_table', dict(dParseParams_tbl1))
+    tbl_warm.ImportExcelRaw()
+    row_maj = RowMajorTbl(tbl_warm)
+    assert row_maj.LoadCachedParse()
+    assert row_maj.lst_block_ids == ['stuff']
+    pd.testing.assert_frame_equal(tbl_warm.df_raw, tbl.df_raw)
+    pd.testing.assert_frame_equal(tbl_warm.df, tbl.df)
+
+def test_TableCache_Key(pf_demo, cache):
+    """
+    Key changes with file mtime and import instructions
+    JDL 10/18/26
+    """
+    tbl = new_table(pf_demo, cache)
+    key = cache.Key(tbl, 'df')
+    assert cache.Key(tbl, 'raw') != key
+
+    tbl.import_dtype = str
+    assert cache.Key(tbl, 'df') != key
+    tbl.import_dtype = None
+
+    stat = os.stat(pf_demo)
+    os.utime(pf_demo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.Key(tbl, 'df') != key
+    assert cache.Load(tbl, 'df') is None
+
+def test_TableCache_Key_hash(pf_demo, tmp_path):
+    """
+    Content hash key ignores mtime
+    JDL 10/18/26
+    """
+    cache = TableCache(str(tmp_path / 'cache'), IsHashContent=True)
+    tbl = new_table(pf_demo, cache)
+    key = cache.Key(tbl, 'df')
+    stat = os.stat(pf_demo)
+    os.utime(pf_demo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.Key(tbl, 'df') == key
+
+def test_TableCache_Evict(pf_demo, tmp_path):
+    """
+    Least recently used entries are evicted when over max_bytes
+    JDL 10/18/26
+    """
+    cache = TableCache(str(tmp_path / 'cache'), max_bytes=1)
+    tbl2 = new_table(pf_demo, cache)
+    tbl2.ImportExcelDf()
+    tbl3 = new_table(pf_demo, cache, sht='fourth_sheet')
+    tbl3.ImportExcelDf()
+
+    #Only the most recent entry is kept
+    assert [entry[0] for entry in cache.ListEntries()] == [cache.Key(tbl3, 'df')]
+
+def test_TableCache_Invalidate(pf_demo, cache):
+    """
+    Invalidate one table's entries or all entries
+    JDL 10/18/26
+    """
+    tbl2 = new_table(pf_demo, cache)
+    tbl2.ImportExcelDf()
+    tbl3 = new_table(pf_demo, cache, sht='fourth_sheet')
+    tbl3.ImportExcelDf()
+    assert len(cache.ListEntries()) == 2
+
+    cache.Invalidate(tbl2)
+    assert cache.Load(tbl2, 'df') is None
+    assert cache.Load(tbl3, 'df') is not None
+
+    cache.Invalidate()
+    assert len(cache.ListEntries()) == 0
+
+def test_TableCache_IterChunks(pf_demo, cache, monkeypatch):
+    """
+    Table.IterChunks reads a current cache entry by Parquet row batches
+    JDL 10/18/26
+    """
+    tbl = Table(pf_demo, 'Table2', 'second_sheet', 'idx')
+    tbl.cache = cache
+    tbl.ImportExcelDf()
+    assert cache.IsCurrent(tbl, 'df')
+
+    def raise_excel(*args): raise AssertionError('read Excel')
+    monkeypatch.setattr(Table, 'IterExcelChunks', raise_excel)
+    lst_chunks = list(tbl.IterChunks(chunk_rows=2))
+    assert [len(df) for df in lst_chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(lst_chunks, ignore_index=True), tbl.df)
+
+def test_TableCache_raw_chunks(pf_demo, cache):
+    """
+    Raw entry's mixed-type columns restore exact cell values when read by
+    Parquet row batches
+    JDL 10/18/26
+    """
+    tbl = new_table(pf_demo, cache, 'raw_table')
+    tbl.ImportExcelRaw()
+    dManifest, pf_data = cache.Entry(tbl, 'raw')
+    assert dManifest['fmt'] == 'parquet' and len(dManifest['mixed']) > 0
+
+    df = pd.concat(cache.IterChunks(tbl, 'raw', chunk_rows=4), ignore_index=True)
+    pd.testing.assert_frame_equal(df, tbl.df_raw)
+    assert df.map(type).equals(tbl.df_raw.map(type))
+
+def test_TableCache_pickle_reason(pf_demo, cache):
+    """
+    Pickle fallback (cell type without a Parquet encoding) is recorded in
+    the manifest and cache.lst_pickled
+    JDL 10/18/26
+    """
+    import datetime
+    tbl = new_table(pf_demo, cache)
+    df = pd.DataFrame({'a': ['x', datetime.time(12, 30)]})
+    cache.Save(tbl, 'raw', df)
+    dManifest, pf_data = cache.Entry(tbl, 'raw')
+    assert dManifest['fmt'] == 'pkl'
+    assert 'time' in dManifest['pickle_reason']
+    assert [entry[:2] for entry in cache.lst_pickled] == [('Table2', 'raw')]
+    pd.testing.assert_frame_equal(cache.Load(tbl, 'raw'), df)
@@ -0,0 +1,127 @@
+#Version 10/18/26
+#python -m pytest test_projregistry.py -v -s
+import sys, os, json
+import pytest
+
+# Import the classes to be tested
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' + os.sep
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from projtables import ProjectTables, RowMajorTbl
+from projregistry import TableRegistry
+from projfiles import Files
+
+"""
+=========================================================================
+Tests of TableRegistry class and ProjectTables built from a spec
+=========================================================================
+"""
+@pytest.fixture
+def files():
+    """
+    Instance files class to track file names/paths
+    JDL 10/18/26
+    """
+    return Files('', subdir_home='test_data', IsTest=True, subdir_tests='test_data')
+
+@pytest.fixture
+def dSpec_demo():
+    """
+    Spec for demo.xlsx tables (same as ProjectTables demo tables) plus a
+    derived table
+    JDL 10/18/26
+    """
+    dTables = {}
+    dTables['Table1'] = {'file': 'demo.xlsx', 'sht': 'raw_table', 'idx_col_name': 'idx', \
+        'import': 'raw', 'import_dtype': 'str', \
+        'dParseParams': {'flag_start_bound': 'flag', 'flag_end_bound': '<blank>', \
+            'icol_start_bound': 1, 'icol_end_bound': 2, \
+            'iheader_rowoffset_from_flag': 1, 'idata_rowoffset_from_flag': 2, \
+            'block_id_vars': ['stuff', -4, 2]}, \
+        'import_col_map': {'idx_raw':'idx', 'col #1':'col_1', 'col #2':'col_2'}, \
+        'required_cols': ['idx', 'col_1', 'col_2'], 'numeric_cols': ['idx', 'col_1']}
+    dTables['Table2'] = {'file': 'demo.xlsx', 'sht': 'second_sheet', \
+                         'idx_col_name': 'idx', 'import': 'df', 'eager': True}
+    dTables['Table3'] = {'file': 'demo.xlsx', 'sht': 'third_sheet', \
+                         'idx_col_name': 'idx', 'import': 'df'}
+    dTables['TableDerived'] = {'idx_col_name': 'idx', 'import': 'output', \
+                               'upstream': ['Table1', 'Table2']}
+    return {'tables': dTables}
+
+def test_TableRegistry_spec_files(dSpec_demo, tmp_path):
+    """
+    JSON, TOML and YAML specs are read on first access to .dSpec
+    JDL 10/18/26
+    """
+    pf_json = str(tmp_path / 'spec.json')
+    with open(pf_json, 'w') as f: json.dump(dSpec_demo, f)
+
+    pf_toml = str(tmp_path / 'spec.toml')
+    with open(pf_toml, 'w') as f:
+        f.write('[tables.Table2]\nfile = "demo.xlsx"\nsht = "second_sheet"\n')
+        f.write('idx_col_name = "idx"\nimport = "df"\n')
+
+    pf_yaml = str(tmp_path / 'spec.yaml')
+    with open(pf_yaml, 'w') as f:
+        f.write('tables:\n  Table2:\n    file: demo.xlsx\n    sht: second_sheet\n')
+        f.write('    idx_col_name: idx\n    import: df\n')
+
+    for pf in [pf_json, pf_toml, pf_yaml]:
+        registry = TableRegistry(pf)
+        assert registry._dSpec is None
+        assert registry.dTables['Table2']['sht'] == 'second_sheet'
+
+def test_TableRegistry_ListTableNames(dSpec_demo):
+    """
+    Selected tables include upstream tables (listed before dependents)
+    JDL 10/18/26
+    """
+    registry = TableRegistry(dSpec_demo)
+    assert registry.ListTableNames(['TableDerived']) == ['Table1', 'Table2', 'TableDerived']
+    assert registry.ListTableNames(['Table3']) == ['Table3']
+
+    dSpec_demo['tables']['Table1']['upstream'] = ['TableDerived']
+    with pytest.raises(ValueError):
+        registry.ListTableNames()
+
+def test_TableRegistry_ValidateSpec(dSpec_demo, tmp_path):
+    """
+    Unknown table keys raise ValueError when spec is read
+    JDL 10/18/26
+    """
+    dSpec_demo['tables']['Table3']['numeric_colz'] = ['idx']
+    pf = str(tmp_path / 'spec.json')
+    with open(pf, 'w') as f: json.dump(dSpec_demo, f)
+    with pytest.raises(ValueError):
+        TableRegistry(pf).dSpec
+
+def test_ProjectTables_registry(files, dSpec_demo):
+    """
+    Build tbls from spec; import and parse the raw table
+    JDL 10/18/26
+    """
+    tbls = ProjectTables(files, [], registry=TableRegistry(dSpec_demo))
+    assert tbls.lstImports == [tbls.Table2, tbls.Table3]
+    assert tbls.lstRawImports == [tbls.Table1]
+    assert tbls.lstOutputs == [tbls.TableDerived]
+    assert tbls.lstEagerImports == [tbls.Table2]
+    assert tbls.TableDerived.upstream == [tbls.Table1, tbls.Table2]
+    assert tbls.Table1.import_dtype == str
+    assert tbls.Table1.dParseParams['block_id_vars'] == [('stuff', -4, 2)]
+
+    tbls.ImportInputs()
+    tbls.ImportRawInputs()
+    RowMajorTbl(tbls.Table1).ReadBlocksProcedure()
+    assert list(tbls.Table1.df.columns) == ['stuff', 'col_1', 'col_2']
+    assert len(tbls.Table2.df) == 5
+
+def test_ProjectTables_registry_lst_names(files, dSpec_demo):
+    """
+    Sharded tbls builds only named tables and their upstream tables
+    JDL 10/18/26
+    """
+    tbls = ProjectTables(files, [], IsLazy=True, registry=TableRegistry(dSpec_demo), \
+                         lst_names=['Table2'])
+    assert not hasattr(tbls, 'Table1')
+    assert tbls.lstImports == [tbls.Table2]
+    assert tbls.Table2.lazy_import is None
@@ -0,0 +1,162 @@
+#Version 10/18/26
+#python -m pytest test_projscheduler.py -v -s
+import sys, os, threading
+import pandas as pd
+import pytest
+
+# Import the classes to be tested
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' + os.sep
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from projtables import ProjectTables, Table
+from projscheduler import TableScheduler
+from projfiles import Files
+
+"""
+=========================================================================
+Tests of TableScheduler class and methods
+=========================================================================
+"""
+@pytest.fixture
+def files():
+    """
+    Instance files class to track file names/paths
+    JDL 10/18/26
+    """
+    return Files('', subdir_home='test_data', IsTest=True, subdir_tests='test_data')
+
+def derive_total(tbl):
+    """
+    Example build_fn: sum upstream tables' col_1 by idx
+    JDL 10/18/26
+    """
+    lst_dfs = [tbl_up.df.set_index('idx')['col_1'] for tbl_up in tbl.upstream]
+    tbl.df = pd.concat(lst_dfs, axis=1).sum(axis=1).rename('total').to_frame()
+
+@pytest.fixture
+def tbls_graph(files):
+    """
+    demo.xlsx tables with TableTotal derived from Table2 and Table3
+    JDL 10/18/26
+    """
+    tbls = ProjectTables(files, ['demo.xlsx'])
+    tbls.Table2.sht, tbls.Table3.sht = 'second_sheet', 'third_sheet'
+    tbls.lstImports = [tbls.Table2, tbls.Table3]
+
+    tbls.TableTotal = Table('', 'TableTotal', '', 'idx')
+    tbls.TableTotal.upstream = [tbls.Table2, tbls.Table3]
+    tbls.TableTotal.build_fn = derive_total
+    tbls.lstOutputs = [tbls.TableTotal]
+    return tbls
+
+def test_TableScheduler_Run(tbls_graph):
+    """
+    Run imports and builds; second run skips unchanged nodes; stale table
+    is rebuilt
+    JDL 10/18/26
+    """
+    sched = TableScheduler(tbls_graph, workers=2)
+    dStatus = sched.Run()
+    assert dStatus == {'Table1': 'ran', 'Table2': 'ran', 'Table3': 'ran', \
+                       'TableTotal': 'ran'}
+    assert tbls_graph.TableTotal.df['total'].tolist() == [20, 40, 60, 80, 100]
+    assert list(sched.df_log['table'])[-1] == 'TableTotal'
+
+    dStatus = sched.Run()
+    assert set(dStatus.values()) == {'skipped'}
+
+    tbls_graph.TableTotal.IsStale = True
+    assert sched.Run()['TableTotal'] == 'ran'
+
+def test_TableScheduler_parallel(tbls_graph):
+    """
+    A derived table runs when its own upstream tables finish (while an
+    unrelated node is still running)
+    JDL 10/18/26
+    """
+    event = threading.Event()
+    lst_waited = []
+    tbl_slow = Table('', 'TableSlow', '', 'idx')
+    tbl_slow.build_fn = lambda tbl: lst_waited.append(event.wait(timeout=10))
+    tbl_fast = Table('', 'TableFast', '', 'idx')
+    tbl_fast.upstream = [tbls_graph.Table2]
+    tbl_fast.build_fn = lambda tbl: event.set()
+    tbls_graph.TableSlow, tbls_graph.TableFast = tbl_slow, tbl_fast
+
+    TableScheduler(tbls_graph, workers=3).Run()
+    assert lst_waited == [True]
+
+def test_TableScheduler_errors(tbls_graph):
+    """
+    Circular upstream tables and build_fn exceptions are raised
+    JDL 10/18/26
+    """
+    tbls_graph.Table2.upstream = [tbls_graph.TableTotal]
+    with pytest.raises(ValueError):
+        TableScheduler(tbls_graph).Run()
+
+    tbls_graph.Table2.upstream = []
+    def raise_error(tbl): raise KeyError('bad build')
+    tbls_graph.TableTotal.build_fn = raise_error
+    with pytest.raises(KeyError):
+        TableScheduler(tbls_graph, workers=2).Run()
+
+def test_TableScheduler_import_groups(tbls_graph, monkeypatch):
+    """
+    Ready import nodes that share a file are imported with one
+    WorkbookSession (workbook opened once for raw and structured sheets)
+    JDL 10/18/26
+    """
+    import projscheduler
+    lst_sessions = []
+    class RecordSession(projscheduler.WorkbookSession):
+        def __init__(self):
+            super().__init__()
+            lst_sessions.append(self)
+    monkeypatch.setattr(projscheduler, 'WorkbookSession', RecordSession)
+
+    sched = TableScheduler(tbls_graph, workers=3, IsProcess=False)
+    lst_groups = sched.ListReadyGroups(sched.ListNodes(), {})
+    assert [([tbl.name for tbl in lst_group], IsImport) \
+            for lst_group, IsImport in lst_groups] == [(['Table1', 'Table2', 'Table3'], True)]
+
+    dStatus = sched.Run()
+    assert len(lst_sessions) == 1
+    assert set(dStatus.values()) == {'ran'}
+    assert tbls_graph.Table1.df_raw.shape == (13, 5)
+    assert tbls_graph.TableTotal.df['total'].tolist() == [20, 40, 60, 80, 100]
+
+def test_TableScheduler_process(tbls_graph):
+    """
+    Import nodes run in a process pool (tables sent as ImportSpecs) and
+    build_fn (here a lambda, which processes can't receive) runs on a thread
+    JDL 10/18/26
+    """
+    tbls_graph.TableTotal.build_fn = lambda tbl: derive_total(tbl)
+    sched = TableScheduler(tbls_graph, workers=2)
+    assert set(sched.Run().values()) == {'ran'}
+    assert tbls_graph.Table1.df_raw.shape == (13, 5)
+    assert tbls_graph.Table2.df.shape[0] == 5
+    assert tbls_graph.TableTotal.df['total'].tolist() == [20, 40, 60, 80, 100]
+
+    #Sources were stamped so unchanged imports are skipped
+    assert sched.Run()['Table2'] == 'skipped'
+
+def test_TableScheduler_outputs(tbls_graph, tmp_path):
+    """
+    Output tables are written to path_out once built; unchanged outputs
+    are not rewritten
+    JDL 10/18/26
+    """
+    sched = TableScheduler(tbls_graph, IsProcess=False, path_out=str(tmp_path))
+    sched.Run()
+    pf = str(tmp_path / 'TableTotal.parquet')
+    assert sched.dOutputs == {'TableTotal': pf}
+    df = pd.read_parquet(pf)
+    assert df['total'].tolist() == [20, 40, 60, 80, 100]
+
+    sched.Run()
+    assert sched.dOutputs == {}
+    tbls_graph.TableTotal.IsStale = True
+    sched.Run()
+    assert list(sched.dOutputs) == ['TableTotal']
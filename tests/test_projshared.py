@@ -0,0 +1,161 @@
+#Version 10/18/26
+#python -m pytest test_projshared.py -v -s
+import sys, os
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import pytest
+
+# Import the classes to be tested
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' + os.sep
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from projtables import ProjectTables, RowMajorTbl
+from projshared import SharedTableStore
+from projfiles import Files
+
+pa = pytest.importorskip('pyarrow')
+
+"""
+=========================================================================
+Tests of SharedTableStore class and ProjectTables snapshots
+=========================================================================
+"""
+@pytest.fixture
+def files():
+    """
+    Instance files class to track file names/paths
+    JDL 10/18/26
+    """
+    return Files('', subdir_home='test_data', IsTest=True, subdir_tests='test_data')
+
+@pytest.fixture
+def tbls_demo(files):
+    """
+    ProjectTables instance for demo.xlsx with imported Table2 and Table3
+    JDL 10/18/26
+    """
+    tbls = ProjectTables(files, ['demo.xlsx'])
+    tbls.Table2.sht, tbls.Table3.sht = 'second_sheet', 'third_sheet'
+    tbls.lstImports = [tbls.Table2, tbls.Table3]
+    tbls.ImportInputs()
+    tbls.Table3.df = tbls.Table3.df.set_index('idx')
+    return tbls
+
+@pytest.fixture
+def store(tmp_path):
+    return SharedTableStore(str(tmp_path / 'store'))
+
+def SumWorker(store, name, col):
+    """
+    Worker process: attach a published table and sum one column
+    JDL 10/18/26
+    """
+    return int(store.Load(name)[col].sum())
+
+def test_SharedTableStore_Attach(files, tbls_demo, store):
+    """
+    Publish loaded tables; a new tbls attaches them without importing Excel
+    and with no Arrow buffer copies
+    JDL 10/18/26
+    """
+    dManifest = store.Publish(tbls_demo)
+    assert sorted(dManifest['tables'].keys()) == ['Table2', 'Table3']
+
+    tbls = ProjectTables(files, ['demo.xlsx'], IsLazy=True)
+    tbls.Table2.sht, tbls.Table3.sht = 'second_sheet', 'third_sheet'
+    bytes_start = pa.total_allocated_bytes()
+    assert store.Attach(tbls) == ['Table2', 'Table3']
+    assert pa.total_allocated_bytes() == bytes_start
+
+    assert tbls.Table2.lazy_import is None
+    assert tbls.Table3.df.index.name == 'idx'
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in tbls.Table3.df.dtypes)
+    for name in ['Table2', 'Table3']:
+        df_expected = getattr(tbls_demo, name).df
+        df = getattr(tbls, name).df
+        pd.testing.assert_frame_equal(df, df_expected, check_dtype=False, \
+                                      check_index_type=False)
+    assert tbls.Table2.source_stamp == tbls_demo.Table2.source_stamp
+    assert not tbls.IsRefreshNeeded(tbls.Table2)
+
+def test_SharedTableStore_workers(tbls_demo, store):
+    """
+    Worker processes load published tables from the store
+    JDL 10/18/26
+    """
+    store.Publish(tbls_demo)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        lst_sums = list(executor.map(SumWorker, [store] * 2, ['Table2', 'Table3'], \
+                                     ['col_1'] * 2))
+    assert lst_sums == [150, 150]
+
+def test_SharedTableStore_errors(store):
+    """
+    Attaching before publishing raises ValueError; Remove deletes the store
+    JDL 10/18/26
+    """
+    with pytest.raises(ValueError):
+        store.ListTableNames()
+    store.Remove()
+    assert not os.path.exists(store.path_store)
+
+@pytest.fixture
+def tbls_parsed(files):
+    """
+    ProjectTables instance with imported Table2 and parsed raw Table1 (no
+    import_dtype so .df_raw has mixed-type columns)
+    JDL 10/18/26
+    """
+    tbls = ProjectTables(files, ['demo.xlsx'])
+    tbls.Table2.sht = 'second_sheet'
+    tbls.Table1.dParseParams = {'flag_start_bound': 'flag', \
+        'flag_end_bound': '<blank>', 'icol_start_bound': 1, 'icol_end_bound': 2, \
+        'iheader_rowoffset_from_flag': 1, 'idata_rowoffset_from_flag': 2, \
+        'block_id_vars': ('stuff', -4, 2)}
+    tbls.Table3.upstream = [tbls.Table2]
+    tbls.lstOutputs = [tbls.Table3]
+    tbls.ImportInputs()
+    tbls.ImportRawInputs()
+    RowMajorTbl(tbls.Table1).ReadBlocksProcedure()
+    return tbls
+
+@pytest.mark.parametrize("IsMemoryMap", [True, False])
+def test_ProjectTables_Restore(tbls_parsed, tmp_path, IsMemoryMap):
+    """
+    Snapshot and restore tables, metadata and lists; Table1's mixed-type
+    .df_raw is saved as pickle and its parsed .df (object columns of ints)
+    as typed Arrow
+    JDL 10/18/26; Modified 10/18/26 for parsed .df saved as Arrow
+    """
+    dManifest = tbls_parsed.Snapshot(str(tmp_path))
+    assert dManifest['tables']['Table1']['df_raw']['fmt'] == 'pkl'
+    assert dManifest['tables']['Table1']['df']['fmt'] == 'arrow'
+    assert dManifest['tables']['Table1']['df']['objects'] == \
+        {'columns': [1], 'index': [0]}
+    assert dManifest['tables']['Table2']['df']['fmt'] == 'arrow'
+
+    tbls = ProjectTables.Restore(str(tmp_path), IsMemoryMap=IsMemoryMap)
+    assert tbls.lstImports == [tbls.Table2]
+    assert tbls.lstRawImports == [tbls.Table1]
+    assert tbls.Table3.upstream == [tbls.Table2]
+    assert tbls.pf_input1 == tbls_parsed.pf_input1
+    assert tbls.Table1.import_col_map == tbls_parsed.Table1.import_col_map
+    assert tbls.Table1.numeric_cols == tbls_parsed.Table1.numeric_cols
+    assert tbls.Table1.source_stamp == tbls_parsed.Table1.source_stamp
+
+    #Block ID names restored from parsing instructions
+    row_maj = RowMajorTbl(tbls.Table1)
+    row_maj.SetBlockIDNames()
+    assert row_maj.lst_block_ids == ['stuff']
+
+    pd.testing.assert_frame_equal(tbls.Table1.df_raw, tbls_parsed.Table1.df_raw)
+    pd.testing.assert_frame_equal(tbls.Table1.df, tbls_parsed.Table1.df, \
+        check_dtype=not IsMemoryMap, check_index_type=not IsMemoryMap)
+    if IsMemoryMap:
+        assert str(tbls.Table1.df['col_1'].dtype) == 'int64[pyarrow]'
+        assert tbls.Table1.df.loc[1, 'col_1'] == 10
+
+    df = tbls.Table2.df
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes) == IsMemoryMap
+    pd.testing.assert_frame_equal(df, tbls_parsed.Table2.df, \
+        check_dtype=not IsMemoryMap, check_index_type=not IsMemoryMap)
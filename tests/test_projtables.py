@@ -2,8 +2,10 @@
 #python -m pytest test_projtables.py -v -s
 #2345678901234567890123456789012345678901234567890123456789012345678901234567890
 
-import sys, os
+import sys, os, shutil, time, threading, asyncio
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import openpyxl
 import pytest
 import inspect
 
@@ -12,8 +14,9 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' + os.sep
 if not libs_dir in sys.path: sys.path.append(libs_dir)
 from projtables import ProjectTables, Table
-from projtables import RowMajorTbl
+from projtables import RowMajorTbl, WorkbookSession, StageProfiler, CheckInputs
 from projfiles import Files
+import projtables
 
 
 """
@@ -58,6 +61,247 @@ def test_ProjectTables_files(files):
     lst_path_data = files.path_data.split(os.sep)
     lst_expected_data = ['Python_ProjTables', 'tests', 'test_data', '']
     assert lst_path_data[-4:] == lst_expected_data    
+@pytest.fixture
+def tbls_demo(files):
+    """
+    ProjectTables instance for demo.xlsx with two structured tables
+    (Table2, Table3) and one raw table (Table1) in the same workbook
+    JDL 10/18/26
+    """
+    tbls = ProjectTables(files, ['demo.xlsx'])
+    tbls.Table2.sht, tbls.Table3.sht = 'second_sheet', 'third_sheet'
+    tbls.lstImports = [tbls.Table2, tbls.Table3]
+    return tbls
+
+def test_ProjectTables_GroupTablesByFile(tbls_demo):
+    """
+    Return dict of lists of tables keyed by tbl.pf
+    JDL 10/18/26
+    """
+    lst_tbls = tbls_demo.lstImports + tbls_demo.lstRawImports
+    dTblsByFile = tbls_demo.GroupTablesByFile(lst_tbls)
+    assert list(dTblsByFile.keys()) == [tbls_demo.pf_input1]
+    assert dTblsByFile[tbls_demo.pf_input1] == lst_tbls
+
+def test_ProjectTables_ImportInputs(tbls_demo):
+    """
+    Import structured tables (one workbook opened once for both sheets)
+    JDL 10/18/26
+    """
+    tbls_demo.ImportInputs()
+    for tbl in [tbls_demo.Table2, tbls_demo.Table3]:
+        assert list(tbl.df.columns) == ['idx', 'col_1', 'col_2']
+        assert len(tbl.df) == 5
+
+def test_ProjectTables_ImportRawInputs(tbls_demo):
+    """
+    Import raw table to .df_raw
+    JDL 10/18/26
+    """
+    tbls_demo.ImportRawInputs()
+    assert tbls_demo.Table1.df_raw.shape == (13, 5)
+
+def test_ProjectTables_ImportInputs_workers(tbls_demo):
+    """
+    Parallel import with process pool matches serial import
+    JDL 10/18/26
+    """
+    tbls_demo.ImportInputs(workers=2)
+    tbls_demo.ImportRawInputs(workers=2)
+    lst_parallel = [tbls_demo.Table2.df, tbls_demo.Table3.df, tbls_demo.Table1.df_raw]
+
+    tbls_demo.ImportInputs()
+    tbls_demo.ImportRawInputs()
+    lst_serial = [tbls_demo.Table2.df, tbls_demo.Table3.df, tbls_demo.Table1.df_raw]
+    for df_parallel, df_serial in zip(lst_parallel, lst_serial):
+        pd.testing.assert_frame_equal(df_parallel, df_serial)
+
+def test_ProjectTables_ImportInputs_specs(tbls_demo):
+    """
+    Process pool imports send import specs, not tables --tables with
+    unpicklable attributes (lambda build_fn) import with workers=2, also
+    async with a ProcessPoolExecutor
+    JDL 10/18/26
+    """
+    for tbl in tbls_demo.ListTables(): tbl.build_fn = lambda tbl: None
+    tbls_demo.ImportInputs(workers=2)
+    lst_serial = [tbls_demo.Table2.df, tbls_demo.Table3.df]
+    assert tbls_demo.Table2.source_stamp is not None
+
+    tbls_demo.Table2.df, tbls_demo.Table3.df = pd.DataFrame(), pd.DataFrame()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        lst_imported = asyncio.run(tbls_demo.ImportInputsAsync(workers=2, \
+                                                               executor=executor))
+    assert sorted(tbl.name for tbl in lst_imported) == ['Table2', 'Table3']
+    for df_async, df_serial in zip([tbls_demo.Table2.df, tbls_demo.Table3.df], lst_serial):
+        pd.testing.assert_frame_equal(df_async, df_serial)
+
+def test_ProjectTables_ListImportTasks(tbls_demo):
+    """
+    One task per file; a file's sheets split if fewer files than workers
+    JDL 10/18/26
+    """
+    lst_tbls = [tbls_demo.Table2, tbls_demo.Table3]
+    assert tbls_demo.ListImportTasks(lst_tbls) == [lst_tbls]
+    assert tbls_demo.ListImportTasks(lst_tbls, workers=1) == [lst_tbls]
+    assert tbls_demo.ListImportTasks(lst_tbls, workers=4) == \
+        [[tbls_demo.Table2], [tbls_demo.Table3]]
+
+def SlowImport(fn_import, delay=0.2, lst_called=None, event=None):
+    """
+    Helper: wrap ImportTablesFromFile with a blocking delay (or wait for
+    event) and record the tables it is called with
+    JDL 10/18/26
+    """
+    def wrapper(lst_tbls, IsRaw=False):
+        if lst_called is not None: lst_called.append([tbl.name for tbl in lst_tbls])
+        if event is not None: event.wait(timeout=10)
+        else: time.sleep(delay)
+        return fn_import(lst_tbls, IsRaw)
+    return wrapper
+
+def test_ProjectTables_ImportInputsAsync(tbls_demo, monkeypatch):
+    """
+    Async import matches serial import; event loop keeps running while
+    files are read in the executor; callback per finished file
+    JDL 10/18/26
+    """
+    tbls_demo.ImportInputs()
+    lst_serial = [tbls_demo.Table2.df, tbls_demo.Table3.df]
+    monkeypatch.setattr(projtables, 'ImportTablesFromFile', \
+                        SlowImport(projtables.ImportTablesFromFile))
+
+    async def run():
+        lst_ticks, lst_callbacks = [], []
+        async def ticker():
+            while True:
+                lst_ticks.append(1)
+                await asyncio.sleep(0.01)
+        task_ticker = asyncio.create_task(ticker())
+        lst_imported = await tbls_demo.ImportInputsAsync(workers=2, \
+                                                         callback=lst_callbacks.append)
+        task_ticker.cancel()
+        return lst_imported, lst_ticks, lst_callbacks
+
+    lst_imported, lst_ticks, lst_callbacks = asyncio.run(run())
+    assert sorted(tbl.name for tbl in lst_imported) == ['Table2', 'Table3']
+    assert len(lst_callbacks) == 2
+    assert len(lst_ticks) > 5
+    for df_async, df_serial in zip([tbls_demo.Table2.df, tbls_demo.Table3.df], lst_serial):
+        pd.testing.assert_frame_equal(df_async, df_serial)
+
+def test_ProjectTables_ImportRawInputsAsync(tbls_demo):
+    """
+    Async raw import optionally parses tables in the executor
+    JDL 10/18/26
+    """
+    tbls_demo.Table1.dParseParams = {'flag_start_bound': 'flag', \
+        'flag_end_bound': '<blank>', 'icol_start_bound': 1, 'icol_end_bound': 2, \
+        'iheader_rowoffset_from_flag': 1, 'idata_rowoffset_from_flag': 2}
+    lst_imported = asyncio.run(tbls_demo.ImportRawInputsAsync(IsParse=True))
+    assert lst_imported == [tbls_demo.Table1]
+    assert tbls_demo.Table1.df_raw.shape == (13, 5)
+    assert list(tbls_demo.Table1.df.columns) == ['col_1', 'col_2']
+
+def test_ProjectTables_ImportInputsAsync_cancel(tbls_demo, tmp_path, monkeypatch):
+    """
+    Cancelling the import stops files that have not started
+    JDL 10/18/26
+    """
+    tbls_demo.Table3.pf = str(tmp_path / 'demo.xlsx')
+    shutil.copy(tbls_demo.pf_input1, tbls_demo.Table3.pf)
+    lst_called, event = [], threading.Event()
+    monkeypatch.setattr(projtables, 'ImportTablesFromFile', \
+        SlowImport(projtables.ImportTablesFromFile, lst_called=lst_called, event=event))
+
+    async def run():
+        task = asyncio.create_task(tbls_demo.ImportInputsAsync(workers=1))
+        while len(lst_called) == 0: await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        finally:
+            event.set()
+        return False
+
+    assert asyncio.run(run())
+    time.sleep(0.3)
+    assert lst_called == [['Table2']]
+
+@pytest.fixture
+def tbls_lazy(files):
+    """
+    ProjectTables instance with lazy imports; Table1 has parsing instructions
+    JDL 10/18/26
+    """
+    tbls = ProjectTables(files, ['demo.xlsx'], IsLazy=True)
+    tbls.Table2.sht = 'second_sheet'
+    tbls.Table1.dParseParams = {'flag_start_bound': 'flag', \
+        'flag_end_bound': '<blank>', 'icol_start_bound': 1, 'icol_end_bound': 2, \
+        'iheader_rowoffset_from_flag': 1, 'idata_rowoffset_from_flag': 2}
+    return tbls
+
+def test_ProjectTables_lazy_df(tbls_lazy):
+    """
+    ImportInputs skips lazy tables; first access to .df imports it
+    JDL 10/18/26
+    """
+    tbls_lazy.ImportInputs()
+    assert tbls_lazy.Table2._df is None
+
+    assert list(tbls_lazy.Table2.df.columns) == ['idx', 'col_1', 'col_2']
+    assert len(tbls_lazy.Table2._df) == 5
+
+def test_ProjectTables_lazy_raw(tbls_lazy):
+    """
+    First access to a lazy raw table's .df imports .df_raw and parses it
+    JDL 10/18/26
+    """
+    tbls_lazy.ImportRawInputs()
+    assert tbls_lazy.Table1._df_raw is None
+
+    df = tbls_lazy.Table1.df
+    assert tbls_lazy.Table1.df_raw.shape == (13, 5)
+    assert df.index.name == 'idx'
+    assert list(df.columns) == ['col_1', 'col_2']
+    assert len(df) == 5
+
+def test_ProjectTables_lstEagerImports(tbls_lazy):
+    """
+    Tables in lstEagerImports are imported by ImportInputs
+    JDL 10/18/26
+    """
+    tbls_lazy.lstEagerImports = [tbls_lazy.Table2]
+    tbls_lazy.SetLazyImports()
+    assert tbls_lazy.Table2.lazy_import is None
+    assert tbls_lazy.Table1.lazy_import == 'raw'
+
+    tbls_lazy.ImportInputs()
+    assert len(tbls_lazy.Table2._df) == 5
+
+def test_WorkbookSession(Table2, Table3):
+    """
+    Session opens the shared workbook once and gives same result as
+    importing each table separately
+    JDL 10/18/26
+    """
+    with WorkbookSession() as session:
+        Table2.ImportExcelDf(session)
+        Table3.ImportExcelDf(session)
+        Table3.ImportExcelRaw(session)
+        assert len(session.dExcelFiles) == 1
+        assert len(session.dWorkbooks) == 1
+    assert len(session.dExcelFiles) == 0
+
+    df2, df3, df3_raw = Table2.df, Table3.df, Table3.df_raw
+    Table2.ImportExcelDf()
+    Table3.ImportExcelDf()
+    Table3.ImportExcelRaw()
+    pd.testing.assert_frame_equal(df2, Table2.df)
+    pd.testing.assert_frame_equal(df3, Table3.df)
+    pd.testing.assert_frame_equal(df3_raw, Table3.df_raw)
 """
 =========================================================================
 Tests of Table class and methods
@@ -187,6 +431,45 @@ def test_Table_ImportExcelDf4(Table4):
     assert list(Table4.df.columns) == ['idx', 'col_1', 'col_2']
     assert len(Table4.df) == 5
 
+@pytest.mark.parametrize('fixture_name', ['Table2', 'Table3', 'Table4'])
+def test_Table_ImportExcelDf_calamine(fixture_name, request):
+    """
+    Calamine engine matches default openpyxl import (including dropping
+    Unnamed: columns and col_last_df truncation)
+    JDL 10/18/26
+    """
+    pytest.importorskip('python_calamine')
+    tbl = request.getfixturevalue(fixture_name)
+    tbl.ImportExcelDf()
+    df_openpyxl = tbl.df
+
+    tbl.engine = 'calamine'
+    tbl.ImportExcelDf()
+    pd.testing.assert_frame_equal(tbl.df, df_openpyxl)
+
+def test_Table_ImportExcelRaw_calamine(Table3):
+    """
+    Calamine raw import matches openpyxl's including formatted blank columns
+    (and openpyxl reading formulas' cached values --no formulas in demo)
+    JDL 10/18/26; Modified 10/18/26 for IsCachedValues
+    """
+    pytest.importorskip('python_calamine')
+    Table3.ImportExcelRaw()
+    df_openpyxl = Table3.df_raw
+    assert df_openpyxl.shape == (6, 5)
+
+    Table3.IsCachedValues = True
+    with WorkbookSession() as session:
+        Table3.ImportExcelRaw(session)
+        assert list(session.dWorkbooks.keys()) == [(Table3.pf, 'openpyxl', True)]
+    pd.testing.assert_frame_equal(Table3.df_raw, df_openpyxl)
+
+    Table3.engine, Table3.IsCachedValues = 'calamine', False
+    with WorkbookSession() as session:
+        Table3.ImportExcelRaw(session)
+        assert list(session.dWorkbooks.keys()) == [(Table3.pf, 'calamine', False)]
+    pd.testing.assert_frame_equal(Table3.df_raw, df_openpyxl)
+
 def test_Table_initialization_Table2(Table2):
     """
     Test initialization of Table2 instance
@@ -197,4 +480,317 @@ def test_Table_initialization_Table2(Table2):
     assert Table2.name == 'Table2'
     assert Table2.sht == 'second_sheet'
     assert Table2.idx_col_name == 'idx'
-    assert Table2.dParseParams is None
\ No newline at end of file
+    assert Table2.dParseParams is None
+
+def test_ProjectTables_Profile(tbls_lazy):
+    """
+    tbls.Profile() records import and parse stages with shapes in/out
+    JDL 10/18/26
+    """
+    lst_callback = []
+    with tbls_lazy.Profile(callback=lst_callback.append):
+        tbls_lazy.Table1.df
+    assert StageProfiler.active is None
+
+    df = tbls_lazy.df_profile
+    assert list(df.columns) == StageProfiler.cols
+    assert len(lst_callback) == len(df)
+    lst_stages = df['stage'].tolist()
+    for stage in ['ImportExcelRaw', 'SetStartBoundIndices', 'ParseBlocksBatch', \
+                  'ExtractBlockIDsProcedure', 'StackParsedCols', 'ReadBlocksProcedure']:
+        assert stage in lst_stages
+    assert (df['table'] == 'Table1').all()
+    assert (df['seconds'] >= 0).all()
+    assert df['mem_delta_bytes'].notna().all()
+
+    #Import stage rows/cols out and parse batch rows out
+    ser_raw = df.set_index('stage').loc['ImportExcelRaw']
+    assert (ser_raw['rows_out'], ser_raw['cols_out']) == (13, 5)
+    assert df.set_index('stage').loc['ParseBlocksBatch', 'rows_out'] == 5
+    assert df.set_index('stage').loc['SetStartBoundIndices', 'rows_out'] == 1
+
+def test_ProjectTables_Profile_inactive(tbls_demo):
+    """
+    Without an active profiler nothing is recorded; IsTraceMemory=False
+    leaves memory deltas blank
+    JDL 10/18/26
+    """
+    tbls_demo.ImportInputs()
+    assert len(tbls_demo.df_profile) == 0
+
+    with tbls_demo.Profile(IsTraceMemory=False):
+        tbls_demo.ImportInputs()
+    df = tbls_demo.df_profile
+    assert df['stage'].tolist() == ['ImportExcelDf', 'ImportExcelDf']
+    assert df['table'].tolist() == ['Table2', 'Table3']
+    assert df['mem_delta_bytes'].isna().all()
+
+def test_Table_OptimizeDtypes(tbls_demo):
+    """
+    OptimizeDtypes returns bytes saved and preserves values
+    JDL 10/18/26
+    """
+    tbls_demo.ImportInputs()
+    tbl = tbls_demo.Table2
+    tbl.nonblank_cols = ['idx']
+    df_start = tbl.df.copy()
+
+    ser_saved = tbls_demo.OptimizeDtypes()
+    assert list(ser_saved.index) == ['Table2', 'Table3', 'Table1']
+    assert ser_saved['Table2'] > 0
+    assert tbl.df['idx'].dtype == 'int8'
+    pd.testing.assert_frame_equal(tbl.df, df_start, check_dtype=False, \
+                                  check_categorical=False)
+
+@pytest.fixture
+def tbls_check(tbls_demo):
+    """
+    tbls_demo with preflight column lists and a Table3 with bad values
+    JDL 10/18/26
+    """
+    tbls_demo.ImportInputs()
+    tbls_demo.lstRawImports = []
+    for tbl in [tbls_demo.Table2, tbls_demo.Table3]:
+        tbl.required_cols = ['idx', 'col_1', 'col_2']
+        tbl.numeric_cols = ['idx', 'col_1', 'col_2']
+        tbl.populated_cols = ['col_1', 'col_3']
+        tbl.nonblank_cols = ['col_1', 'col_2']
+    tbls_demo.Table3.df = pd.DataFrame({'idx': [1, 2, 3], \
+                                        'col_1': ['1', None, 'x'], \
+                                        'col_2': ['4', ' ', 5], \
+                                        'col_3': [None, None, None]})
+    return tbls_demo
+
+def test_CheckInputs_CheckTablesProcedure(tbls_check):
+    """
+    Consolidated preflight results for all tables and rules
+    JDL 10/18/26
+    """
+    ck = CheckInputs(tbls_check, IsPrint=False)
+    df = ck.CheckTablesProcedure()
+    assert list(df.columns) == CheckInputs.cols_tally + ['IsPass']
+    assert len(df) == 2 * 10
+    assert not ck.IsPass
+
+    df3 = df[df['table'] == 'Table3'].set_index(['rule', 'column'])
+    assert df3.loc[('numeric', 'col_1'), 'n_fail'] == 1
+    assert df3.loc[('numeric', 'col_2'), 'n_fail'] == 1
+    assert df3.loc[('populated', 'col_1'), 'IsPass']
+    assert not df3.loc[('populated', 'col_3'), 'IsPass']
+    assert df3.loc[('nonblank', 'col_1'), 'n_fail'] == 1
+    assert df3.loc[('nonblank', 'col_2'), 'n_fail'] == 1
+    assert df3['n_rows'].eq(3).all()
+
+    df2 = df[df['table'] == 'Table2']
+    lst_fail = df2.loc[~df2['IsPass'], ['rule', 'column']].values.tolist()
+    assert lst_fail == [['numeric', 'col_2'], ['populated', 'col_3']]
+
+def test_CheckInputs_missing_and_index(tbls_check):
+    """
+    Missing listed columns fail; named index is checked as a column
+    JDL 10/18/26
+    """
+    tbl = tbls_check.Table3
+    tbl.df = tbl.df.set_index('idx').drop(columns='col_2')
+    ck = CheckInputs(tbls_check, IsPrint=False)
+    df = ck.TallyTable(tbl)
+    df = ck.ResultsFromTallies([df, df]).set_index(['rule', 'column'])
+    assert df.loc[('required', 'col_2'), 'IsMissing']
+    assert df.loc[('nonblank', 'col_2'), 'IsMissing']
+    assert df.loc[('required', 'idx'), 'IsPass']
+    assert df.loc[('nonblank', 'col_1'), 'n_fail'] == 2
+    assert df.loc[('populated', 'col_1'), 'n_nonnull'] == 4
+    assert df.loc[('populated', 'col_1'), 'n_rows'] == 6
+
+@pytest.mark.parametrize('IsProcess', [False, True])
+def test_CheckInputs_workers(tbls_check, IsProcess):
+    """
+    Thread/process pool results match serial checks (in table order);
+    process workers get check specs (tables with lambda build_fn)
+    JDL 10/18/26; Modified 10/18/26 for check specs
+    """
+    for tbl in tbls_check.ListTables(): tbl.build_fn = lambda tbl: None
+    ck = CheckInputs(tbls_check, IsPrint=False)
+    df_serial = ck.CheckTablesProcedure()
+    df_parallel = ck.CheckTablesProcedure(workers=2, IsProcess=IsProcess)
+    pd.testing.assert_frame_equal(df_parallel, df_serial)
+    assert ck.lst_unchecked == []
+
+def test_CheckInputs_IsFailFast(tbls_check):
+    """
+    IsFailFast stops after the first table with a blocking failure
+    JDL 10/18/26
+    """
+    ck = CheckInputs(tbls_check, IsPrint=False)
+    df = ck.CheckTablesProcedure(IsFailFast=True)
+    assert ck.lst_unchecked == ['Table3']
+    assert df['table'].unique().tolist() == ['Table2']
+
+    #Table2 fails only numeric and populated rules
+    ck.lst_blocking_rules = ['required', 'nonblank']
+    df = ck.CheckTablesProcedure(IsFailFast=True)
+    assert ck.lst_unchecked == []
+    df = ck.CheckTablesProcedure(workers=2, IsFailFast=True)
+    assert not ck.IsPass
+
+def test_Table_IterChunks(tbls_demo):
+    """
+    Excel row chunks match ImportExcelDf (trailing blank rows omitted)
+    JDL 10/18/26
+    """
+    tbl = tbls_demo.Table2
+    lst_chunks = list(tbl.IterChunks(chunk_rows=2))
+    assert [len(df) for df in lst_chunks] == [2, 2, 1]
+    assert lst_chunks[1].index.tolist() == [2, 3]
+
+    tbl.ImportExcelDf()
+    pd.testing.assert_frame_equal(pd.concat(lst_chunks), tbl.df, check_dtype=False)
+
+def test_CheckInputs_chunk_rows(tbls_check):
+    """
+    Chunked checks (merged tallies) match in-memory checks
+    JDL 10/18/26
+    """
+    tbls_check.ImportInputs()
+    ck = CheckInputs(tbls_check, IsPrint=False)
+    df_memory = ck.CheckTablesProcedure()
+    df_chunks = ck.CheckTablesProcedure(chunk_rows=2, workers=2)
+    pd.testing.assert_frame_equal(df_chunks, df_memory)
+    assert df_chunks['n_rows'].eq(5).all()
+    df_process = ck.CheckTablesProcedure(chunk_rows=2, workers=2, IsProcess=True)
+    pd.testing.assert_frame_equal(df_process, df_memory)
+
+def test_CheckInputs_chunk_rows_row_major(tbls_demo):
+    """
+    Chunked checks of a row major table (demo Table1) tally its parsed rows
+    (streamed blocks if not yet parsed) and match in-memory checks
+    JDL 10/18/26
+    """
+    tbls_demo.Table1.dParseParams = {'flag_start_bound': 'flag', \
+        'flag_end_bound': '<blank>', 'icol_start_bound': 1, 'icol_end_bound': 2, \
+        'iheader_rowoffset_from_flag': 1, 'idata_rowoffset_from_flag': 2}
+    tbls_demo.ImportRawInputs()
+    tbls_demo.Table1.ParseRaw()
+    ck = CheckInputs(tbls_demo, IsPrint=False)
+    df_memory = ck.CheckTablesProcedure([tbls_demo.Table1])
+    assert ck.IsPass
+
+    #Parsed .df sliced into chunks
+    df_parsed = ck.CheckTablesProcedure([tbls_demo.Table1], chunk_rows=2)
+    pd.testing.assert_frame_equal(df_parsed, df_memory)
+
+    #Not yet parsed: stream parsed blocks from the sheet
+    tbls_demo.Table1.df = pd.DataFrame()
+    df_stream = ck.CheckTablesProcedure([tbls_demo.Table1], chunk_rows=2)
+    pd.testing.assert_frame_equal(df_stream, df_memory)
+    assert df_stream['n_rows'].eq(5).all()
+    assert not df_stream['IsMissing'].any()
+    assert len(tbls_demo.Table1.df) == 0
+
+@pytest.fixture
+def tbls_refresh(tbls_demo, tmp_path):
+    """
+    tbls_demo with tables pointed to an openpyxl-saved copy of demo.xlsx
+    (so that later saves only change edited sheets' XML parts)
+    JDL 10/18/26
+    """
+    pf = str(tmp_path / 'demo.xlsx')
+    openpyxl.load_workbook(tbls_demo.pf_input1).save(pf)
+    for tbl in [tbls_demo.Table1, tbls_demo.Table2, tbls_demo.Table3]: tbl.pf = pf
+    tbls_demo.Table1.dParseParams = {'flag_start_bound': 'flag', \
+        'flag_end_bound': '<blank>', 'icol_start_bound': 1, 'icol_end_bound': 2, \
+        'iheader_rowoffset_from_flag': 1, 'idata_rowoffset_from_flag': 2}
+    return tbls_demo
+
+def test_ProjectTables_Refresh(tbls_refresh):
+    """
+    Refresh re-imports only tables whose sheet changed and marks dependents
+    stale
+    JDL 10/18/26
+    """
+    tbls = tbls_refresh
+    tbls.ImportInputs()
+    tbls.ImportRawInputs()
+    RowMajorTbl(tbls.Table1).ReadBlocksProcedure()
+    tbl_derived = Table('', 'Derived', '', 'idx')
+    tbl_derived.upstream = [tbls.Table2]
+    tbls.TableDerived = tbl_derived
+    dNone = {'imported': [], 'reset': [], 'missing': []}
+    assert tbls.Refresh() == dNone
+
+    #Touched file with unchanged sheets is not re-imported
+    os.utime(tbls.Table2.pf, ns=(0, 10**18))
+    assert tbls.Refresh() == dNone
+
+    #Edit a value in Table2's sheet
+    wb = openpyxl.load_workbook(tbls.Table2.pf)
+    wb['second_sheet']['B2'] = 99
+    wb.save(tbls.Table2.pf)
+    assert tbls.Refresh() == dict(dNone, imported=['Table2'])
+    assert tbls.Table2.df.loc[0, 'col_1'] == 99
+    assert tbl_derived.IsStale
+    assert len(tbls.Table1.df) == 5
+
+def test_ProjectTables_Refresh_lazy(tbls_refresh):
+    """
+    Changed lazy tables are reported as reset (not re-imported) and import
+    on next access
+    JDL 10/18/26
+    """
+    tbls = tbls_refresh
+    tbls.Table2.SetLazy('df')
+    tbls.ImportInputs()
+    tbls.ImportRawInputs()
+    assert tbls.Table2.df.loc[0, 'col_1'] == 10
+
+    wb = openpyxl.load_workbook(tbls.Table2.pf)
+    wb['second_sheet']['B2'] = 99
+    wb.save(tbls.Table2.pf)
+    assert tbls.Refresh() == {'imported': [], 'reset': ['Table2'], \
+                              'missing': []}
+    assert tbls.Table2._df is None
+    assert tbls.Table2.df.loc[0, 'col_1'] == 99
+
+def test_ProjectTables_Refresh_missing(tbls_refresh, tmp_path):
+    """
+    Tables whose source file is missing are reported and keep their data;
+    other changed tables are still re-imported
+    JDL 10/18/26
+    """
+    tbls = tbls_refresh
+    tbls.Table3.pf = str(tmp_path / 'demo_copy.xlsx')
+    shutil.copy(tbls.Table2.pf, tbls.Table3.pf)
+    tbls.ImportInputs()
+    tbls.ImportRawInputs()
+
+    os.remove(tbls.Table3.pf)
+    wb = openpyxl.load_workbook(tbls.Table2.pf)
+    wb['second_sheet']['B2'] = 99
+    wb.save(tbls.Table2.pf)
+    assert tbls.Refresh() == {'imported': ['Table2'], 'reset': [], \
+                              'missing': ['Table3']}
+    assert tbls.Table2.df.loc[0, 'col_1'] == 99
+    assert len(tbls.Table3.df) == 5
+
+@pytest.mark.parametrize('fmt', ['parquet', 'feather', 'csv.gz', 'xlsx'])
+def test_ProjectTables_ExportOutputs(tbls_demo, tmp_path, fmt):
+    """
+    Write output tables in each format (parallel) and read them back
+    JDL 10/18/26
+    """
+    tbls_demo.ImportInputs()
+    tbls_demo.Table2.ResetDefaultIndex()
+    tbls_demo.lstOutputs = [tbls_demo.Table2, tbls_demo.Table3]
+    pf_excel = str(tmp_path / 'outputs.xlsx')
+    dPfs = tbls_demo.ExportOutputs(str(tmp_path / 'out'), fmt, workers=2, \
+                                   pf_excel=pf_excel)
+    assert sorted(os.listdir(tmp_path / 'out')) == \
+        sorted(os.path.basename(pf) for pf in dPfs.values())
+
+    dReaders = {'parquet': pd.read_parquet, 'feather': pd.read_feather, \
+                'csv.gz': pd.read_csv, 'xlsx': pd.read_excel}
+    df = dReaders[fmt](dPfs['Table2'])
+    if fmt != 'parquet': df = df.set_index('idx')
+    pd.testing.assert_frame_equal(df, tbls_demo.Table2.df)
+    pd.testing.assert_frame_equal(dReaders[fmt](dPfs['Table3']), tbls_demo.Table3.df)
+    assert pd.ExcelFile(pf_excel).sheet_names == ['Table2', 'Table3']